@@ -1,54 +1,101 @@
+import os
+
 from fastapi import FastAPI
 
+from common.protocols.event import EventGroup
 from container import Container
+from core import snowflake
+from core.fastapi import metrics, monitoring
 from core.fastapi.error import init_error_handler
+from core.fastapi.event.handler import EventHandlerValidator
 from core.fastapi.event.middleware import EventHandlerMiddleware
+from core.metrics import instrument_engines
 from core.fastapi.responses import ORJSONResponse
 from core.fastapi.routes import add_routes
+from core.sqlalchemy import version_aggregates
 from sqlalchemy.orm import clear_mappers
 
 from modules.author.usecase.addBookToAuthor import event_handler as book_domain_event_impl
+from modules.author.usecase.addBookToAuthors import event_handler as books_domain_event_impl
+from modules.author.usecase.removeBooksFromAuthors import event_handler as deleted_books_domain_event_impl
 from modules.author.infrastructure.persistence import mapper as author_persistence_mapper
 from modules.author.infrastructure.query import mapper as author_query_mapper
 from modules.author.usecase import router as author_router
+from modules.author.usecase.listAuthors import api as list_authors_api
+from modules.author.usecase.findAuthor import api as find_author_api
+from modules.author.usecase.findAuthorBooks import api as find_author_books_api
 from modules.author.usecase.newAuthor import api as new_author_api
 
 from modules.book.infrastructure.persistence import mapper as book_persistence_mapper
 from modules.book.infrastructure.query import mapper as book_query_mapper
+from modules.book.infrastructure.query import event_handler as book_query_event_impl
 from modules.book.usecase import router as book_router
 from modules.book.usecase.newBook import api as new_book_api
+from modules.book.usecase.newBooks import api as new_books_api
 from modules.book.usecase.addAuthor import api as add_author_api
+from modules.book.usecase.addAuthors import api as add_authors_api
 from modules.book.usecase.deleteBook import api as delete_book_api
-from modules.book.usecase.findBookByTitle import api as find_book_api
+from modules.book.usecase.deleteBooks import api as delete_books_api
+from modules.book.usecase.listBooks import api as list_books_api
+from modules.book.usecase.searchBooks import api as search_books_api
+# After /books/search, which would otherwise be taken for a book id
+from modules.book.usecase.findBook import api as find_book_api
 
 app = FastAPI(default_response_class=ORJSONResponse)
-add_routes([author_router, book_router], app)
+add_routes([author_router, book_router, monitoring.router, metrics.router], app)
 
 # Insert Container (IoC)
 container = Container()
-container.wire(modules=[new_author_api, new_book_api, add_author_api, delete_book_api, find_book_api])
+container.config.from_yaml(os.path.join(os.path.dirname(__file__), 'config.yml'), required=True)
+container.wire(modules=[list_authors_api, new_author_api, new_book_api, new_books_api, add_author_api,
+                        add_authors_api, delete_book_api, delete_books_api, list_books_api, search_books_api,
+                        find_book_api, find_author_api, find_author_books_api])
 
 app.container = container
+
+# Event handler signatures are checked once, a broken handler fails here instead of in a request
+EventHandlerValidator.register(EventGroup, book_domain_event_impl.AddBookToAuthorEventHandler,
+                               books_domain_event_impl.AddBookToAuthorsEventHandler,
+                               deleted_books_domain_event_impl.RemoveBooksFromAuthorsEventHandler,
+                               book_query_event_impl.BookCacheInvalidationEventHandler,
+                               book_query_event_impl.BookSearchIndexEventHandler,
+                               book_query_event_impl.BookViewProjectionEventHandler,
+                               book_query_event_impl.BookViewAuthorsEventHandler)
 db = container.db()
 
 app.add_middleware(EventHandlerMiddleware)
+app.add_middleware(metrics.MetricsMiddleware, n_plus_one_threshold=container.config.metrics.n_plus_one_threshold())
 init_error_handler(app, 'contact@neonkid.xyz')
 
 
 @app.on_event("startup")
 async def on_startup():
-    await db.connect(echo=True)
+    # In the worker process, so every worker claims its own worker id
+    snowflake.install(container.snowflake_allocator())
+    instrument_engines()
+    await db.connect(**container.db_options())
     await db.create_database()
+    await container.db_replicas().connect()
 
     author_persistence_mapper.start_mapper()
     author_query_mapper.start_mapper()
 
     book_persistence_mapper.start_mapper()
     book_query_mapper.start_mapper()
+    # Session wide before_flush listener, bumps the version of every changed Book and Author
+    version_aggregates()
+
+    await container.book_search_index().build(db.engine)
+    await container.book_view_projection().backfill()
+    container.outbox_dispatcher().start()
+    container.book_query_cache_channel().start()
 
 
 @app.on_event("shutdown")
 async def on_shutdown():
+    await container.book_query_cache_channel().stop()
+    await container.outbox_dispatcher().stop()
     clear_mappers()
 
+    await container.db_replicas().disconnect()
     await db.disconnect()
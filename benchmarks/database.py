@@ -0,0 +1,49 @@
+import os
+
+from fastapi import FastAPI
+from pymfdata.rdb.connection import AsyncSQLAlchemy
+
+from core.sqlalchemy import version_aggregates
+
+from modules.author.infrastructure.persistence import mapper as author_persistence_mapper
+from modules.author.infrastructure.query import mapper as author_query_mapper
+from modules.book.infrastructure.persistence import mapper as book_persistence_mapper
+from modules.book.infrastructure.query import mapper as book_query_mapper
+
+# Any SQLAlchemy async URI, the default is a throwaway SQLite file (requires aiosqlite)
+DB_URI = os.getenv('BENCHMARK_DB_URI', 'sqlite+aiosqlite:///benchmark.db')
+
+
+def _drop_sqlite_file(uri: str):
+    if uri.startswith('sqlite') and os.path.exists(uri.split('///')[-1]):
+        os.remove(uri.split('///')[-1])
+
+
+async def connect(uri: str = DB_URI) -> AsyncSQLAlchemy:
+    _drop_sqlite_file(uri)
+
+    db = AsyncSQLAlchemy(db_uri=uri)
+    await db.connect()
+    await db.create_database()
+
+    author_persistence_mapper.start_mapper()
+    author_query_mapper.start_mapper()
+    book_persistence_mapper.start_mapper()
+    book_query_mapper.start_mapper()
+    version_aggregates()
+
+    return db
+
+
+# Boots app.py against the benchmark database, call app.router.shutdown() when done
+async def start_app(uri: str = DB_URI) -> FastAPI:
+    _drop_sqlite_file(uri)
+
+    os.environ['DB_URI'] = uri
+    os.environ['DB_ECHO'] = 'false'
+    os.environ.setdefault('SNOWFLAKE_DATA_CENTER_ID', '1')
+
+    import app as app_module
+    await app_module.app.router.startup()
+
+    return app_module.app
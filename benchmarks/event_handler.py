@@ -0,0 +1,68 @@
+"""
+Micro-benchmark of event_handler.store with the cached validator against per-call introspection.
+
+    python -m benchmarks.event_handler [rounds]
+"""
+import asyncio
+import inspect
+import sys
+import time
+
+from pydantic import BaseModel
+
+from common.protocols.event import BaseEvent
+from core.fastapi.event import handler as event_module
+from core.fastapi.event.handler import EventHandlerValidator, event_handler
+
+
+class BenchmarkDomainEvent(BaseModel):
+    value: int
+
+
+class BenchmarkEventHandler(BaseEvent):
+    async def handle(self, param: BenchmarkDomainEvent = None) -> None:
+        ...
+
+
+# Validation as it was before the registry, every call inspects the handler signature
+class UncachedValidator(EventHandlerValidator):
+    def validate(self, event, param=None):
+        if not issubclass(event, BaseEvent):
+            raise TypeError
+
+        if param and not isinstance(param, BaseModel):
+            raise TypeError
+
+        func_parameters = inspect.signature(event.handle).parameters
+        if len(func_parameters) != self.EVENT_PARAMETER_COUNT:
+            raise TypeError
+
+        if func_parameters.get("param").default is not None and not param:
+            raise TypeError
+
+
+async def measure(rounds: int) -> float:
+    event, param = BenchmarkEventHandler(), BenchmarkDomainEvent(value=1)
+    with event_handler():
+        started = time.perf_counter()
+        for _ in range(rounds):
+            await event_handler.store(event=event, param=param)
+        return (time.perf_counter() - started) / rounds
+
+
+async def main(rounds: int) -> None:
+    cached = event_module._validator
+    EventHandlerValidator.register(BenchmarkEventHandler)
+
+    event_module._validator = UncachedValidator()
+    before = await measure(rounds)
+    event_module._validator = cached
+    after = await measure(rounds)
+
+    print('event_handler.store, {} rounds'.format(rounds))
+    print('{:<12}{:>12.2f} us'.format('uncached', before * 1e6))
+    print('{:<12}{:>12.2f} us'.format('registry', after * 1e6))
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000))
@@ -0,0 +1,213 @@
+"""
+Latency percentiles and throughput of every route, driven with an async HTTP client.
+
+    python -m benchmarks.load [--requests 1000] [--concurrency 10] [--only NAME ...]
+                              [--url http://host:port] [--save run.json] [--baseline run.json] [--tolerance 0.2]
+
+Without --url app.py is booted in-process against BENCHMARK_DB_URI (a throwaway SQLite file by
+default), so the run needs no network. With --url an already running server is driven instead.
+--baseline compares p95 latency and throughput with a saved run and exits with 1 on a regression.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import sys
+import time
+
+import httpx
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from benchmarks.database import start_app
+
+BOOK_TITLES = ['Domain Driven Design', 'Implementing Domain Driven Design', 'Designing Data Intensive Applications',
+               'Patterns of Enterprise Application Architecture', 'Clean Architecture']
+
+
+class Fixture:
+    """Creates the rows a scenario needs up front, isbns start at a random offset to survive reruns."""
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self.client = client
+        self._isbns = itertools.count(random.randrange(10 ** 9))
+
+    def book(self) -> Dict:
+        n = next(self._isbns)
+        return dict(title='{} {}'.format(BOOK_TITLES[n % len(BOOK_TITLES)], n), isbn='%010d' % (n % 10 ** 10),
+                    pages=300, price=30000, publication_year=2022)
+
+    @staticmethod
+    def author() -> Dict:
+        return dict(first_name='Benchmark', last_name='Author', age=40, biography='Benchmark author')
+
+    async def new_authors(self, n: int) -> List[int]:
+        return [self._ok(await self.client.post('/authors', json=self.author())) for _ in range(n)]
+
+    async def new_books(self, n: int) -> List[int]:
+        ids: List[int] = []
+        for start in range(0, n, 1000):
+            response = await self.client.post('/books:batch', json=[self.book() for _ in range(min(1000, n - start))])
+            ids += [item['id'] for item in self._ok(response)]
+        return ids
+
+    @staticmethod
+    def _ok(response: httpx.Response):
+        assert response.is_success, '{} {}'.format(response.status_code, response.text)
+        return response.json()
+
+
+Request = Callable[[int], Awaitable[httpx.Response]]
+
+
+# Every scenario prepares its rows and returns the request to send for the i-th iteration
+async def new_author(fixture: Fixture, requests: int) -> Request:
+    return lambda i: fixture.client.post('/authors', json=fixture.author())
+
+
+async def new_book(fixture: Fixture, requests: int) -> Request:
+    return lambda i: fixture.client.post('/books', json=fixture.book())
+
+
+async def new_books(fixture: Fixture, requests: int) -> Request:
+    return lambda i: fixture.client.post('/books:batch', json=[fixture.book() for _ in range(100)])
+
+
+async def add_author(fixture: Fixture, requests: int) -> Request:
+    books, authors = await fixture.new_books(requests), await fixture.new_authors(10)
+    return lambda i: fixture.client.post('/books/{}/authors/{}'.format(books[i], authors[i % len(authors)]))
+
+
+async def add_authors(fixture: Fixture, requests: int) -> Request:
+    books, authors = await fixture.new_books(requests), await fixture.new_authors(10)
+    return lambda i: fixture.client.post('/books/{}/authors'.format(books[i]), json={'author_ids': authors})
+
+
+async def delete_book(fixture: Fixture, requests: int) -> Request:
+    books = await fixture.new_books(requests)
+    return lambda i: fixture.client.delete('/books/{}'.format(books[i]))
+
+
+async def delete_books(fixture: Fixture, requests: int) -> Request:
+    books = await fixture.new_books(requests * 10)
+    return lambda i: fixture.client.delete('/books', params=[('ids', _id) for _id in books[i * 10:i * 10 + 10]])
+
+
+async def find_book_by_title(fixture: Fixture, requests: int) -> Request:
+    titles = [book['title'] for book in (fixture.book() for _ in range(100))]
+    for title in titles:
+        await fixture.client.post('/books', json={**fixture.book(), 'title': title})
+    return lambda i: fixture.client.get('/books', params={'title': titles[i % len(titles)]})
+
+
+async def find_books_by_ids(fixture: Fixture, requests: int) -> Request:
+    books = await fixture.new_books(1000)
+    return lambda i: fixture.client.get('/books', params=[('ids', _id) for _id in random.sample(books, 20)])
+
+
+async def list_books(fixture: Fixture, requests: int) -> Request:
+    await fixture.new_books(1000)
+    return lambda i: fixture.client.get('/books', params={'limit': 50})
+
+
+async def search_books(fixture: Fixture, requests: int) -> Request:
+    await fixture.new_books(1000)
+    return lambda i: fixture.client.get('/books/search', params={'q': ['domain', 'design', 'clean arch'][i % 3]})
+
+
+async def list_authors(fixture: Fixture, requests: int) -> Request:
+    await fixture.new_authors(100)
+    return lambda i: fixture.client.get('/authors', params={'limit': 50})
+
+
+SCENARIOS = {scenario.__name__: scenario for scenario in (
+    new_author, new_book, new_books, add_author, add_authors, delete_book, delete_books, find_book_by_title,
+    find_books_by_ids, list_books, search_books, list_authors
+)}
+
+
+def percentile(latencies: List[float], p: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+
+async def run(request: Request, requests: int, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    iterations = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for i in iterations:
+            started = time.perf_counter()
+            response = await request(i)
+            latencies.append(time.perf_counter() - started)
+            errors += not response.is_success
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return dict(requests=requests, errors=errors, throughput=requests / elapsed, p50=percentile(latencies, 0.50),
+                p95=percentile(latencies, 0.95), p99=percentile(latencies, 0.99))
+
+
+# Names of the scenarios whose p95 or throughput got worse than the baseline by more than tolerance
+def regressions(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    return [name for name, result in results.items() if name in baseline and (
+        result['p95'] > baseline[name]['p95'] * (1 + tolerance) or
+        result['throughput'] < baseline[name]['throughput'] / (1 + tolerance)
+    )]
+
+
+async def main(args: argparse.Namespace) -> int:
+    app = None
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=60)
+    else:
+        app = await start_app()
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://benchmark', timeout=60)
+
+    results: Dict[str, Dict] = {}
+    async with client:
+        fixture = Fixture(client)
+        print('{} requests per route, concurrency {}'.format(args.requests, args.concurrency))
+        print('{:<20}{:>10}{:>8}{:>10}{:>10}{:>10}'.format('route', 'req/s', 'errors', 'p50 ms', 'p95 ms', 'p99 ms'))
+        for name in args.only or SCENARIOS:
+            request = await SCENARIOS[name](fixture, args.requests)
+            results[name] = result = await run(request, args.requests, args.concurrency)
+            print('{:<20}{:>10.0f}{:>8}{:>10.2f}{:>10.2f}{:>10.2f}'.format(
+                name, result['throughput'], result['errors'], result['p50'] * 1000, result['p95'] * 1000,
+                result['p99'] * 1000))
+
+    if app is not None:
+        await app.router.shutdown()
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    failed: List[str] = [name for name, result in results.items() if result['errors']]
+    if args.baseline:
+        with open(args.baseline) as f:
+            failed += regressions(results, json.load(f), args.tolerance)
+
+    if failed:
+        print('failed: {}'.format(', '.join(sorted(set(failed)))))
+    return 1 if failed else 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.load', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=1000, help='requests per route')
+    parser.add_argument('--concurrency', type=int, default=10, help='requests in flight')
+    parser.add_argument('--only', nargs='+', choices=list(SCENARIOS), help='routes to run, all by default')
+    parser.add_argument('--url', help='drive a running server instead of booting app.py in-process')
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='JSON file of an earlier run to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed regression against the baseline')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,84 @@
+"""
+Rows fetched and latency of BookAlchemyRepository.fetch_by_title per loading strategy.
+
+    python -m benchmarks.loading_strategy [books] [authors_per_book] [rounds]
+"""
+import asyncio
+import sys
+import time
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.database import connect
+from core.sqlalchemy import LoadStrategy
+from modules.book.infrastructure.query.repository.impl import BookAlchemyRepository
+from persistence.book.entity import BookEntity, BookAuthorEntity
+
+TITLE = 'Benchmark'
+
+
+async def seed(engine, books: int, authors: int) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(insert(BookEntity.__table__), [
+            dict(id=i, title=TITLE, isbn='%010d' % i, pages=100, price=10000, publication_year=2022)
+            for i in range(1, books + 1)
+        ])
+        await conn.execute(insert(BookAuthorEntity.__table__), [
+            dict(book_id=i, author_id=j) for i in range(1, books + 1) for j in range(1, authors + 1)
+        ])
+
+
+# Re-runs the captured statements, cells (rows x columns) approximate the transferred payload
+async def count_rows(engine, statements):
+    rows = cells = 0
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(statement, parameters)
+            fetched = result.fetchall()
+            rows += len(fetched)
+            cells += len(fetched) * len(result.keys())
+    return rows, cells
+
+
+async def measure(engine, strategy: LoadStrategy, rounds: int):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    async def fetch():
+        async with AsyncSession(engine) as session:
+            return await BookAlchemyRepository(session, {'fetch_by_title': strategy}).fetch_by_title(TITLE)
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', capture)
+    books = await fetch()
+    event.remove(engine.sync_engine, 'before_cursor_execute', capture)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await fetch()
+    elapsed = (time.perf_counter() - started) / rounds
+
+    rows, cells = await count_rows(engine, statements)
+    return len(books), len(statements), rows, cells, elapsed
+
+
+async def main(books: int, authors: int, rounds: int) -> None:
+    db = await connect()
+    await seed(db.engine, books, authors)
+
+    print('{} books x {} authors, {} rounds'.format(books, authors, rounds))
+    print('{:<10}{:>8}{:>12}{:>14}{:>10}{:>14}'.format('strategy', 'books', 'statements', 'rows fetched', 'cells',
+                                                      'latency ms'))
+    for strategy in LoadStrategy:
+        loaded, statements, rows, cells, elapsed = await measure(db.engine, strategy, rounds)
+        print('{:<10}{:>8}{:>12}{:>14}{:>10}{:>14.2f}'.format(strategy.value, loaded, statements, rows, cells,
+                                                              elapsed * 1000))
+
+    await db.disconnect()
+
+
+if __name__ == '__main__':
+    args = list(map(int, sys.argv[1:])) + [1000, 10, 20][len(sys.argv) - 1:]
+    asyncio.run(main(*args[:3]))
@@ -0,0 +1,87 @@
+"""
+Micro-benchmarks of the hot paths below the routes, no database needed.
+
+    python -m benchmarks.micro [rounds]
+"""
+import asyncio
+import sys
+import time
+
+from pydantic import BaseModel
+from typing import Awaitable, Callable, Dict, List
+
+from common.protocols.event import BaseEvent
+from core.fastapi.event.handler import EventHandlerValidator, event_handler
+from core.fastapi.responses import ORJSONResponse
+from core.snowflake import SnowflakeAllocator
+from modules.author.domain.aggregate.model import Author
+from modules.author.domain.value_objects import Name
+from modules.author.infrastructure.persistence.mapper import AuthorMapper
+from modules.book.domain.aggregate.model import Book
+from modules.book.infrastructure.persistence.mapper import BookMapper
+
+
+class BenchmarkDomainEvent(BaseModel):
+    value: int
+
+
+class BenchmarkEventHandler(BaseEvent):
+    async def handle(self, param: BenchmarkDomainEvent = None) -> None:
+        ...
+
+
+def measure(func: Callable[[], object], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - started) / rounds
+
+
+async def measure_async(func: Callable[[], Awaitable[object]], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await func()
+    return (time.perf_counter() - started) / rounds
+
+
+async def main(rounds: int) -> None:
+    allocator = SnowflakeAllocator(worker_id=1, data_center_id=1)
+    book = Book(id=allocator.next_id(), title='Domain Driven Design', isbn='0123456789', pages=560, price=50000,
+                publication_year=2003)
+    author = Author(id=allocator.next_id(), name=Name(first_name='Eric', last_name='Evans'), age=60,
+                    biography='Author of Domain Driven Design')
+    book_entity = BookMapper.map_to_persistence_entity(book)
+    author_entity = AuthorMapper.map_to_persistence_entity(author)
+
+    rows: List[Dict] = [dict(id=allocator.next_id(), title='Domain Driven Design', isbn='0123456789', pages=560,
+                             authors=[allocator.next_id(), allocator.next_id()]) for _ in range(1000)]
+
+    results = {
+        'snowflake.next_id': measure(allocator.next_id, rounds),
+        'snowflake.next_ids(1000)': measure(lambda: allocator.next_ids(1000), max(rounds // 1000, 10)),
+        'BookMapper to entity': measure(lambda: BookMapper.map_to_persistence_entity(book), rounds),
+        'BookMapper to domain': measure(lambda: BookMapper.map_to_domain_entity(book_entity), rounds),
+        'AuthorMapper to entity': measure(lambda: AuthorMapper.map_to_persistence_entity(author), rounds),
+        'AuthorMapper to domain': measure(lambda: AuthorMapper.map_to_domain_entity(author_entity), rounds),
+        'ORJSONResponse(1000 rows)': measure(lambda: ORJSONResponse(rows), max(rounds // 1000, 10)),
+    }
+
+    EventHandlerValidator.register(BenchmarkEventHandler)
+    event, param = BenchmarkEventHandler(), BenchmarkDomainEvent(value=1)
+    with event_handler():
+        results['event_handler.store'] = await measure_async(lambda: event_handler.store(event=event, param=param),
+                                                             rounds)
+
+        async def store_and_publish():
+            await event_handler.store(event=event, param=param)
+            await event_handler.publish()
+
+        results['event_handler.publish'] = await measure_async(store_and_publish, rounds)
+
+    print('{} rounds'.format(rounds))
+    for name, elapsed in results.items():
+        print('{:<28}{:>12.2f} us'.format(name, elapsed * 1e6))
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000))
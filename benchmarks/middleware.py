@@ -0,0 +1,62 @@
+"""
+Throughput of GET /books?title= with the pure ASGI EventHandlerMiddleware against BaseHTTPMiddleware.
+
+    python -m benchmarks.middleware [requests] [concurrency]
+"""
+import asyncio
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
+
+from benchmarks.database import start_app
+from core.fastapi.event.handler import event_handler
+from core.fastapi.event.middleware import EventHandlerMiddleware
+
+
+# The middleware as it was before, kept here for comparison
+class BaseHTTPEventHandlerMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        with event_handler():
+            return await call_next(request)
+
+
+def use_middleware(app: FastAPI, cls) -> None:
+    app.user_middleware = [Middleware(cls) if m.cls in (EventHandlerMiddleware, BaseHTTPEventHandlerMiddleware)
+                           else m for m in app.user_middleware]
+    app.middleware_stack = app.build_middleware_stack()
+
+
+async def measure(client: httpx.AsyncClient, requests: int, concurrency: int) -> float:
+    async def worker(n: int):
+        for _ in range(n):
+            response = await client.get('/books', params={'title': 'Benchmark'})
+            assert response.status_code == 200
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+    return (requests // concurrency * concurrency) / (time.perf_counter() - started)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    app = await start_app()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://benchmark') as client:
+        await client.post('/books', json=dict(title='Benchmark', isbn='0123456789', pages=100, price=10000,
+                                              publication_year=2022))
+
+        print('GET /books?title=, {} requests, concurrency {}'.format(requests, concurrency))
+        for name, cls in (('BaseHTTPMiddleware', BaseHTTPEventHandlerMiddleware), ('ASGI', EventHandlerMiddleware)):
+            use_middleware(app, cls)
+            await measure(client, concurrency * 10, concurrency)
+            print('{:<20}{:>10.0f} req/s'.format(name, await measure(client, requests, concurrency)))
+
+    await app.router.shutdown()
+
+
+if __name__ == '__main__':
+    args = list(map(int, sys.argv[1:])) + [5000, 10][len(sys.argv) - 1:]
+    asyncio.run(main(*args[:2]))
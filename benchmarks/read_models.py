@@ -0,0 +1,60 @@
+"""
+Memory held and load time of one page of books, as mapped BookDTOs and as BookRecord tuples.
+
+    python -m benchmarks.read_models [books] [authors_per_book]
+"""
+import asyncio
+import gc
+import sys
+import time
+import tracemalloc
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Tuple
+
+from benchmarks.database import connect
+from benchmarks.loading_strategy import seed
+from modules.book.infrastructure.query.repository.impl import BookAlchemyRepository
+from modules.book.infrastructure.query.repository.record import BookRecordRepository
+
+
+async def load(engine, repository_class, books: int) -> Optional[Tuple[int, int]]:
+    async with AsyncSession(engine) as session:
+        page = await repository_class(session).fetch_page(None, books)
+        assert len(page) == books
+
+        # Memory still referenced by the loaded page, the session keeps DTOs in its identity map
+        return tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else None
+
+
+# Timed without tracing, tracemalloc slows allocations down several times
+async def measure(engine, repository_class, books: int):
+    started = time.perf_counter()
+    await load(engine, repository_class, books)
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    held, peak = await load(engine, repository_class, books)
+    tracemalloc.stop()
+    return held, peak, elapsed
+
+
+async def main(books: int, authors: int) -> None:
+    db = await connect()
+    await seed(db.engine, books, authors)
+
+    print('{} books x {} authors, per 100k rows'.format(books, authors))
+    print('{:<10}{:>12}{:>12}{:>12}'.format('model', 'held MB', 'peak MB', 'load s'))
+    for name, repository_class in (('BookDTO', BookAlchemyRepository), ('BookRecord', BookRecordRepository)):
+        held, peak, elapsed = await measure(db.engine, repository_class, books)
+        scale = 100000 / books
+        print('{:<10}{:>12.1f}{:>12.1f}{:>12.2f}'.format(name, held * scale / 2 ** 20, peak * scale / 2 ** 20,
+                                                         elapsed * scale))
+
+    await db.disconnect()
+
+
+if __name__ == '__main__':
+    args = list(map(int, sys.argv[1:])) + [100000, 2][len(sys.argv) - 1:]
+    asyncio.run(main(*args[:2]))
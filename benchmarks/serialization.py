@@ -0,0 +1,62 @@
+"""
+Rendering time of a list response of BookDTOs, through jsonable_encoder and straight to orjson.
+
+    python -m benchmarks.serialization [books] [authors_per_book] [rounds]
+"""
+import asyncio
+import sys
+import time
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.database import connect
+from benchmarks.loading_strategy import TITLE, seed
+from core.fastapi.responses import ORJSONResponse
+from modules.book.infrastructure.query.repository.impl import BookAlchemyRepository
+
+
+# BookDTO.to_dict as it was before, authors went through the association proxy
+def proxy_to_dict(book):
+    return dict(id=book.id, title=book.title, isbn=book.isbn, pages=book.pages, version=book.version,
+                updated_at=book.updated_at, authors=list(book.authors))
+
+
+def measure(render, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        render()
+    return (time.perf_counter() - started) / rounds
+
+
+async def main(books: int, authors: int, rounds: int) -> None:
+    db = await connect()
+    await seed(db.engine, books, authors)
+
+    async with AsyncSession(db.engine) as session:
+        dtos = await BookAlchemyRepository(session).fetch_by_title(TITLE)
+
+        paths = {
+            # What a route returning dicts paid: FastAPI runs jsonable_encoder before the response renders
+            'jsonable_encoder': lambda: ORJSONResponse(jsonable_encoder([proxy_to_dict(book) for book in dtos])),
+            'orjson, proxy': lambda: ORJSONResponse([proxy_to_dict(book) for book in dtos]),
+            'orjson, to_dict': lambda: ORJSONResponse([book.to_dict() for book in dtos]),
+            'orjson, default': lambda: ORJSONResponse(dtos)
+        }
+
+        expected = paths['jsonable_encoder']().body
+        print('{} books x {} authors, {} rounds'.format(len(dtos), authors, rounds))
+        print('{:<20}{:>12}{:>10}'.format('path', 'ms', 'speedup'))
+        baseline = None
+        for name, render in paths.items():
+            assert render().body == expected, name
+            elapsed = measure(render, rounds)
+            baseline = baseline or elapsed
+            print('{:<20}{:>12.2f}{:>9.1f}x'.format(name, elapsed * 1000, baseline / elapsed))
+
+    await db.disconnect()
+
+
+if __name__ == '__main__':
+    args = list(map(int, sys.argv[1:])) + [10000, 3, 20][len(sys.argv) - 1:]
+    asyncio.run(main(*args[:3]))
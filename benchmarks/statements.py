@@ -0,0 +1,94 @@
+"""
+CPU time per query of the hot repository queries, with the select built on every call and cached.
+
+    python -m benchmarks.statements [rounds]
+
+Built is the select constructed per call as the repositories used to, cached is the repository method,
+which reuses one statement with bind parameters. Both run the same SQL, the difference is Python time spent
+building the statement and computing its cache key.
+"""
+import asyncio
+import sys
+import time
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Awaitable, Callable
+
+from benchmarks.database import connect
+from benchmarks.loading_strategy import seed
+from core.sqlalchemy import any_of, load_option
+from modules.book.infrastructure.query.dto import BookDTO
+from modules.book.infrastructure.query.repository.impl import BookAlchemyRepository
+from modules.book.infrastructure.query.repository.record import BookRecordRepository
+from persistence.book.entity import BookEntity
+
+IDS = list(range(1, 21))
+SINGLE_TITLE = 'Single'
+
+
+async def cpu_time(func: Callable[[], Awaitable[object]], rounds: int) -> float:
+    for _ in range(min(rounds, 100)):
+        await func()
+
+    started = time.process_time()
+    for _ in range(rounds):
+        await func()
+    return (time.process_time() - started) / rounds
+
+
+async def main(rounds: int) -> None:
+    db = await connect()
+    await seed(db.engine, 1000, 2)
+    t = BookEntity.__table__
+    async with db.engine.begin() as conn:
+        await conn.execute(update(t).where(t.c.id == 1).values(title=SINGLE_TITLE))
+
+    async with AsyncSession(db.engine) as session:
+        orm = BookAlchemyRepository(session)
+        core = BookRecordRepository(session)
+        dialect = session.bind.dialect.name
+
+        def orm_select(method: str):
+            return select(BookDTO).options(load_option(orm.strategies[method], BookDTO.book_authors))
+
+        async def orm_built(stmt):
+            return (await session.execute(stmt)).unique().scalars().fetchall()
+
+        async def core_built(stmt):
+            return await core._records((await session.execute(stmt)).all())
+
+        queries = {
+            'BookDTO fetch_by_id': (
+                lambda: orm_built(orm_select('fetch_by_id').where(BookDTO.id == 1)),
+                lambda: orm.fetch_by_id(1)),
+            'BookDTO fetch_by_title': (
+                lambda: orm_built(orm_select('fetch_by_title').where(BookDTO.title == SINGLE_TITLE)
+                                  .order_by(BookDTO.id)),
+                lambda: orm.fetch_by_title(SINGLE_TITLE)),
+            'BookDTO fetch_by_ids(20)': (
+                lambda: orm_built(orm_select('fetch_by_ids').where(any_of(BookDTO.id, IDS, dialect))),
+                lambda: orm.fetch_by_ids(IDS)),
+            'BookDTO fetch_page(50)': (
+                lambda: orm_built(orm_select('fetch_page').order_by(BookDTO.id).limit(50)),
+                lambda: orm.fetch_page(None, 50)),
+            'BookRecord fetch_by_ids(20)': (
+                lambda: core_built(core._select().where(any_of(t.c.id, IDS, dialect))),
+                lambda: core.fetch_by_ids(IDS)),
+            'BookRecord fetch_page(50)': (
+                lambda: core_built(core._select().order_by(t.c.id).limit(50)),
+                lambda: core.fetch_page(None, 50)),
+        }
+
+        print('{} rounds, CPU time per query'.format(rounds))
+        print('{:<30}{:>12}{:>12}{:>12}'.format('query', 'built us', 'cached us', 'saved'))
+        for name, (built, cached) in queries.items():
+            built_time, cached_time = await cpu_time(built, rounds), await cpu_time(cached, rounds)
+            print('{:<30}{:>12.1f}{:>12.1f}{:>11.0f}%'.format(name, built_time * 1e6, cached_time * 1e6,
+                                                              (1 - cached_time / built_time) * 100))
+
+    await db.disconnect()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,119 @@
+"""
+CPU time and memory of creating a book, and what each value object costs with and without validation.
+
+    python -m benchmarks.value_objects [rounds]
+
+new_book is the domain side of POST /books: the command validated at the API boundary, the Book and its
+BooksChangedDomainEvent. It is timed as it runs now (trusted) and as it ran while every step validated again
+(validated: the command through dict(), a validated event). POST /books is the whole request against the benchmark
+database. Memory is the tracemalloc peak above the baseline, per call.
+"""
+import asyncio
+import sys
+import time
+import tracemalloc
+
+import httpx
+from pydantic.dataclasses import set_validation
+from typing import Awaitable, Callable, Dict
+
+from benchmarks.database import start_app
+from modules.author.domain.value_objects import AuthorBook, Name
+from modules.book.domain.aggregate.id import BookId
+from modules.book.domain.aggregate.model import Book
+from modules.book.domain.event import BooksChangedDomainEvent
+from modules.book.domain.value_objects import BookAuthor
+from modules.book.usecase.newBook.command import NewBookCommand
+
+PAYLOAD = dict(title='Domain Driven Design', isbn='0123456789', pages=560, price=50000, publication_year=2003)
+
+
+def new_book() -> Book:
+    book = Book.new_book(NewBookCommand(**PAYLOAD))
+    BooksChangedDomainEvent.construct(book_ids=[book.id], titles=[book.title])
+    return book
+
+
+# The same path before value objects and events built from validated data were trusted
+def new_book_validated() -> Book:
+    book = Book(id=BookId.next_id(), **NewBookCommand(**PAYLOAD).dict())
+    BooksChangedDomainEvent(book_ids=[book.id], titles=[book.title])
+    return book
+
+
+def cpu_time(func: Callable[[], object], rounds: int) -> float:
+    started = time.process_time()
+    for _ in range(rounds):
+        func()
+    return (time.process_time() - started) / rounds
+
+
+def peak_memory(func: Callable[[], object], rounds: int) -> float:
+    peaks = 0
+    tracemalloc.start()
+    for _ in range(rounds):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        func()
+        peaks += tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return peaks / rounds
+
+
+async def request_cost(request: Callable[[], Awaitable[httpx.Response]], rounds: int) -> Dict[str, float]:
+    started = time.process_time()
+    for _ in range(rounds):
+        await request()
+    cpu = (time.process_time() - started) / rounds
+
+    peaks = 0
+    tracemalloc.start()
+    for _ in range(rounds):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        await request()
+        peaks += tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return dict(cpu=cpu, memory=peaks / rounds)
+
+
+async def main(rounds: int) -> None:
+    app = await start_app()
+
+    value_objects = {
+        'BookAuthor': (BookAuthor, dict(book_id=2, author_id=3)),
+        'AuthorBook': (AuthorBook, dict(author_id=2, book_id=3)),
+        'Name': (Name, dict(first_name='Eric', last_name='Evans')),
+    }
+
+    print('{} rounds'.format(rounds))
+    print('{:<28}{:>14}{:>14}'.format('value object', 'validated us', 'trusted us'))
+    for name, (cls, values) in value_objects.items():
+        with set_validation(cls, True):
+            validated = cpu_time(lambda: cls(**values), rounds)
+        with set_validation(cls, False):
+            trusted = cpu_time(lambda: cls(**values), rounds)
+        print('{:<28}{:>14.2f}{:>14.2f}'.format(name, validated * 1e6, trusted * 1e6))
+
+    event = dict(book_ids=[1], titles=['Domain Driven Design'])
+    print('{:<28}{:>14.2f}{:>14.2f}'.format('BooksChangedDomainEvent',
+                                            cpu_time(lambda: BooksChangedDomainEvent(**event), rounds) * 1e6,
+                                            cpu_time(lambda: BooksChangedDomainEvent.construct(**event), rounds) * 1e6))
+
+    print('{:<28}{:>14}{:>14}'.format('', 'CPU us', 'peak KB'))
+    for name, func in (('new_book (validated)', new_book_validated), ('new_book (trusted)', new_book)):
+        print('{:<28}{:>14.2f}{:>14.2f}'.format(name, cpu_time(func, rounds) * 1e6, peak_memory(func, rounds) / 1024))
+
+    isbns = iter(range(10 ** 9))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://benchmark') as client:
+        async def post_book():
+            return await client.post('/books', json={**PAYLOAD, 'isbn': '%010d' % next(isbns)})
+
+        cost = await request_cost(post_book, max(rounds // 100, 100))
+        print('{:<28}{:>14.2f}{:>14.2f}'.format('POST /books', cost['cpu'] * 1e6, cost['memory'] / 1024))
+
+    await app.router.shutdown()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000))
@@ -0,0 +1,253 @@
+"""
+Catalog import and export over PostgreSQL COPY, for syncs too large for the HTTP API.
+
+    python catalog.py import {author,book,book_author} FILE [--format csv|ndjson] [--batch-size 10000]
+    python catalog.py export {author,book,book_author} FILE [--format csv|ndjson]
+    python catalog.py rebuild book_view [--batch-size 1000]
+
+The format follows the file extension (.ndjson and .jsonl are NDJSON) unless --format is given. Files are read
+and written as a stream, memory depends on --batch-size and not on the file size.
+
+Columns are those of the tables. Rows are validated like the API does; an id column is optional and missing IDs
+are allocated in blocks. A book row may list its authors (space separated in csv, an array in NDJSON) and a
+book_author row links an existing book and author; every link is written to book_author and author_book. An
+import is one transaction, a failure leaves nothing behind. Import authors before the books that list them.
+
+Imports merge, so a sync can run again: existing authors and books are updated by id (books by ISBN first,
+a row without an id takes the id of the book with its ISBN), only changed rows get a new version, and links
+that exist are skipped.
+
+COPY bypasses the domain events, so after an import the book_view rows of the books it inserted or changed are
+refreshed (the IDs are kept in memory until then). rebuild writes every row again from the catalog tables on any
+database.
+"""
+import argparse
+import asyncio
+import csv
+import itertools
+import os
+import sys
+import time
+
+import asyncpg
+import orjson
+from loguru import logger
+from pydantic import ValidationError, parse_obj_as
+from typing import Callable, Collection, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from container import Container
+from core import snowflake
+from core.sqlalchemy import driver_connection
+from modules.author.domain.aggregate.id import AuthorId
+from modules.author.usecase.newAuthor.api import NewAuthorRequest
+from modules.book.domain.aggregate.id import BookId
+from modules.book.domain.value_objects import BookAuthor
+from modules.book.usecase.newBook.command import NewBookCommand
+from persistence.catalog import FORMATS, CatalogCopy
+
+REBUILD_BATCH_SIZE = 1000
+
+# id, column values without the id, author IDs of a book
+Row = Tuple[Optional[int], tuple, List[int]]
+
+
+class Progress:
+    def __init__(self, name: str, unit: str, interval: float = 5.0) -> None:
+        self.name = name
+        self.unit = unit
+        self.interval = interval
+        self.count = 0
+
+        self._started = self._reported = time.perf_counter()
+
+    def add(self, n: int) -> None:
+        self.count += n
+        if time.perf_counter() - self._reported >= self.interval:
+            self._reported = time.perf_counter()
+            self.report()
+
+    def report(self) -> None:
+        elapsed = time.perf_counter() - self._started
+        logger.info("{}: {:,} {} in {:.1f}s, {:,.0f} {}/s".format(self.name, self.count, self.unit, elapsed,
+                                                                   self.count / max(elapsed, 1e-9), self.unit))
+
+
+def read_rows(path: str, fmt: str) -> Iterator[Dict]:
+    if fmt == 'csv':
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                yield {key: value if value != '' else None for key, value in row.items()}
+    else:
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
+
+
+def _id(id_type, value) -> Optional[int]:
+    return parse_obj_as(id_type, value) if value is not None else None
+
+
+def parse_author(row: Dict) -> Row:
+    author = NewAuthorRequest(**row)
+    return _id(AuthorId, row.get('id')), (author.first_name, author.last_name, author.age, author.biography), []
+
+
+def parse_book(row: Dict) -> Row:
+    book = NewBookCommand(**row)
+    authors = row.get('authors') or []
+    if isinstance(authors, str):
+        authors = authors.split()
+
+    return _id(BookId, row.get('id')), (book.title, book.isbn, book.pages, book.price, book.publication_year), \
+        parse_obj_as(List[AuthorId], authors)
+
+
+def parse_link(row: Dict) -> Tuple[int, int]:
+    link = parse_obj_as(BookAuthor, row)
+    return link.book_id, link.author_id
+
+
+def batches(rows: Iterable[Dict], size: int) -> Iterator[List[Tuple[int, Dict]]]:
+    numbered = enumerate(rows, 1)
+    while True:
+        batch = list(itertools.islice(numbered, size))
+        if not batch:
+            return
+        yield batch
+
+
+def parse(func: Callable, number: int, row: Dict):
+    try:
+        return func(row)
+    except (ValidationError, TypeError, ValueError) as ex:
+        raise ValueError("row {}: {}".format(number, ex))
+
+
+async def import_rows(copy: CatalogCopy, kind: str, rows: Iterable[Dict], batch_size: int,
+                      progress: Progress) -> None:
+    for batch in batches(rows, batch_size):
+        if kind == 'book_author':
+            await copy.copy_links([parse(parse_link, number, row) for number, row in batch])
+            progress.add(len(batch))
+            continue
+
+        parsed: List[Row] = [parse(parse_author if kind == 'author' else parse_book, number, row)
+                             for number, row in batch]
+        next_ids = AuthorId.next_ids if kind == 'author' else BookId.next_ids
+        allocated = iter(next_ids(sum(1 for pk, _, _ in parsed if pk is None)))
+
+        records, links = [], []
+        for pk, values, authors in parsed:
+            pk = pk if pk is not None else next(allocated)
+            records.append((pk,) + values)
+            links += [(pk, author_id) for author_id in authors]
+
+        if kind == 'author':
+            await copy.copy_authors(records)
+        else:
+            moved = await copy.copy_books(records)
+            await copy.copy_links([(moved.get(book_id, book_id), author_id) for book_id, author_id in links])
+        progress.add(len(batch))
+
+
+# The rows of the books an import changed, and of those listing an author it changed
+async def refresh(container: Container, book_ids: Collection[int], author_ids: Collection[int]) -> None:
+    projection = container.book_view_projection()
+    for ids, unit, func in ((sorted(book_ids), 'books', projection.refresh),
+                            (sorted(author_ids), 'authors', projection.refresh_authors)):
+        if not ids:
+            continue
+
+        progress = Progress('refresh book_view', unit)
+        for start in range(0, len(ids), projection.batch_size):
+            batch = ids[start:start + projection.batch_size]
+            await func(batch)
+            progress.add(len(batch))
+        progress.report()
+
+
+async def rebuild(container: Container, batch_size: int) -> None:
+    projection = container.book_view_projection()
+    projection.batch_size = batch_size
+
+    progress = Progress('rebuild book_view', 'books')
+    await projection.rebuild(progress.add)
+    progress.report()
+
+
+async def copy_command(container: Container, args: argparse.Namespace) -> None:
+    db = container.db()
+    fmt = args.format or ('ndjson' if args.file.endswith(('.ndjson', '.jsonl')) else 'csv')
+
+    # A connection of the engine's pool, COPY runs on the asyncpg connection under it in a transaction of its own
+    # (a failed import leaves nothing behind)
+    async with db.engine.connect() as conn:
+        connection = await driver_connection(conn)
+        copy = CatalogCopy(connection)
+
+        if args.command == 'import':
+            progress = Progress('import {}'.format(args.table), 'rows')
+            async with connection.transaction():
+                await import_rows(copy, args.table, read_rows(args.file, fmt), args.batch_size, progress)
+            progress.report()
+        else:
+            progress = Progress('export {}'.format(args.table), 'bytes')
+            with open(args.file, 'wb') as f:
+                async def write(data: bytes) -> None:
+                    f.write(data)
+                    progress.add(len(data))
+
+                rows = await copy.export(args.table, fmt, write)
+            progress.report()
+            logger.info("export {}: {:,} rows".format(args.table, rows))
+
+    if args.command == 'import':
+        await refresh(container, copy.book_ids, copy.author_ids)
+        # The books changed outside the API, every running server drops its query cache
+        await container.book_query_cache_channel().publish()
+
+
+async def main(args: argparse.Namespace) -> int:
+    container = Container()
+    container.config.from_yaml(os.path.join(os.path.dirname(__file__), 'config.yml'), required=True)
+    snowflake.install(container.snowflake_allocator())
+
+    db = container.db()
+    await db.connect(**container.db_options())
+    if args.command != 'rebuild' and db.engine.dialect.name != 'postgresql':
+        logger.error("COPY needs PostgreSQL, the database is {}".format(db.engine.dialect.name))
+        await db.disconnect()
+        return 1
+
+    try:
+        await db.create_database()
+        if args.command == 'rebuild':
+            await rebuild(container, args.batch_size)
+        else:
+            await copy_command(container, args)
+    except (ValueError, asyncpg.PostgresError) as ex:
+        logger.error("{} {}: {}".format(args.command, args.table, ex))
+        return 1
+    finally:
+        await db.disconnect()
+
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = commands.add_parser('import', help='COPY a file into a catalog table')
+    export_parser = commands.add_parser('export', help='COPY a catalog table into a file')
+    for command in (import_parser, export_parser):
+        command.add_argument('table', choices=['author', 'book', 'book_author'])
+        command.add_argument('file')
+        command.add_argument('--format', choices=FORMATS, default=None)
+    import_parser.add_argument('--batch-size', type=int, default=10000, help='rows per COPY')
+
+    rebuild_parser = commands.add_parser('rebuild', help='write a projection again from the catalog tables')
+    rebuild_parser.add_argument('table', choices=['book_view'])
+    rebuild_parser.add_argument('--batch-size', type=int, default=REBUILD_BATCH_SIZE, help='books per transaction')
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -7,3 +7,13 @@ class BaseEvent(ABC):
     @abstractmethod
     async def handle(self, param: Union[Type[BaseModel], None] = None) -> None:
         ...
+
+
+# Runs several handlers of the same event in order
+class EventGroup(BaseEvent):
+    def __init__(self, *events: BaseEvent) -> None:
+        self.events = events
+
+    async def handle(self, param: Union[Type[BaseModel], None] = None) -> None:
+        for event in self.events:
+            await event.handle(param)
@@ -1,47 +1,155 @@
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Callable, Configuration, Dict, Factory, Singleton
 from pymfdata.rdb.connection import AsyncSQLAlchemy
 
+from common.protocols.event import EventGroup
+from core.cache import AggregateCache, LRUCache
+from core.fastapi.caching import HttpCache
+from core.invalidation import CacheInvalidationChannel
+from core.replica import ReplicaRouter
+from core.snowflake import SnowflakeAllocator, claim_worker_id
+from core.sqlalchemy import engine_options
+from persistence.outbox.dispatcher import OutboxDispatcher
+
 from modules.author.infrastructure.persistence.adapter import AuthorPersistenceAdapter
 from modules.author.infrastructure.persistence.uow import AuthorPersistenceUnitOfWork
 from modules.author.infrastructure.query.uow import AuthorQueryUnitOfWork
 from modules.book.infrastructure.persistence.adapter import BookPersistenceAdapter
 from modules.book.infrastructure.persistence.uow import BookPersistenceUnitOfWork
+from modules.book.infrastructure.query.event_handler import (BookCacheInvalidationEventHandler,
+                                                             BookSearchIndexEventHandler,
+                                                             BookViewAuthorsEventHandler,
+                                                             BookViewProjectionEventHandler)
+from modules.book.infrastructure.query.projection import BookViewProjection
+from modules.book.infrastructure.query.search import BookSearchIndex
 from modules.book.infrastructure.query.uow import BookQueryUnitOfWork
 
 from modules.author.usecase.addBookToAuthor.event_handler import AddBookToAuthorEventHandler
 from modules.author.usecase.addBookToAuthor.impl import AddBookToAuthorUseCase
+from modules.author.usecase.addBookToAuthors.event_handler import AddBookToAuthorsEventHandler
+from modules.author.usecase.addBookToAuthors.impl import AddBookToAuthorsUseCase
+from modules.author.usecase.removeBooksFromAuthors.event_handler import RemoveBooksFromAuthorsEventHandler
+from modules.author.usecase.removeBooksFromAuthors.impl import RemoveBooksFromAuthorsUseCase
+from modules.author.usecase.findAuthor.impl import FindAuthorUseCase
+from modules.author.usecase.findAuthorBooks.impl import FindAuthorBooksUseCase
+from modules.author.usecase.findAuthorsByIds.impl import FindAuthorsByIdsUseCase
+from modules.author.usecase.listAuthors.impl import ListAuthorsUseCase
 from modules.author.usecase.newAuthor.impl import NewAuthorUseCase
 
 from modules.book.usecase.addAuthor.impl import AddAuthorUseCase
+from modules.book.usecase.addAuthors.impl import AddAuthorsUseCase
 from modules.book.usecase.deleteBook.impl import DeleteBookUseCase
+from modules.book.usecase.deleteBooks.impl import DeleteBooksUseCase
+from modules.book.usecase.findBook.impl import FindBookUseCase
 from modules.book.usecase.findBookByTitle.impl import FindBookByTitleUseCase
+from modules.book.usecase.findBooksByIds.impl import FindBooksByIdsUseCase
+from modules.book.usecase.listBooks.impl import ListBooksUseCase
 from modules.book.usecase.newBook.impl import NewBookUseCase
+from modules.book.usecase.newBooks.impl import NewBooksUseCase
+from modules.book.usecase.searchBooks.impl import SearchBooksUseCase
 
 
 class Container(DeclarativeContainer):
-    db = Singleton(AsyncSQLAlchemy, db_uri='{engine}://{username}:{password}@{host}:{port}/{db_name}'.format(
-        engine='postgresql+asyncpg', username='postgres', password='postgres',
-        host='127.0.0.1', port=5432, db_name='ddd_book'))
+    # Loaded from config.yml in app.py
+    config = Configuration()
+
+    db = Singleton(AsyncSQLAlchemy, db_uri=config.db.uri)
+    db_options = Callable(engine_options, uri=config.db.uri, echo=config.db.echo, pool_size=config.db.pool_size,
+                          max_overflow=config.db.max_overflow, pool_timeout=config.db.pool_timeout,
+                          pool_recycle=config.db.pool_recycle, pool_pre_ping=config.db.pool_pre_ping,
+                          statement_cache_size=config.db.statement_cache_size)
+    db_replicas = Singleton(ReplicaRouter, primary=db, uris=config.db.replicas.uris, options=db_options,
+                            strategy=config.db.replicas.strategy, read_your_writes=config.db.replicas.read_your_writes,
+                            health_check_interval=config.db.replicas.health_check_interval)
+
+    # ID allocation, fails on a missing data center id. The worker id is claimed per process when first provided
+    snowflake_worker_id = Singleton(claim_worker_id, data_center_id=config.snowflake.data_center_id,
+                                    base=config.snowflake.worker_id, lock_dir=config.snowflake.lock_dir)
+    snowflake_allocator = Singleton(SnowflakeAllocator, worker_id=snowflake_worker_id,
+                                    data_center_id=config.snowflake.data_center_id, epoch=config.snowflake.epoch)
+
+    # Query Cache
+    book_query_cache = Singleton(LRUCache, maxsize=config.query_cache.maxsize, ttl=config.query_cache.ttl)
+    book_query_cache_channel = Singleton(CacheInvalidationChannel, engine=db.provided.engine, cache=book_query_cache,
+                                         channel='book_query_cache')
+    book_search_index = Singleton(BookSearchIndex)
+
+    # Projection (book_view, the read model of GET /books/{id})
+    book_view_projection = Singleton(BookViewProjection, engine=db.provided.engine)
+
+    # Conditional GET and Cache-Control of query endpoints
+    http_cache = Singleton(HttpCache, max_age=config.http_cache.max_age, s_maxage=config.http_cache.s_maxage)
+
+    # Aggregate Cache (persistence side find_by_pk)
+    author_aggregate_cache = Singleton(AggregateCache, maxsize=config.aggregate_cache.maxsize,
+                                       ttl=config.aggregate_cache.ttl, enabled=config.aggregate_cache.enabled)
+    book_aggregate_cache = Singleton(AggregateCache, maxsize=config.aggregate_cache.maxsize,
+                                     ttl=config.aggregate_cache.ttl, enabled=config.aggregate_cache.enabled)
 
     # Unit Of Work
-    author_persistence_unit_of_work = Factory(AuthorPersistenceUnitOfWork, engine=db.provided.engine)
-    author_query_unit_of_work = Factory(AuthorQueryUnitOfWork, engine=db.provided.engine)
+    author_persistence_unit_of_work = Factory(AuthorPersistenceUnitOfWork, engine=db.provided.engine,
+                                              cache=author_aggregate_cache)
+    author_query_unit_of_work = Factory(AuthorQueryUnitOfWork, engine=db.provided.engine, router=db_replicas,
+                                        records=config.query.records)
 
-    book_persistence_unit_of_work = Factory(BookPersistenceUnitOfWork, engine=db.provided.engine)
-    book_query_unit_of_work = Factory(BookQueryUnitOfWork, engine=db.provided.engine)
+    book_persistence_unit_of_work = Factory(BookPersistenceUnitOfWork, engine=db.provided.engine,
+                                            cache=book_aggregate_cache)
+    book_query_unit_of_work = Factory(BookQueryUnitOfWork, engine=db.provided.engine, router=db_replicas,
+                                      cache=book_query_cache, search_index=book_search_index,
+                                      records=config.query.records, validate_hits=config.query_cache.validate_hits)
+
+    # Event Handler
+    book_cache_invalidation_event_handler = Factory(BookCacheInvalidationEventHandler, cache=book_query_cache,
+                                                    channel=book_query_cache_channel)
+    book_search_index_event_handler = Factory(BookSearchIndexEventHandler, index=book_search_index,
+                                              engine=db.provided.engine)
+    book_view_projection_event_handler = Factory(BookViewProjectionEventHandler, projection=book_view_projection)
+    book_view_authors_event_handler = Factory(BookViewAuthorsEventHandler, projection=book_view_projection)
+    books_changed_event_handler = Factory(EventGroup, book_cache_invalidation_event_handler,
+                                          book_search_index_event_handler)
 
     # Adapter (If you use traditional mapper)
     author_persistence_adapter = Factory(AuthorPersistenceAdapter, uow=author_persistence_unit_of_work)
-    book_persistence_adapter = Factory(BookPersistenceAdapter, uow=book_persistence_unit_of_work)
+    book_persistence_adapter = Factory(BookPersistenceAdapter, uow=book_persistence_unit_of_work,
+                                       event=books_changed_event_handler)
 
     # Use Case
     add_book_to_author_use_case = Factory(AddBookToAuthorUseCase, uow=author_persistence_unit_of_work)
     add_book_to_author_event_handler = Factory(AddBookToAuthorEventHandler, uc=add_book_to_author_use_case)
+    add_book_to_authors_use_case = Factory(AddBookToAuthorsUseCase, uow=author_persistence_unit_of_work)
+    add_book_to_authors_event_handler = Factory(AddBookToAuthorsEventHandler, uc=add_book_to_authors_use_case)
+    remove_books_from_authors_use_case = Factory(RemoveBooksFromAuthorsUseCase, uow=author_persistence_unit_of_work)
+    remove_books_from_authors_event_handler = Factory(RemoveBooksFromAuthorsEventHandler,
+                                                      uc=remove_books_from_authors_use_case)
     add_author_use_case = Factory(AddAuthorUseCase, uow=book_persistence_unit_of_work,
-                                  event=add_book_to_author_event_handler)
+                                  event=books_changed_event_handler)
+    add_authors_use_case = Factory(AddAuthorsUseCase, uow=book_persistence_unit_of_work,
+                                   event=books_changed_event_handler)
 
+    list_authors_use_case = Factory(ListAuthorsUseCase, uow=author_query_unit_of_work)
+    find_author_use_case = Factory(FindAuthorUseCase, uow=author_query_unit_of_work)
+    find_author_books_use_case = Factory(FindAuthorBooksUseCase, uow=author_query_unit_of_work)
+    find_authors_by_ids_use_case = Factory(FindAuthorsByIdsUseCase, uow=author_query_unit_of_work)
     new_author_use_case = Factory(NewAuthorUseCase, uow=author_persistence_unit_of_work)
-    delete_book_use_case = Factory(DeleteBookUseCase, uow=book_persistence_unit_of_work)
+    delete_book_use_case = Factory(DeleteBookUseCase, uow=book_persistence_unit_of_work,
+                                   event=books_changed_event_handler)
+    delete_books_use_case = Factory(DeleteBooksUseCase, uow=book_persistence_unit_of_work,
+                                    event=books_changed_event_handler)
+    find_book_use_case = Factory(FindBookUseCase, uow=book_query_unit_of_work)
     find_book_by_title_use_case = Factory(FindBookByTitleUseCase, uow=book_query_unit_of_work)
-    new_book_use_case = Factory(NewBookUseCase, uow=book_persistence_unit_of_work)
+    find_books_by_ids_use_case = Factory(FindBooksByIdsUseCase, uow=book_query_unit_of_work)
+    list_books_use_case = Factory(ListBooksUseCase, uow=book_query_unit_of_work)
+    search_books_use_case = Factory(SearchBooksUseCase, uow=book_query_unit_of_work)
+    new_book_use_case = Factory(NewBookUseCase, uow=book_persistence_unit_of_work,
+                                event=books_changed_event_handler)
+    new_books_use_case = Factory(NewBooksUseCase, uow=book_persistence_unit_of_work,
+                                 event=books_changed_event_handler)
+
+    # Outbox (event name -> handler factory)
+    outbox_dispatcher = Singleton(OutboxDispatcher, engine=db.provided.engine, handlers=Dict(
+        AuthorAddedToBookDomainEvent=add_book_to_author_event_handler.provider,
+        AuthorsAddedToBookDomainEvent=add_book_to_authors_event_handler.provider,
+        BooksDeletedDomainEvent=remove_books_from_authors_event_handler.provider,
+        BooksChangedDomainEvent=book_view_projection_event_handler.provider,
+        AuthorsChangedDomainEvent=book_view_authors_event_handler.provider
+    ))
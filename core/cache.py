@@ -0,0 +1,74 @@
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """
+    In-process LRU cache with per-entry TTL and hit/miss counters.
+
+    ``generation`` is bumped on every invalidation. Readers take it before loading from the
+    database and pass it back to ``set``, so a value loaded before an invalidation is never stored.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 60.0) -> None:
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Optional[Any]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        if generation != self.generation:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *keys: Hashable) -> None:
+        self.generation += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {'size': len(self._entries), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
+
+
+class AggregateCache(LRUCache):
+    """
+    LRUCache of aggregate snapshots, immutable tuples with a ``version`` field.
+
+    A snapshot never replaces a newer version, so a transaction that read a row before another one committed
+    can not put back the older state. Disabled, every lookup misses and nothing is stored.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 60.0, enabled: bool = True) -> None:
+        super().__init__(maxsize, ttl)
+        self.enabled = enabled
+
+    def put(self, key: Hashable, snapshot: Any, generation: int) -> None:
+        entry = self._entries.get(key)
+        if not self.enabled or (entry is not None and entry[1].version > snapshot.version):
+            return
+
+        self.set(key, snapshot, generation)
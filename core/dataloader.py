@@ -0,0 +1,69 @@
+import asyncio
+
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Sequence, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Coalesces ``load`` calls made in the same event loop tick into one ``batch_fn`` call.
+
+    ``batch_fn`` receives unique keys and returns one value per key in the same order. Values are
+    memoized for the lifetime of the loader, so a loader should live no longer than one request.
+    Batches run one at a time, a unit of work holds a single session.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[K]], Awaitable[Sequence[V]]], max_batch_size: int = 100) -> None:
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._futures: Dict[K, 'asyncio.Future[V]'] = {}
+        self._queue: List[K] = []
+        self._lock = asyncio.Lock()
+        self._scheduled = False
+
+    def load(self, key: K) -> 'asyncio.Future[V]':
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = self._futures[key] = loop.create_future()
+        self._queue.append(key)
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._schedule)
+
+        return future
+
+    async def load_many(self, keys: Sequence[K]) -> List[V]:
+        return list(await asyncio.gather(*map(self.load, keys)))
+
+    def _schedule(self) -> None:
+        queue, self._queue = self._queue, []
+        self._scheduled = False
+        asyncio.ensure_future(self._dispatch(queue))
+
+    async def _dispatch(self, keys: List[K]) -> None:
+        async with self._lock:
+            for start in range(0, len(keys), self._max_batch_size):
+                batch = keys[start:start + self._max_batch_size]
+                error: Optional[BaseException] = None
+                try:
+                    values = await self._batch_fn(batch)
+                    if len(values) != len(batch):
+                        raise ValueError(f'batch function returned {len(values)} values for {len(batch)} keys')
+                except Exception as ex:
+                    error = ex
+
+                for index, key in enumerate(batch):
+                    future = self._futures[key]
+                    if future.done():
+                        continue
+                    if error is not None:
+                        future.set_exception(error)
+                        # Failures are not memoized, the next load of the key tries again
+                        del self._futures[key]
+                    else:
+                        future.set_result(values[index])
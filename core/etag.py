@@ -0,0 +1,42 @@
+import hashlib
+
+from datetime import datetime
+from typing import Any, Iterable, NamedTuple, Optional, Sequence, Tuple
+
+# id, version and updated_at of an aggregate, None where a requested one does not exist
+Version = Optional[Tuple[int, int, datetime]]
+
+
+def version_of(row: Any) -> Version:
+    if row is None:
+        return None
+    if isinstance(row, dict):
+        return row['id'], row['version'], row['updated_at']
+    return row.id, row.version, row.updated_at
+
+
+class EntityTag(NamedTuple):
+    """
+    Validators of a query response, derived from the versions of the aggregates in it.
+
+    The same versions always give the same ETag, so it can be computed from the version columns alone to answer
+    a conditional GET, or from the rows of a response body. Last-Modified is the newest updated_at when every
+    requested aggregate exists; a deleted member of a result is only noticed through the ETag.
+    """
+
+    etag: str
+    last_modified: Optional[datetime]
+
+    @classmethod
+    def of(cls, versions: Sequence[Version]) -> 'EntityTag':
+        digest = hashlib.blake2b(digest_size=16)
+        for version in versions:
+            digest.update(b'%d:%d;' % version[:2] if version else b'-;')
+
+        last_modified = max(version[2] for version in versions) if versions and all(versions) else None
+        return cls('"{}"'.format(digest.hexdigest()), last_modified)
+
+    # rows as a query use case returns them, dicts or read models
+    @classmethod
+    def of_rows(cls, rows: Iterable[Any]) -> 'EntityTag':
+        return cls.of([version_of(row) for row in rows])
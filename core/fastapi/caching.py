@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from starlette.requests import Request
+from starlette.responses import Response
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from core.etag import EntityTag
+from core.fastapi.responses import ORJSONResponse
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+class HttpCache:
+    """
+    Conditional GET and Cache-Control for query endpoints.
+
+    ``respond`` answers 304 when the request's If-None-Match (or, without it, If-Modified-Since) still matches
+    the tag read from the version columns, and otherwise loads the content; a request without either header
+    skips that read. The ETag of a 200 is derived from the rows in its body, so a body served from a cache that
+    went stale never gets a newer tag.
+    ``s_maxage`` lets a shared cache (CDN) serve a response that long before revalidating it.
+    """
+
+    def __init__(self, max_age: int = 0, s_maxage: int = 5) -> None:
+        self.cache_control = 'public, max-age={}, s-maxage={}'.format(max_age, s_maxage)
+
+    def headers(self, tag: EntityTag) -> Dict[str, str]:
+        headers = {'ETag': tag.etag, 'Cache-Control': self.cache_control}
+        if tag.last_modified is not None:
+            headers['Last-Modified'] = format_datetime(_utc(tag.last_modified).replace(microsecond=0), usegmt=True)
+        return headers
+
+    @staticmethod
+    def not_modified(request: Request, tag: EntityTag) -> bool:
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match is not None:
+            # Weak comparison, as RFC 7232 asks for If-None-Match
+            etags = {etag.strip().replace('W/', '', 1) for etag in if_none_match.split(',')}
+            return '*' in etags or tag.etag in etags
+
+        if_modified_since = request.headers.get('if-modified-since')
+        if if_modified_since is None or tag.last_modified is None:
+            return False
+        try:
+            since: Optional[datetime] = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return _utc(tag.last_modified).replace(microsecond=0) <= _utc(since)
+
+    # content loads a list of rows, or a single row with one=True. The versions are only probed (tag) for a
+    # conditional request, a plain GET loads the rows once and takes the tag from them
+    async def respond(self, request: Request, tag: Callable[[], Awaitable[EntityTag]],
+                      content: Callable[[], Awaitable[Any]], one: bool = False) -> Response:
+        if 'if-none-match' in request.headers or 'if-modified-since' in request.headers:
+            probed = await tag()
+            if self.not_modified(request, probed):
+                return Response(status_code=304, headers=self.headers(probed))
+
+        body = await content()
+        return ORJSONResponse(body, headers=self.headers(EntityTag.of_rows([body] if one else body)))
@@ -1,37 +1,53 @@
 import anyio
 import inspect
+import time
 from contextvars import ContextVar
 from typing import Type, Dict, Union, Optional, NoReturn
 
 from pydantic import BaseModel
 
-from common.protocols.event import BaseEvent
+from common.protocols.event import BaseEvent, EventGroup
 from core.fastapi.event.exception import (InvalidEventTypeException, InvalidParameterTypeException,
                                           EmptyContextException, ParameterCountException, RequiredParameterException)
+from core.metrics import record_event
 
-_handler_context: ContextVar[Optional, "EventHandler"] = ContextVar("_handler_context", default=None)
+_handler_context: ContextVar[Optional["EventScope"]] = ContextVar("_handler_context", default=None)
 
 
 class EventHandlerValidator:
     EVENT_PARAMETER_COUNT = 2
 
-    async def validate(self, event: Type[BaseEvent], param: BaseModel = None) -> Optional[NoReturn]:
-        if not issubclass(event, BaseEvent):
-            raise InvalidEventTypeException
+    # Event type -> whether its handle() requires a parameter, filled once per type
+    _registry: Dict[Type[BaseEvent], bool] = {}
 
-        if param and not isinstance(param, BaseModel):
-            raise InvalidParameterTypeException
+    @classmethod
+    def register(cls, *events: Type[BaseEvent]) -> None:
+        for event in events:
+            cls._registry[event] = cls._inspect(event)
+
+    @classmethod
+    def _inspect(cls, event: Type[BaseEvent]) -> Union[bool, NoReturn]:
+        if not isinstance(event, type) or not issubclass(event, BaseEvent):
+            raise InvalidEventTypeException
 
         signature = inspect.signature(event.handle)
         func_parameters = signature.parameters
-        if len(func_parameters) != self.EVENT_PARAMETER_COUNT:
+        if len(func_parameters) != cls.EVENT_PARAMETER_COUNT:
             raise ParameterCountException
 
-        base_parameter = func_parameters.get("param")
-        if base_parameter.default is not None and not param:
-            raise RequiredParameterException(
-                cls_name=base_parameter.__class__.__name__,
-            )
+        base_parameter = list(func_parameters.values())[1]
+        return base_parameter.default is not None
+
+    def validate(self, event: Type[BaseEvent], param: BaseModel = None) -> Optional[NoReturn]:
+        param_required = self._registry.get(event)
+        if param_required is None:
+            param_required = self._registry[event] = self._inspect(event)
+
+        if param and not isinstance(param, BaseModel):
+            raise InvalidParameterTypeException
+
+        if param_required and not param:
+            raise RequiredParameterException(cls_name=event.__name__)
 
 
 class EventHandler:
@@ -40,7 +56,7 @@ class EventHandler:
         self.validator = validator
 
     async def store(self, event: BaseEvent, param: BaseModel = None) -> None:
-        await self.validator.validate(event=type(event), param=param)
+        self.validator.validate(event=type(event), param=param)
         self.events[event] = param
 
     async def publish(self) -> None:
@@ -52,23 +68,47 @@ class EventHandler:
         event: BaseEvent
         async with anyio.create_task_group() as task_group:
             for event, parameter in self.events.items():
-                task_group.start_soon(event.handle, parameter)
+                task_group.start_soon(self._handle, event, parameter)
+
+    @staticmethod
+    async def _handle(event: BaseEvent, parameter: Optional[BaseModel]) -> None:
+        started = time.perf_counter()
+        try:
+            await event.handle(parameter)
+        finally:
+            events = event.events if isinstance(event, EventGroup) else (event,)
+            record_event('+'.join(type(e).__name__ for e in events), time.perf_counter() - started)
+
+
+# Per request slot, the EventHandler is only created once an event is stored
+class EventScope:
+    __slots__ = ('handler',)
+
+    def __init__(self) -> None:
+        self.handler: Optional[EventHandler] = None
 
 
 class EventHandlerMeta(type):
     async def store(self, event: BaseEvent, param: BaseModel = None) -> None:
-        handler = self._get_event_handler()
-        await handler.store(event=event, param=param)
+        scope = self._get_event_scope()
+        if scope.handler is None:
+            scope.handler = EventHandler(validator=_validator)
+
+        await scope.handler.store(event=event, param=param)
 
     async def publish(self) -> None:
-        handler = self._get_event_handler()
-        await handler.publish()
+        handler = self._get_event_scope().handler
+        if handler is not None:
+            await handler.publish()
 
-    def _get_event_handler(self) -> Union[EventHandler, NoReturn]:
-        try:
-            return _handler_context.get()
-        except LookupError:
+    def _get_event_scope(self) -> Union[EventScope, NoReturn]:
+        scope = _handler_context.get()
+        if scope is None:
             raise EmptyContextException
+        return scope
+
+
+_validator = EventHandlerValidator()
 
 
 class EventHandlerDelegator(metaclass=EventHandlerMeta):
@@ -76,8 +116,7 @@ class EventHandlerDelegator(metaclass=EventHandlerMeta):
         self.token = None
 
     def __enter__(self):
-        validator = EventHandlerValidator()
-        self.token = _handler_context.set(EventHandler(validator=validator))
+        self.token = _handler_context.set(EventScope())
         return type(self)
 
     def __exit__(self, exc_type, exc_value, traceback):
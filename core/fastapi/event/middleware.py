@@ -1,16 +1,17 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .handler import event_handler
 
 
-class EventHandlerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        try:
-            with event_handler():
-                res = await call_next(request)
-        except Exception as ex:
-            raise ex from None
+# Pure ASGI middleware, it only opens the event context for the request
+class EventHandlerMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        return res
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        with event_handler():
+            await self.app(scope, receive, send)
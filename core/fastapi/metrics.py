@@ -0,0 +1,70 @@
+import time
+
+from fastapi import APIRouter
+from loguru import logger
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core import metrics
+
+router = APIRouter()
+
+
+@router.get(path='/metrics', name="Prometheus metrics", include_in_schema=False)
+async def prometheus():
+    return PlainTextResponse(metrics.render(), media_type='text/plain; version=0.0.4')
+
+
+def server_timing(request: metrics.RequestMetrics, elapsed: float) -> bytes:
+    db = 'db;dur={:.2f};desc="{} statements, {} rows affected"'.format(request.db_time * 1000, request.statements,
+                                                                       request.rows_affected)
+    entries = ['total;dur={:.2f}'.format(elapsed * 1000), db]
+    entries += ['tx;dur={:.2f};desc="{}"'.format(duration * 1000, name) for name, duration in request.transactions]
+    if request.event_time:
+        entries.append('events;dur={:.2f}'.format(request.event_time * 1000))
+    return ', '.join(entries).encode('latin-1')
+
+
+# Pure ASGI middleware, collects what the request spent and reports it as Server-Timing and metrics
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 5) -> None:
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+        with metrics.request_metrics() as request:
+            # Headers go out before a streamed body, the timing then covers the work done until then
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", server_timing(request, time.perf_counter() - started))
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._observe(scope, request, status, time.perf_counter() - started)
+
+    def _observe(self, scope: Scope, request: metrics.RequestMetrics, status: int, elapsed: float) -> None:
+        endpoint = scope.get("endpoint")
+        route = endpoint.__name__ if endpoint is not None else "unmatched"
+
+        metrics.http_request_duration.observe(elapsed, route, scope["method"], str(status))
+        metrics.http_request_statements.observe(request.statements, route)
+        metrics.http_request_db_duration.observe(request.db_time, route)
+
+        repeated = request.repeated(self.n_plus_one_threshold)
+        if repeated:
+            metrics.n_plus_one.inc(route)
+            for statement, count in repeated:
+                logger.warning("possible N+1 in {} {} ({}): statement ran {} times: {}".format(
+                    scope["method"], scope["path"], route, count, ' '.join(statement.split())[:200]))
@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Request
+
+from core.sqlalchemy import pool_statistics
+
+router = APIRouter(prefix='/monitoring')
+
+
+@router.get(path='/pool', name="Connection pool statistics")
+async def pool(request: Request):
+    container = request.app.container
+    statistics = pool_statistics(container.db().engine)
+    statistics['replicas'] = [dict(healthy=replica.healthy, **pool_statistics(replica.engine))
+                              for replica in container.db_replicas().replicas]
+    return statistics
@@ -1,6 +1,8 @@
-from starlette.responses import JSONResponse
+import dataclasses
+
+from starlette.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.associationproxy import _AssociationList
-from typing import Any
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
 
 try:
     import orjson
@@ -11,12 +13,35 @@ except ImportError:  # pragma: nocover
 def default(obj):
     if isinstance(obj, _AssociationList):
         return list(obj)
+
+    # Dataclasses are passed through to here, mapped query DTOs know their own shape
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    if dataclasses.is_dataclass(obj):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
     raise TypeError
 
 
+# Returned from an endpoint as is, the content skips jsonable_encoder and goes straight to orjson
 class ORJSONResponse(JSONResponse):
     media_type = "application/json"
 
     def render(self, content: Any) -> bytes:
         assert orjson is not None, "orjson must be installed to use ORJSONResponse"
-        return orjson.dumps(content, default=default)
+        return orjson.dumps(content, default=default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    media_type = "application/x-ndjson"
+
+    # content yields batches of rows, each batch is sent as one chunk
+    def __init__(self, content: AsyncIterable[Iterable[Any]], **kwargs) -> None:
+        assert orjson is not None, "orjson must be installed to use NDJSONStreamingResponse"
+        super().__init__(self._encode(content), **kwargs)
+
+    @staticmethod
+    async def _encode(content: AsyncIterable[Iterable[Any]]) -> AsyncIterator[bytes]:
+        async for rows in content:
+            yield b''.join(orjson.dumps(row, default=default, option=orjson.OPT_PASSTHROUGH_DATACLASS) + b'\n'
+                           for row in rows)
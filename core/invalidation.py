@@ -0,0 +1,103 @@
+import asyncio
+
+import orjson
+from loguru import logger
+from pymfdata.rdb.connection import AsyncEngine
+from sqlalchemy import text
+from typing import Hashable, List, Optional, Sequence
+
+from core.cache import LRUCache
+from core.sqlalchemy import driver_connection
+
+# NOTIFY payloads are limited to 8000 bytes, a larger invalidation clears the caches instead
+_MAX_PAYLOAD = 7900
+_CLEAR = '*'
+
+
+class CacheInvalidationChannel:
+    """
+    Carries the invalidations of an LRUCache to every process sharing the PostgreSQL database (LISTEN/NOTIFY).
+
+    A writer invalidates its own cache and publishes the keys once it committed, every listening process then drops
+    them from its cache, so a cache hit needs no round trip. The listening connection is checked out of the engine's
+    pool and kept, with the settings of any other. When it is lost, invalidations may have been missed: the cache is
+    cleared and listening starts again. On other databases (SQLite, one process) nothing is published or listened
+    to, and the TTL of the cache bounds how long another process serves an entry.
+    """
+
+    def __init__(self, engine: AsyncEngine, cache: LRUCache, channel: str, retry_interval: float = 1.0) -> None:
+        self._engine = engine
+        self._cache = cache
+        self.channel = channel
+        self.retry_interval = retry_interval
+
+        self._stopped = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._engine.dialect.name == 'postgresql'
+
+    # keys None clears the caches of every process, e.g. after a bulk import
+    async def publish(self, keys: Optional[Sequence[Hashable]] = None) -> None:
+        if not self.enabled:
+            return
+
+        payload = _CLEAR if keys is None else orjson.dumps(list(keys)).decode()
+        if len(payload.encode()) > _MAX_PAYLOAD:
+            payload = _CLEAR
+
+        async with self._engine.begin() as conn:
+            await conn.execute(text('SELECT pg_notify(:channel, :payload)'),
+                               {'channel': self.channel, 'payload': payload})
+
+    def _notified(self, connection, pid: int, channel: str, payload: str) -> None:
+        if payload == _CLEAR:
+            self._cache.clear()
+            return
+
+        keys: List[Hashable] = [tuple(key) for key in orjson.loads(payload)]
+        self._cache.invalidate(*keys)
+
+    async def _listen(self) -> None:
+        async with self._engine.connect() as conn:
+            driver = await driver_connection(conn)
+            lost = asyncio.Event()
+            driver.add_termination_listener(lambda _: lost.set())
+            await driver.add_listener(self.channel, self._notified)
+            waits = [asyncio.ensure_future(lost.wait()), asyncio.ensure_future(self._stopped.wait())]
+            try:
+                await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for wait in waits:
+                    wait.cancel()
+                if not driver.is_closed():
+                    await driver.remove_listener(self.channel, self._notified)
+
+    async def run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                await self._listen()
+            except Exception as ex:
+                logger.warning("cache invalidation channel {} failed: {!r}".format(self.channel, ex))
+
+            if self._stopped.is_set():
+                break
+
+            self._cache.clear()
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self.retry_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+
+        self._stopped.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task:
+            await self._task
@@ -0,0 +1,174 @@
+import collections
+import functools
+import time
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    pairs = ('{}="{}"'.format(name, str(value).replace('"', '\\"')) for name, value in zip(names, values))
+    return '{' + ','.join(pairs) + '}'
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = SECONDS_BUCKETS) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+
+        # label values -> [count per bucket (the last one is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = ['# HELP {} {}'.format(self.name, self.documentation), '# TYPE {} histogram'.format(self.name)]
+        for values, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), series):
+                cumulative += count
+                lines.append('{}_bucket{} {}'.format(
+                    self.name, _labels(self.labels + ('le',), values + (str(bound),)), cumulative))
+            lines.append('{}_sum{} {}'.format(self.name, _labels(self.labels, values), series[-1]))
+            lines.append('{}_count{} {}'.format(self.name, _labels(self.labels, values), cumulative))
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._series: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._series[labels] = self._series.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = ['# HELP {} {}'.format(self.name, self.documentation), '# TYPE {} counter'.format(self.name)]
+        lines += ['{}{} {}'.format(self.name, _labels(self.labels, values), value)
+                  for values, value in self._series.items()]
+        return lines
+
+
+http_request_duration = Histogram('http_request_duration_seconds', 'Request latency',
+                                  ('route', 'method', 'status'))
+http_request_statements = Histogram('http_request_db_statements', 'SQL statements per request', ('route',),
+                                    COUNT_BUCKETS)
+http_request_db_duration = Histogram('http_request_db_duration_seconds', 'Time spent in SQL per request', ('route',))
+use_case_duration = Histogram('use_case_duration_seconds', 'Use case transaction time, commit included',
+                              ('use_case',))
+event_handler_duration = Histogram('event_handler_duration_seconds', 'Event handler time', ('handler',))
+db_statements = Counter('db_statements_total', 'SQL statements executed')
+n_plus_one = Counter('db_n_plus_one_total', 'Requests that repeated an identical statement', ('route',))
+
+METRICS = (http_request_duration, http_request_statements, http_request_db_duration, use_case_duration,
+           event_handler_duration, db_statements, n_plus_one)
+
+
+def render() -> str:
+    return '\n'.join(line for metric in METRICS for line in metric.render()) + '\n'
+
+
+class RequestMetrics:
+    """What one request spent, filled by the engine hooks, timed use cases and the event handler."""
+
+    __slots__ = ('statements', 'db_time', 'rows_affected', 'transactions', 'event_time', 'statement_counts')
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.db_time = 0.0
+        # Rows written by INSERT, UPDATE and DELETE (cursor.rowcount), rows fetched by a SELECT are not counted
+        self.rows_affected = 0
+        self.transactions: List[Tuple[str, float]] = []
+        self.event_time = 0.0
+        self.statement_counts: collections.Counter = collections.Counter()
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        return [(statement, count) for statement, count in self.statement_counts.items() if count >= threshold]
+
+
+_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("_request_metrics", default=None)
+
+
+@contextmanager
+def request_metrics() -> Iterator[RequestMetrics]:
+    metrics = RequestMetrics()
+    token = _request_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _request_metrics.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    db_statements.inc()
+
+    metrics = _request_metrics.get()
+    if metrics is None:
+        return
+
+    metrics.statements += 1
+    metrics.db_time += time.perf_counter() - context._metrics_started
+    # asyncpg reports the rows of a SELECT as its rowcount too, only DML statements are counted
+    if context.isinsert or context.isupdate or context.isdelete or cursor.description is None:
+        metrics.rows_affected += max(cursor.rowcount or 0, 0)
+    metrics.statement_counts[statement] += 1
+
+
+# Listens on the Engine class, so the primary, the replicas and engines created later are all covered
+def instrument_engines() -> None:
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def record_event(handler: str, elapsed: float) -> None:
+    event_handler_duration.observe(elapsed, handler)
+
+    metrics = _request_metrics.get()
+    if metrics is not None:
+        metrics.event_time += elapsed
+
+
+# Put above @async_transactional(), the time then includes opening the session and the commit
+def timed_use_case():
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                use_case_duration.observe(elapsed, type(self).__name__)
+
+                metrics = _request_metrics.get()
+                if metrics is not None:
+                    metrics.transactions.append((type(self).__name__, elapsed))
+
+        return wrapper
+
+    return decorator
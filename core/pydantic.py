@@ -1,5 +1,5 @@
-from pydantic import BaseConfig
-from pydantic.fields import ModelField
+from pydantic.dataclasses import dataclass
+from typing import Callable
 
 
 class ConStr(str):
@@ -8,14 +8,28 @@ class ConStr(str):
 
     @classmethod
     def __get_validators__(cls):
-        yield cls.validate
+        yield cls.validator()
 
+    # Built once per model field with the bounds bound as locals, pydantic then calls it with the value only
     @classmethod
-    def validate(cls, value: str, field: ModelField, config: BaseConfig):
-        if not isinstance(value, str):
-            raise ValueError('This value is only str')
+    def validator(cls) -> Callable[[str], str]:
+        min_length, max_length = cls.min_length, cls.max_length
+        message = 'This value length {} ~ {}'.format(min_length, max_length)
 
-        if not cls.min_length <= len(value) <= cls.max_length:
-            raise ValueError('This value length {} ~ {}'.format(cls.min_length, cls.max_length))
+        def validate(value: str) -> str:
+            if not isinstance(value, str):
+                raise ValueError('This value is only str')
 
-        return value
+            if not min_length <= len(value) <= max_length:
+                raise ValueError(message)
+
+            return value
+
+        return validate
+
+
+# pydantic dataclass validated where values come in from outside, as a field of a request or command model
+# (pydantic validates dataclass fields even with validate_on_init=False). Built by the domain, by the ORM or from
+# an aggregate snapshot, its values are already valid and __init__ skips validation
+def value_object(cls=None, **kwargs):
+    return dataclass(cls, validate_on_init=False, **kwargs)
@@ -0,0 +1,105 @@
+import asyncio
+import enum
+import itertools
+
+from contextvars import ContextVar
+from loguru import logger
+from pymfdata.rdb.connection import AsyncEngine, AsyncSQLAlchemy
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from typing import Any, Dict, List, Optional
+
+# Set once a command opened a unit of work, later reads of the same request go to the primary
+_wrote_primary: ContextVar[bool] = ContextVar("_wrote_primary", default=False)
+
+
+def mark_primary_write() -> None:
+    _wrote_primary.set(True)
+
+
+class ReplicaStrategy(enum.Enum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_CONNECTIONS = "least_connections"
+
+
+class Replica:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.healthy = True
+
+        # A dropped connection takes the replica out until the next successful health check
+        event.listen(engine.sync_engine, 'handle_error', self._on_error)
+
+    def _on_error(self, context) -> None:
+        if context.is_disconnect:
+            self.healthy = False
+
+    def checked_out(self) -> int:
+        pool = self.engine.sync_engine.pool
+        return pool.checkedout() if hasattr(pool, 'checkedout') else 0
+
+
+class ReplicaRouter:
+    """
+    Picks the engine for query side units of work.
+
+    ``uris`` is a comma separated list of read replicas. Without replicas (or when every replica is
+    unhealthy) reads go to the primary, as they do after a command when ``read_your_writes`` is on.
+    """
+
+    def __init__(self, primary: AsyncSQLAlchemy, uris: Optional[str] = None, options: Dict[str, Any] = None,
+                 strategy: str = ReplicaStrategy.ROUND_ROBIN.value, read_your_writes: bool = True,
+                 health_check_interval: float = 5.0) -> None:
+        self._primary = primary
+        self._uris = [uri.strip() for uri in (uris or '').split(',') if uri.strip()]
+        self._options = options or {}
+        self.strategy = ReplicaStrategy(strategy)
+        self.read_your_writes = read_your_writes
+        self.health_check_interval = health_check_interval
+
+        self.replicas: List[Replica] = []
+        self._counter = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+    async def connect(self):
+        self.replicas = [Replica(create_async_engine(uri, **self._options)) for uri in self._uris]
+        if self.replicas:
+            self._task = asyncio.create_task(self._health_check())
+
+    async def disconnect(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def read_engine(self) -> AsyncEngine:
+        if self.read_your_writes and _wrote_primary.get():
+            return self._primary.engine
+
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return self._primary.engine
+
+        if self.strategy == ReplicaStrategy.LEAST_CONNECTIONS:
+            return min(healthy, key=Replica.checked_out).engine
+
+        return healthy[next(self._counter) % len(healthy)].engine
+
+    async def _health_check(self):
+        while True:
+            for replica in self.replicas:
+                try:
+                    async with replica.engine.connect() as conn:
+                        await asyncio.wait_for(conn.execute(text('SELECT 1')), timeout=self.health_check_interval)
+                    healthy = True
+                except Exception as ex:
+                    healthy = False
+                    if replica.healthy:
+                        logger.warning("read replica {} is unhealthy: {!r}".format(
+                            replica.engine.url.render_as_string(hide_password=True), ex))
+
+                replica.healthy = healthy
+
+            await asyncio.sleep(self.health_check_interval)
@@ -0,0 +1,72 @@
+import re
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Set
+
+_TOKEN = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+class InvertedIndex:
+    """
+    Term -> document ids index with prefix matching, used where the database has no full text search.
+
+    Every query term must match (as a prefix) a term of the document. Documents are ranked by the
+    share of their terms hit by the query, exact matches counting twice as much as prefix matches.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[int]] = {}
+        self._documents: Dict[int, List[str]] = {}
+        self._terms: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, _id: int, text: str) -> None:
+        self.remove(_id)
+
+        terms = tokenize(text)
+        self._documents[_id] = terms
+        for term in set(terms):
+            if term not in self._postings:
+                self._postings[term] = set()
+                insort(self._terms, term)
+            self._postings[term].add(_id)
+
+    def remove(self, _id: int) -> None:
+        for term in set(self._documents.pop(_id, ())):
+            postings = self._postings[term]
+            postings.discard(_id)
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect_left(self._terms, term)]
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._documents.clear()
+        self._terms.clear()
+
+    def _prefix_matches(self, prefix: str) -> Set[int]:
+        matches: Set[int] = set()
+        index = bisect_left(self._terms, prefix)
+        while index < len(self._terms) and self._terms[index].startswith(prefix):
+            matches |= self._postings[self._terms[index]]
+            index += 1
+        return matches
+
+    def search(self, query: str, limit: int, offset: int = 0) -> List[int]:
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        candidates = set.intersection(*(self._prefix_matches(token) for token in tokens))
+
+        def rank(_id: int) -> float:
+            terms = self._documents[_id]
+            return sum(2 if token in terms else 1 for token in tokens) / len(terms)
+
+        return sorted(candidates, key=lambda _id: (-rank(_id), _id))[offset:offset + limit]
@@ -1,10 +1,15 @@
+import fcntl
+import os
+import tempfile
 import time
 
-from datetime import datetime
 from loguru import logger
+from typing import IO, List, Optional
 
-# Datetime Now
-tw_epoch = int(datetime.now().timestamp())
+# Unix epoch. The first generator subtracted the process start in seconds from a millisecond timestamp, so
+# counting from 0 keeps every new ID above the ones it created and id order (and keyset cursors) intact.
+# 41 bits of milliseconds last until 2039-09-07
+id_epoch = 0
 
 worker_id_bits = 5
 data_center_id_bits = 5
@@ -17,43 +22,116 @@ timestamp_left_shift = sequence_bits + worker_id_bits + data_center_id_bits
 sequence_mask = -1 ^ (-1 << sequence_bits)
 
 
-def snowflake_to_timestamp(_id):
+def snowflake_to_timestamp(_id, epoch: int = id_epoch):
     _id = _id >> 22     # strip the lower 22 bits
-    _id += tw_epoch     # adjust for twitter epoch
+    _id += epoch        # adjust for the epoch
     _id = _id / 1000    # convert from milliseconds to seconds
 
     return _id
 
 
-def generator(worker_id, data_center_id, sleep=lambda x: time.sleep(x / 1000.0)):
-    assert 0 <= worker_id <= max_worker_id
-    assert 0 <= data_center_id <= max_data_center_id
+def _check(name: str, value: int, maximum: int) -> None:
+    if not isinstance(value, int) or not 0 <= value <= maximum:
+        raise ValueError("snowflake.{} must be 0..{}, got {!r}".format(name, maximum, value))
 
-    last_timestamp = -1
-    sequence = 0
 
-    while True:
-        timestamp = int(time.time() * 1000)
+# Lock files of the worker IDs this process holds, open until it exits
+_leases: List[IO] = []
 
-        if last_timestamp > timestamp:
-            logger.warning("clock is moving backwards. waiting until %i" % last_timestamp)
-            sleep(last_timestamp - timestamp)
+
+def claim_worker_id(data_center_id: int, base: int = 0, lock_dir: Optional[str] = None) -> int:
+    """
+    Takes the first worker ID from base on that no other process of this host holds.
+
+    Each ID is an exclusive flock on a file in lock_dir, released by the OS when the process ends, so every
+    server worker (uvicorn --workers, gunicorn) gets its own ID from the same configuration. Call it in the
+    process that allocates, after any fork. Hosts sharing a data center ID must not share the IDs above base.
+    """
+    _check('data_center_id', data_center_id, max_data_center_id)
+    _check('worker_id', base, max_worker_id)
+
+    for worker_id in range(base, max_worker_id + 1):
+        lease = open(os.path.join(lock_dir or tempfile.gettempdir(),
+                                  'snowflake-{}-{}.lock'.format(data_center_id, worker_id)), 'a')
+        try:
+            fcntl.flock(lease, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lease.close()
             continue
 
-        if last_timestamp == timestamp:
-            sequence = (sequence + 1) & sequence_mask
-            if sequence == 0:
-                logger.warning("sequence overrun")
-                sequence = -1 & sequence_mask
-                sleep(1)
-                continue
-        else:
-            sequence = 0
+        _leases.append(lease)
+        logger.info("snowflake worker id {} of data center {}".format(worker_id, data_center_id))
+        return worker_id
+
+    raise RuntimeError("every snowflake worker id from {} to {} of data center {} is taken".format(
+        base, max_worker_id, data_center_id))
+
+
+class SnowflakeAllocator:
+    """
+    Hands out snowflake IDs in blocks, reading the clock once per block.
+
+    When a millisecond runs out of sequence numbers (or the clock moves backwards), the allocator
+    borrows the next milliseconds instead of sleeping, so it never blocks the event loop.
+    Allocation has no await point, so it is atomic within one event loop without any lock.
+    """
+
+    def __init__(self, worker_id: int, data_center_id: int, epoch: int = id_epoch) -> None:
+        _check('worker_id', worker_id, max_worker_id)
+        _check('data_center_id', data_center_id, max_data_center_id)
+
+        self._node = (data_center_id << data_center_id_shift) | (worker_id << worker_id_shift)
+        self._epoch = epoch
+
+        # Wall clock anchored to the monotonic clock, so NTP adjustments can not move IDs backwards
+        self._origin = time.time_ns() // 1_000_000 - time.monotonic_ns() // 1_000_000
+
+        self._last_timestamp = -1
+        self._sequence = 0
+
+    def _now(self) -> int:
+        return self._origin + time.monotonic_ns() // 1_000_000 - self._epoch
+
+    def next_id(self) -> int:
+        return self.next_ids(1)[0]
+
+    def next_ids(self, n: int) -> List[int]:
+        timestamp = self._now()
+        if timestamp > self._last_timestamp:
+            self._last_timestamp = timestamp
+            self._sequence = 0
+        elif timestamp < self._last_timestamp - 1000:
+            logger.warning("snowflake allocator is running {}ms ahead of the clock".format(
+                self._last_timestamp - timestamp))
+
+        ids: List[int] = []
+        while n > 0:
+            if self._sequence > sequence_mask:
+                # Sequence overrun, borrow the next millisecond
+                self._last_timestamp += 1
+                self._sequence = 0
+
+            count = min(n, sequence_mask + 1 - self._sequence)
+            base = (self._last_timestamp << timestamp_left_shift) | self._node
+            ids.extend(range(base + self._sequence, base + self._sequence + count))
+
+            self._sequence += count
+            n -= count
+
+        return ids
+
+
+_allocator: Optional[SnowflakeAllocator] = None
 
-        last_timestamp = timestamp
 
-        yield (((timestamp - tw_epoch) << timestamp_left_shift) | (data_center_id << data_center_id_shift) |
-               (worker_id << worker_id_shift) | sequence)
+# app startup and catalog.py install the allocator of the container
+def install(allocator: SnowflakeAllocator) -> None:
+    global _allocator
+    _allocator = allocator
 
 
-seq = generator(1, 1)
+def allocator() -> SnowflakeAllocator:
+    if _allocator is None:
+        raise RuntimeError("no snowflake allocator installed, call snowflake.install() with "
+                           "container.snowflake_allocator() before creating IDs")
+    return _allocator
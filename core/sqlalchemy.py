@@ -0,0 +1,143 @@
+import enum
+import functools
+import time
+
+from sqlalchemy import ARRAY, Table, any_, bindparam, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.orm import Session, joinedload, object_mapper, selectinload, subqueryload
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.orm.strategy_options import Load
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.sql import Insert
+from typing import Any, Dict, Sequence
+
+
+class LoadStrategy(enum.Enum):
+    JOINED = "joined"       # One query, one row per association (needs result.unique())
+    SELECTIN = "selectin"   # Second query with WHERE parent_id IN (...), one row per parent
+    SUBQUERY = "subquery"   # Second query re-running the parent query as a subquery
+
+
+_LOADERS = {
+    LoadStrategy.JOINED: joinedload,
+    LoadStrategy.SELECTIN: selectinload,
+    LoadStrategy.SUBQUERY: subqueryload
+}
+
+
+def load_option(strategy: LoadStrategy, attr) -> Load:
+    return _LOADERS[strategy](attr)
+
+
+# column = ANY(:values) binds one array on Postgres, so every batch size shares a statement and a plan
+def any_of(column, values: Sequence[Any], dialect: str):
+    if dialect == 'postgresql':
+        return column == any_(bindparam(None, list(values), type_=ARRAY(column.type)))
+    return column.in_(values)
+
+
+# any_of with the values left to a named bind parameter, for statements built once and reused
+def any_of_param(column, name: str, dialect: str):
+    if dialect == 'postgresql':
+        return column == any_(bindparam(name, type_=ARRAY(column.type)))
+    return column.in_(bindparam(name, expanding=True))
+
+
+# INSERT .. ON CONFLICT DO NOTHING, both dialects the app runs on support it
+def insert_or_ignore(table: Table, dialect: str) -> Insert:
+    return {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}[dialect](table).on_conflict_do_nothing()
+
+
+# before_flush listener for mappers with version_id_generator=False. An aggregate whose columns or collections
+# changed gets version + 1, its UPDATE then runs WHERE version = <the version it was read with>
+def _increment_versions(session: Session, flush_context, instances) -> None:
+    for obj in session.dirty:
+        mapper = object_mapper(obj)
+        if mapper.version_id_col is None or mapper.version_id_generator is not False:
+            continue
+
+        if session.is_modified(obj):
+            key = mapper.get_property_by_column(mapper.version_id_col).key
+            setattr(obj, key, getattr(obj, key) + 1)
+
+
+def version_aggregates() -> None:
+    if not event.contains(Session, 'before_flush', _increment_versions):
+        event.listen(Session, 'before_flush', _increment_versions)
+
+
+# Runs the use case again when its commit lost to a concurrent one (an UPDATE .. WHERE version = :v matched no
+# row). Put above @async_transactional(), every attempt gets a new session and the stale snapshot is evicted
+def retry_on_stale(attempts: int = 3):
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            for attempt in range(1, attempts + 1):
+                try:
+                    return await func(self, *args, **kwargs)
+                except StaleDataError:
+                    if attempt == attempts:
+                        raise
+
+        return wrapper
+
+    return decorator
+
+
+# Queue pool that records how long checkouts wait for a connection
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_time += waited
+            self.max_wait_time = max(self.max_wait_time, waited)
+
+
+def engine_options(uri: str, echo: bool = False, pool_size: int = 5, max_overflow: int = 10,
+                   pool_timeout: float = 30, pool_recycle: int = -1, pool_pre_ping: bool = False,
+                   statement_cache_size: int = 100) -> Dict[str, Any]:
+    """create_async_engine keyword arguments, pool settings only apply to server databases."""
+    options: Dict[str, Any] = dict(echo=echo)
+    if make_url(uri).get_backend_name() == 'sqlite':
+        return options
+
+    options.update(poolclass=InstrumentedQueuePool, pool_size=pool_size, max_overflow=max_overflow,
+                   pool_timeout=pool_timeout, pool_recycle=pool_recycle, pool_pre_ping=pool_pre_ping)
+    if make_url(uri).get_driver_name() == 'asyncpg':
+        options.update(connect_args=dict(prepared_statement_cache_size=statement_cache_size))
+
+    return options
+
+
+def pool_statistics(engine: AsyncEngine) -> Dict[str, Any]:
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return dict(pool=type(pool).__name__)
+
+    statistics = dict(pool=type(pool).__name__, size=pool.size(), checked_in=pool.checkedin(),
+                      checked_out=pool.checkedout(), overflow=pool.overflow())
+    if isinstance(pool, InstrumentedQueuePool):
+        statistics.update(checkouts=pool.checkouts, wait_time=pool.wait_time, max_wait_time=pool.max_wait_time,
+                          avg_wait_time=pool.wait_time / pool.checkouts if pool.checkouts else 0.0)
+
+    return statistics
+
+
+# The driver's own connection under a pooled one (asyncpg), for what SQLAlchemy does not wrap (COPY, LISTEN).
+# A pool pre-ping leaves a transaction open for SQLAlchemy to end, AUTOCOMMIT ends it and the driver connection starts
+# its own. The pool sets the isolation level back when the connection is returned
+async def driver_connection(conn: AsyncConnection) -> Any:
+    await conn.execution_options(isolation_level='AUTOCOMMIT')
+    return (await conn.get_raw_connection()).driver_connection
@@ -1,6 +1,7 @@
 from pydantic import PositiveInt
+from typing import List
 
-from core.snowflake import seq
+from core import snowflake
 
 
 class AuthorId(PositiveInt):
@@ -8,4 +9,8 @@ class AuthorId(PositiveInt):
 
     @staticmethod
     def next_id() -> 'AuthorId':
-        return seq.__next__()
+        return AuthorId(snowflake.allocator().next_id())
+
+    @staticmethod
+    def next_ids(n: int) -> List['AuthorId']:
+        return list(map(AuthorId, snowflake.allocator().next_ids(n)))
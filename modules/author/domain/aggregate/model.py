@@ -18,7 +18,12 @@ class Author:
 
     @staticmethod
     def new_author(command: NewAuthorCommand) -> 'Author':
-        return Author(id=AuthorId.next_id(), **command.dict())
+        return Author(id=AuthorId.next_id(), name=command.name, age=command.age, biography=command.biography)
+
+    def add_book(self, command: AddBookToAuthorCommand) -> bool:
+        # Events are delivered at least once
+        if any(book.book_id == command.book_id for book in self.book_ids):
+            return False
 
-    def add_book(self, command: AddBookToAuthorCommand):
         self.book_ids.append(AuthorBook(author_id=self.id, book_id=command.book_id))
+        return True
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class AuthorsChangedDomainEvent(BaseModel):
+    author_ids: List[int]
@@ -1,7 +1,6 @@
 from pydantic import PositiveInt, constr
-from pydantic.dataclasses import dataclass
 
-from core.pydantic import ConStr
+from core.pydantic import ConStr, value_object
 from modules.author.domain.aggregate.id import AuthorId
 from modules.book.domain.aggregate.id import BookId
 
@@ -15,7 +14,7 @@ class Biography(ConStr):
     max_length: 3000
 
 
-@dataclass
+@value_object
 class Name:
     first_name: constr(min_length=1, max_length=100)
     last_name: constr(min_length=1, max_length=100)
@@ -25,7 +24,7 @@ class Name:
         return self.first_name, self.last_name
 
 
-@dataclass
+@value_object
 class AuthorBook:
     author_id: AuthorId
     book_id: BookId
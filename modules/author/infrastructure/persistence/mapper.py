@@ -1,5 +1,7 @@
+from datetime import datetime
 from pymfdata.rdb.mapper import mapper_registry
 from sqlalchemy.orm import composite
+from typing import NamedTuple, Optional, Tuple
 
 from common.protocols.model_mapper import ModelMapper
 from modules.author.domain.aggregate.model import Author
@@ -7,6 +9,18 @@ from modules.author.domain.value_objects import Name, AuthorBook
 from persistence.author.entity import AuthorEntity, AuthorBookEntity, relationship
 
 
+# What the aggregate cache keeps of an Author
+class AuthorSnapshot(NamedTuple):
+    id: int
+    first_name: str
+    last_name: str
+    age: int
+    biography: Optional[str]
+    version: int
+    updated_at: datetime
+    book_ids: Tuple[int, ...]
+
+
 # Classical Mapper (Traditional)
 class AuthorMapper(ModelMapper[Author, AuthorEntity]):
     @staticmethod
@@ -30,14 +44,30 @@ class AuthorMapper(ModelMapper[Author, AuthorEntity]):
             book_ids=model.book_ids
         )
 
+    @staticmethod
+    def map_to_snapshot(model: Author) -> AuthorSnapshot:
+        return AuthorSnapshot(model.id, model.name.first_name, model.name.last_name, model.age, model.biography,
+                              model.version, model.updated_at, tuple(book.book_id for book in model.book_ids))
+
+    # version and updated_at are mapped columns, not fields of the domain dataclass
+    @staticmethod
+    def map_from_snapshot(snapshot: AuthorSnapshot) -> Author:
+        author = Author(id=snapshot.id, name=Name(first_name=snapshot.first_name, last_name=snapshot.last_name),
+                        age=snapshot.age, biography=snapshot.biography,
+                        book_ids=[AuthorBook(author_id=snapshot.id, book_id=_id) for _id in snapshot.book_ids])
+        author.version = snapshot.version
+        author.updated_at = snapshot.updated_at
+        return author
+
 
 # SQLAlchemy Mapper (only sqlalchemy)
 def start_mapper():
     t = AuthorEntity.__table__
     rt = AuthorBookEntity.__table__
 
-    mapper_registry.map_imperatively(Author, t, properties={
+    # The version is set by the before_flush listener of version_aggregates (installed in app startup)
+    mapper_registry.map_imperatively(Author, t, version_id_col=t.c.version, version_id_generator=False, properties={
         'name': composite(Name, t.c.first_name, t.c.last_name),
-        'book_ids': relationship(AuthorBook, lazy='joined')
+        'book_ids': relationship(AuthorBook, lazy='selectin')
     })
     mapper_registry.map_imperatively(AuthorBook, rt)
@@ -1,14 +1,22 @@
 from pymfdata.rdb.connection import AsyncEngine
 from pymfdata.rdb.usecase import AsyncSQLAlchemyUnitOfWork
+from typing import Optional
+
+from core.cache import AggregateCache
+from core.replica import mark_primary_write
 
 from persistence.author.repository import AuthorRepository
+from persistence.outbox.repository import OutboxRepository
 
 
 class AuthorPersistenceUnitOfWork(AsyncSQLAlchemyUnitOfWork):
-    def __init__(self, engine: AsyncEngine) -> None:
+    def __init__(self, engine: AsyncEngine, cache: Optional[AggregateCache] = None) -> None:
         super().__init__(engine)
+        self._cache = cache
 
     async def __aenter__(self) -> None:
         await super().__aenter__()
+        mark_primary_write()
 
-        self.repository = AuthorRepository(self.session)
+        self.repository = AuthorRepository(self.session, self._cache)
+        self.outbox = OutboxRepository(self.session)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from datetime import datetime
 from sqlalchemy.ext.associationproxy import association_proxy
-from typing import FrozenSet
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional, Tuple
 
 
 @dataclass
@@ -10,4 +11,29 @@ class AuthorDTO:
     last_name: str
     age: int
     biography: str
+    version: int
+    updated_at: datetime
     books: FrozenSet[int] = association_proxy("author_books", "book_id")
+
+    # Reads author_books directly, going through the association proxy costs a proxy object per call
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(id=self.id, first_name=self.first_name, last_name=self.last_name, age=self.age,
+                    biography=self.biography, version=self.version, updated_at=self.updated_at,
+                    books=[book.book_id for book in self.author_books])
+
+
+# Read model of the Core query mode, an immutable tuple without ORM instrumentation or identity map entry
+class AuthorRecord(NamedTuple):
+    id: int
+    first_name: str
+    last_name: str
+    age: int
+    biography: Optional[str]
+    version: int
+    updated_at: datetime
+    books: Tuple[int, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(id=self.id, first_name=self.first_name, last_name=self.last_name, age=self.age,
+                    biography=self.biography, version=self.version, updated_at=self.updated_at,
+                    books=list(self.books))
@@ -8,5 +8,5 @@ def start_mapper():
     t = AuthorEntity.__table__
 
     mapper_registry.map_imperatively(AuthorDTO, t, properties={
-        'books': relationship(AuthorBookEntity, viewonly=True, lazy='joined')
+        'author_books': relationship(AuthorBookEntity, viewonly=True, lazy='joined')
     })
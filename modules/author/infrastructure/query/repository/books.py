@@ -0,0 +1,57 @@
+import enum
+
+from functools import lru_cache
+from pymfdata.rdb.repository import AsyncSession, BaseAsyncRepository
+from sqlalchemy import bindparam, select
+from sqlalchemy.sql import Select
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from persistence.author.entity import AuthorBookEntity, AuthorEntity
+from persistence.book.entity import BookViewEntity
+
+_author = AuthorEntity.__table__
+_author_book = AuthorBookEntity.__table__
+_view = BookViewEntity.__table__
+
+
+class BookField(str, enum.Enum):
+    ID = 'id'
+    TITLE = 'title'
+    ISBN = 'isbn'
+    PAGES = 'pages'
+    VERSION = 'version'
+    UPDATED_AT = 'updated_at'
+    AUTHORS = 'authors'
+
+
+# One statement per field selection, at most 2^6 of them. The author is outer joined so a row without a book
+# still tells an author without books from a missing author
+@lru_cache(maxsize=None)
+def _fetch_books(fields: Tuple[str, ...]) -> Select:
+    books = _author_book.join(_view, _view.c.id == _author_book.c.book_id)
+    return select(_author.c.id.label('author_id'), *[_view.c[field] for field in fields]) \
+        .select_from(_author.outerjoin(books, _author_book.c.author_id == _author.c.id)) \
+        .where(_author.c.id == bindparam('id')).order_by(_view.c.id)
+
+
+class AuthorBooksRepository(BaseAsyncRepository):
+    """
+    Books of an author from author_book joined to the book_view projection, in one query.
+
+    A book comes with the names of its authors from book_view, so expanding an author's books does not look
+    each book up by the IDs in AuthorDTO.books. The id is always returned, other fields only when selected.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    # Ordered by book id, None when the author does not exist
+    async def fetch_by_author(self, author_id: int,
+                              fields: Optional[Sequence[BookField]] = None) -> Optional[List[Dict[str, Any]]]:
+        selected = tuple(field.value for field in BookField
+                         if fields is None or field is BookField.ID or field in fields)
+
+        rows = (await self.session.execute(_fetch_books(selected), {'id': author_id})).all()
+        if not rows:
+            return None
+        return [dict(zip(selected, row[1:])) for row in rows if row.id is not None]
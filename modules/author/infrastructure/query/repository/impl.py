@@ -1,16 +1,68 @@
+from functools import lru_cache
 from pymfdata.rdb.repository import AsyncSession, BaseAsyncRepository
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql import Select
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 
+from core.sqlalchemy import LoadStrategy, any_of_param, load_option
 from modules.author.infrastructure.query.dto import AuthorDTO
 from modules.author.infrastructure.query.repository.protocol import AuthorQueryRepository
 
+STREAM_BATCH_SIZE = 1000
+
+# Criteria of the hot queries, values are bound at execution. Snowflake ids are positive, so after=0 is the first page
+_CRITERIA = {
+    'fetch_by_id': lambda stmt, dialect: stmt.where(AuthorDTO.id == bindparam('id')),
+    'fetch_by_ids': lambda stmt, dialect: stmt.where(any_of_param(AuthorDTO.id, 'ids', dialect)),
+    'fetch_page': lambda stmt, dialect: stmt.where(AuthorDTO.id > bindparam('after')).order_by(AuthorDTO.id)
+    .limit(bindparam('limit'))
+}
+
+
+# Built on first use and reused, see BookAlchemyRepository
+@lru_cache(maxsize=None)
+def _cached_select(method: str, strategy: LoadStrategy, dialect: str) -> Select:
+    return _CRITERIA[method](select(AuthorDTO).options(load_option(strategy, AuthorDTO.author_books)), dialect)
+
+
+@lru_cache(maxsize=None)
+def _stream_select() -> Select:
+    return select(AuthorDTO).options(selectinload(AuthorDTO.author_books)).where(AuthorDTO.id > bindparam('after')) \
+        .order_by(AuthorDTO.id).execution_options(yield_per=STREAM_BATCH_SIZE)
+
 
 class AuthorAlchemyRepository(BaseAsyncRepository, AuthorQueryRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    # Loading strategy of AuthorDTO.author_books per method, a single author is cheapest with a join
+    strategies: Dict[str, LoadStrategy] = {
+        'fetch_by_id': LoadStrategy.JOINED,
+        'fetch_by_ids': LoadStrategy.SELECTIN,
+        'fetch_page': LoadStrategy.SELECTIN
+    }
+
+    def __init__(self, session: AsyncSession, strategies: Optional[Dict[str, LoadStrategy]] = None) -> None:
         self._session = session
+        if strategies:
+            self.strategies = {**self.strategies, **strategies}
 
-    async def fetch_by_id(self, _id: int) -> AuthorDTO:
-        stmt = select(AuthorDTO).where(AuthorDTO.id == _id)
+    def _statement(self, method: str) -> Select:
+        return _cached_select(method, self.strategies[method], self.session.bind.dialect.name)
 
-        result = await self.session.execute(stmt)
+    async def fetch_by_id(self, _id: int) -> AuthorDTO:
+        result = await self.session.execute(self._statement('fetch_by_id'), {'id': _id})
         return result.unique().scalars().one_or_none()
+
+    # One query for the whole batch, results follow the order of ids (None where an author is missing)
+    async def fetch_by_ids(self, ids: Sequence[int]) -> List[Optional[AuthorDTO]]:
+        result = await self.session.execute(self._statement('fetch_by_ids'), {'ids': list(ids)})
+        authors = {author.id: author for author in result.unique().scalars()}
+        return [authors.get(_id) for _id in ids]
+
+    # Keyset pagination on the snowflake id
+    async def fetch_page(self, after: Optional[int], limit: int) -> List[AuthorDTO]:
+        result = await self.session.execute(self._statement('fetch_page'), {'after': after or 0, 'limit': limit})
+        return result.unique().scalars().fetchall()
+
+    # Joined eager loading can not be combined with yield_per, books are loaded per batch instead
+    async def stream(self, after: Optional[int] = None) -> AsyncIterator[AuthorDTO]:
+        return await self.session.stream_scalars(_stream_select(), {'after': after or 0})
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Protocol
+from typing import AsyncIterator, List, Optional, Protocol, Sequence
 
 from modules.author.infrastructure.query.dto import AuthorDTO
 
@@ -8,3 +8,15 @@ class AuthorQueryRepository(Protocol):
     @abstractmethod
     async def fetch_by_id(self, _id: int) -> AuthorDTO:
         ...
+
+    @abstractmethod
+    async def fetch_by_ids(self, ids: Sequence[int]) -> List[Optional[AuthorDTO]]:
+        ...
+
+    @abstractmethod
+    async def fetch_page(self, after: Optional[int], limit: int) -> List[AuthorDTO]:
+        ...
+
+    @abstractmethod
+    async def stream(self, after: Optional[int] = None) -> AsyncIterator[AuthorDTO]:
+        ...
@@ -0,0 +1,88 @@
+from functools import lru_cache
+from pymfdata.rdb.repository import AsyncSession, BaseAsyncRepository
+from sqlalchemy import bindparam, select
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+
+from core.sqlalchemy import any_of_param
+from modules.author.infrastructure.query.dto import AuthorRecord
+from modules.author.infrastructure.query.repository.protocol import AuthorQueryRepository
+from persistence.author.entity import AuthorBookEntity, AuthorEntity
+
+STREAM_BATCH_SIZE = 1000
+
+_author = AuthorEntity.__table__
+_author_book = AuthorBookEntity.__table__
+_columns = select(_author.c.id, _author.c.first_name, _author.c.last_name, _author.c.age, _author.c.biography,
+                  _author.c.version, _author.c.updated_at)
+
+# Hot queries built once and reused with bind parameters, see BookAlchemyRepository
+FETCH_PAGE = _columns.where(_author.c.id > bindparam('after')).order_by(_author.c.id).limit(bindparam('limit'))
+STREAM = _columns.where(_author.c.id > bindparam('after')).order_by(_author.c.id) \
+    .execution_options(yield_per=STREAM_BATCH_SIZE)
+
+
+@lru_cache(maxsize=None)
+def _fetch_by_ids(dialect: str) -> Select:
+    return _columns.where(any_of_param(_author.c.id, 'ids', dialect))
+
+
+@lru_cache(maxsize=None)
+def _fetch_books(dialect: str) -> Select:
+    return select(_author_book.c.author_id, _author_book.c.book_id) \
+        .where(any_of_param(_author_book.c.author_id, 'ids', dialect))
+
+
+class AuthorRecordRepository(BaseAsyncRepository, AuthorQueryRepository):
+    """
+    Core query mode, plain column selects materialized into AuthorRecord tuples.
+
+    Nothing is added to the session identity map. Books are read with one more select per batch
+    of authors, the same shape as selectin loading.
+    """
+
+    author = _author
+    author_book = _author_book
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def _records(self, rows: Sequence[Row]) -> List[AuthorRecord]:
+        if not rows:
+            return []
+
+        stmt = _fetch_books(self.session.bind.dialect.name)
+
+        books: Dict[int, List[int]] = {}
+        for author_id, book_id in await self.session.execute(stmt, {'ids': [row.id for row in rows]}):
+            books.setdefault(author_id, []).append(book_id)
+
+        return [AuthorRecord(*row, tuple(books.get(row.id, ()))) for row in rows]
+
+    async def fetch_by_id(self, _id: int) -> Optional[AuthorRecord]:
+        return (await self.fetch_by_ids([_id]))[0]
+
+    async def fetch_by_ids(self, ids: Sequence[int]) -> List[Optional[AuthorRecord]]:
+        result = await self.session.execute(_fetch_by_ids(self.session.bind.dialect.name), {'ids': list(ids)})
+
+        authors = {author.id: author for author in await self._records(result.all())}
+        return [authors.get(_id) for _id in ids]
+
+    async def fetch_page(self, after: Optional[int], limit: int) -> List[AuthorRecord]:
+        result = await self.session.execute(FETCH_PAGE, {'after': after or 0, 'limit': limit})
+        return await self._records(result.all())
+
+    async def stream(self, after: Optional[int] = None) -> 'AuthorRecordStream':
+        return AuthorRecordStream(self, await self.session.stream(STREAM, {'after': after or 0}))
+
+
+# Same partitions() interface as the ORM stream result, each batch of rows gets its books attached
+class AuthorRecordStream:
+    def __init__(self, repository: AuthorRecordRepository, result) -> None:
+        self._repository = repository
+        self._result = result
+
+    async def partitions(self) -> AsyncIterator[List[AuthorRecord]]:
+        async for rows in self._result.partitions():
+            yield await self._repository._records(rows)
@@ -1,14 +1,34 @@
 from pymfdata.rdb.connection import AsyncEngine
 from pymfdata.rdb.usecase import AsyncSQLAlchemyUnitOfWork
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Optional
 
+from core.replica import ReplicaRouter
+from core.sqlalchemy import LoadStrategy
+from modules.author.infrastructure.query.repository.books import AuthorBooksRepository
 from modules.author.infrastructure.query.repository.impl import AuthorAlchemyRepository, AuthorQueryRepository
+from modules.author.infrastructure.query.repository.record import AuthorRecordRepository
+from persistence.author.entity import AuthorEntity
+from persistence.version import VersionRepository
 
 
 class AuthorQueryUnitOfWork(AsyncSQLAlchemyUnitOfWork):
-    def __init__(self, engine: AsyncEngine) -> None:
+    def __init__(self, engine: AsyncEngine, router: Optional[ReplicaRouter] = None,
+                 strategies: Optional[Dict[str, LoadStrategy]] = None, records: bool = False) -> None:
         super().__init__(engine)
+        self._records = records
+        self._router = router
+        self._strategies = strategies
 
+    # self._engine stays the primary, the read engine is picked again on every enter
     async def __aenter__(self):
-        await super().__aenter__()
+        engine = self._router.read_engine() if self._router is not None else self._engine
+        self._session = AsyncSession(engine)
 
-        self.repository: AuthorQueryRepository = AuthorAlchemyRepository(self.session)
+        # records: Core selects into AuthorRecord tuples, otherwise mapped AuthorDTO objects
+        if self._records:
+            self.repository: AuthorQueryRepository = AuthorRecordRepository(self.session)
+        else:
+            self.repository: AuthorQueryRepository = AuthorAlchemyRepository(self.session, self._strategies)
+        self.versions = VersionRepository(self.session, AuthorEntity.__table__)
+        self.books = AuthorBooksRepository(self.session)
@@ -1,7 +1,8 @@
 from pymfdata.common.usecase import BaseUseCase
 from pymfdata.rdb.transaction import async_transactional
 
-from modules.author.domain.aggregate.model import Author
+from core.metrics import timed_use_case
+from core.sqlalchemy import retry_on_stale
 from modules.author.infrastructure.persistence.uow import AuthorPersistenceUnitOfWork
 
 from .command import AddBookToAuthorCommand
@@ -11,9 +12,11 @@ class AddBookToAuthorUseCase(BaseUseCase[AuthorPersistenceUnitOfWork]):
     def __init__(self, uow: AuthorPersistenceUnitOfWork) -> None:
         self._uow = uow
 
+    @timed_use_case()
+    @retry_on_stale()
     @async_transactional()
-    async def invoke(self, command: AddBookToAuthorCommand) -> Author:
+    async def invoke(self, command: AddBookToAuthorCommand) -> bool:
         author = await self.uow.repository.find_by_pk(command.author_id)
-        author.add_book(command)
 
-        return author
+        # Not the author, pymfdata refreshes a returned aggregate after commit. A redelivery changes nothing
+        return author.add_book(command)
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import List
+
+from modules.author.domain.aggregate.id import AuthorId
+from modules.book.domain.aggregate.id import BookId
+
+
+class AddBookToAuthorsCommand(BaseModel):
+    book_id: BookId
+    author_ids: List[AuthorId]
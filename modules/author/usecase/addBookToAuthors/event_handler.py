@@ -0,0 +1,17 @@
+from common.protocols.event import BaseEvent
+from modules.author.domain.aggregate.id import AuthorId
+from modules.book.domain.aggregate.id import BookId
+from modules.book.domain.event import AuthorsAddedToBookDomainEvent
+
+from .command import AddBookToAuthorsCommand
+from .impl import AddBookToAuthorsUseCase
+
+
+class AddBookToAuthorsEventHandler(BaseEvent):
+    def __init__(self, uc: AddBookToAuthorsUseCase) -> None:
+        self.uc = uc
+
+    async def handle(self, param: AuthorsAddedToBookDomainEvent = None) -> None:
+        command = AddBookToAuthorsCommand(book_id=BookId(param.book_id),
+                                          author_ids=list(map(AuthorId, param.author_ids)))
+        await self.uc.invoke(command)
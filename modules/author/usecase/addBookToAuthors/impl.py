@@ -0,0 +1,18 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+
+from core.metrics import timed_use_case
+from modules.author.infrastructure.persistence.uow import AuthorPersistenceUnitOfWork
+
+from .command import AddBookToAuthorsCommand
+
+
+class AddBookToAuthorsUseCase(BaseUseCase[AuthorPersistenceUnitOfWork]):
+    def __init__(self, uow: AuthorPersistenceUnitOfWork) -> None:
+        self._uow = uow
+
+    # Set based instead of loading every Author aggregate, returns the number of rows inserted
+    @timed_use_case()
+    @async_transactional()
+    async def invoke(self, command: AddBookToAuthorsCommand) -> int:
+        return await self.uow.repository.add_book_to_authors(command.book_id, command.author_ids)
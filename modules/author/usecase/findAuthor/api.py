@@ -0,0 +1,23 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Path, Request
+
+from common.errors.exception import NotFoundException
+from container import Container
+from core.fastapi.caching import HttpCache
+from modules.author.domain.aggregate.id import AuthorId
+from modules.author.usecase import router
+from modules.author.usecase.findAuthor.impl import FindAuthorUseCase
+
+
+@router.get(path="/{id}", name="Find author")
+@inject
+async def find_author(request: Request, id: AuthorId = Path(..., title="Author ID"),
+                      uc: FindAuthorUseCase = Depends(Provide[Container.find_author_use_case]),
+                      http_cache: HttpCache = Depends(Provide[Container.http_cache])):
+    async def load():
+        author = await uc.invoke(id)
+        if author is None:
+            raise NotFoundException
+        return author
+
+    return await http_cache.respond(request, lambda: uc.entity_tag(id), load, one=True)
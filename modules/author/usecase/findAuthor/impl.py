@@ -0,0 +1,24 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+from typing import Any, Dict, Optional
+
+from core.etag import EntityTag
+from core.metrics import timed_use_case
+from modules.author.infrastructure.query.uow import AuthorQueryUnitOfWork
+
+
+class FindAuthorUseCase(BaseUseCase[AuthorQueryUnitOfWork]):
+    def __init__(self, uow: AuthorQueryUnitOfWork) -> None:
+        self._uow = uow
+
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def invoke(self, _id: int) -> Optional[Dict[str, Any]]:
+        author = await self.uow.repository.fetch_by_id(_id)
+        return author.to_dict() if author else None
+
+    # From the version columns, without loading the author
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def entity_tag(self, _id: int) -> EntityTag:
+        return EntityTag.of(await self.uow.versions.fetch_by_ids([_id]))
@@ -0,0 +1,23 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Path, Query
+from typing import List, Optional
+
+from common.errors.exception import NotFoundException
+from container import Container
+from core.fastapi.responses import ORJSONResponse
+from modules.author.domain.aggregate.id import AuthorId
+from modules.author.infrastructure.query.repository.books import BookField
+from modules.author.usecase import router
+from modules.author.usecase.findAuthorBooks.impl import FindAuthorBooksUseCase
+
+
+# Not conditional, like GET /books/{id} the books carry author names that are not versioned with them
+@router.get(path="/{id}/books", name="List books of an author")
+@inject
+async def find_author_books(id: AuthorId = Path(..., title="Author ID"),
+                            fields: Optional[List[BookField]] = Query(None, title="Book fields to return, id always"),
+                            uc: FindAuthorBooksUseCase = Depends(Provide[Container.find_author_books_use_case])):
+    books = await uc.invoke(id, fields)
+    if books is None:
+        raise NotFoundException
+    return ORJSONResponse(books)
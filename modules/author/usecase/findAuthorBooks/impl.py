@@ -0,0 +1,18 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.metrics import timed_use_case
+from modules.author.infrastructure.query.repository.books import BookField
+from modules.author.infrastructure.query.uow import AuthorQueryUnitOfWork
+
+
+class FindAuthorBooksUseCase(BaseUseCase[AuthorQueryUnitOfWork]):
+    def __init__(self, uow: AuthorQueryUnitOfWork) -> None:
+        self._uow = uow
+
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def invoke(self, author_id: int,
+                     fields: Optional[Sequence[BookField]] = None) -> Optional[List[Dict[str, Any]]]:
+        return await self.uow.books.fetch_by_author(author_id, fields)
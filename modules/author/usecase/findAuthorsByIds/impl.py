@@ -0,0 +1,29 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+from typing import Any, Dict, List, Optional
+
+from core.dataloader import DataLoader
+from core.etag import EntityTag
+from core.metrics import timed_use_case
+from modules.author.infrastructure.query.uow import AuthorQueryUnitOfWork
+
+MAX_IDS = 100
+
+
+class FindAuthorsByIdsUseCase(BaseUseCase[AuthorQueryUnitOfWork]):
+    def __init__(self, uow: AuthorQueryUnitOfWork) -> None:
+        self._uow = uow
+        # The container builds the use case per request, so lookups are only coalesced within a request
+        self.loader: DataLoader[int, Optional[Dict[str, Any]]] = DataLoader(self.invoke, max_batch_size=MAX_IDS)
+
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def invoke(self, ids: List[int]) -> List[Optional[Dict[str, Any]]]:
+        authors = await self.uow.repository.fetch_by_ids(ids)
+        return [author.to_dict() if author else None for author in authors]
+
+    # From the version columns, without loading the authors
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def entity_tag(self, ids: List[int]) -> EntityTag:
+        return EntityTag.of(await self.uow.versions.fetch_by_ids(ids))
@@ -0,0 +1,31 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Query, Request
+from typing import List, Optional
+
+from container import Container
+from core.fastapi.caching import HttpCache
+from core.fastapi.responses import NDJSONStreamingResponse, ORJSONResponse
+from modules.author.usecase import router
+from modules.author.usecase.findAuthorsByIds.impl import MAX_IDS, FindAuthorsByIdsUseCase
+from modules.author.usecase.listAuthors.impl import ListAuthorsUseCase
+
+
+@router.get(path='', name="List authors")
+@inject
+async def list_authors(request: Request,
+                       ids: Optional[List[int]] = Query(None, max_items=MAX_IDS, title="Author IDs, in response order"),
+                       cursor: Optional[int] = Query(None, title="Last Author ID of the previous page"),
+                       limit: int = Query(50, ge=1, le=1000, title="Page size"),
+                       stream: bool = Query(False, title="Stream every author after the cursor as NDJSON"),
+                       uc: ListAuthorsUseCase = Depends(Provide[Container.list_authors_use_case]),
+                       ids_uc: FindAuthorsByIdsUseCase = Depends(Provide[Container.find_authors_by_ids_use_case]),
+                       http_cache: HttpCache = Depends(Provide[Container.http_cache])):
+    # Lookups clients poll, a 304 when the versions did not change (probed only for a conditional request)
+    if ids is not None:
+        return await http_cache.respond(request, lambda: ids_uc.entity_tag(ids),
+                                        lambda: ids_uc.loader.load_many(ids))
+
+    if stream:
+        return NDJSONStreamingResponse(uc.stream(cursor))
+
+    return ORJSONResponse(await uc.invoke(cursor, limit))
@@ -0,0 +1,27 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from core.metrics import timed_use_case
+from modules.author.infrastructure.query.uow import AuthorQueryUnitOfWork
+
+
+class ListAuthorsUseCase(BaseUseCase[AuthorQueryUnitOfWork]):
+    def __init__(self, uow: AuthorQueryUnitOfWork) -> None:
+        self._uow = uow
+
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def invoke(self, cursor: Optional[int], limit: int) -> Dict[str, Any]:
+        authors = await self.uow.repository.fetch_page(cursor, limit)
+        return {
+            'items': [author.to_dict() for author in authors],
+            'next_cursor': authors[-1].id if len(authors) == limit else None
+        }
+
+    # The session stays open while the response is streamed, one batch of rows at a time
+    async def stream(self, cursor: Optional[int]) -> AsyncIterator[List[Dict[str, Any]]]:
+        async with self.uow:
+            result = await self.uow.repository.stream(cursor)
+            async for authors in result.partitions():
+                yield [author.to_dict() for author in authors]
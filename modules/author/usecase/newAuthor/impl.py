@@ -1,7 +1,9 @@
 from pymfdata.common.usecase import BaseUseCase
 from pymfdata.rdb.transaction import async_transactional
 
+from core.metrics import timed_use_case
 from modules.author.domain.aggregate.model import Author
+from modules.author.domain.event import AuthorsChangedDomainEvent
 from modules.author.infrastructure.persistence.uow import AuthorPersistenceUnitOfWork
 
 from .command import NewAuthorCommand
@@ -11,8 +13,12 @@ class NewAuthorUseCase(BaseUseCase[AuthorPersistenceUnitOfWork]):
     def __init__(self, uow: AuthorPersistenceUnitOfWork) -> None:
         self._uow = uow
 
+    @timed_use_case()
     @async_transactional()
     async def invoke(self, command: NewAuthorCommand) -> Author:
         author = Author.new_author(command)
         self.uow.repository.create(author)
+
+        # Books may list the author before it exists, the outbox dispatcher puts the name into their book_view rows
+        await self.uow.outbox.put(AuthorsChangedDomainEvent.construct(author_ids=[author.id]))
         return author
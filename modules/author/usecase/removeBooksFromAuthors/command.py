@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+from typing import List
+
+from modules.book.domain.aggregate.id import BookId
+
+
+class RemoveBooksFromAuthorsCommand(BaseModel):
+    book_ids: List[BookId]
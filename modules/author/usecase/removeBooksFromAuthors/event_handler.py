@@ -0,0 +1,14 @@
+from common.protocols.event import BaseEvent
+from modules.book.domain.aggregate.id import BookId
+from modules.book.domain.event import BooksDeletedDomainEvent
+
+from .command import RemoveBooksFromAuthorsCommand
+from .impl import RemoveBooksFromAuthorsUseCase
+
+
+class RemoveBooksFromAuthorsEventHandler(BaseEvent):
+    def __init__(self, uc: RemoveBooksFromAuthorsUseCase) -> None:
+        self.uc = uc
+
+    async def handle(self, param: BooksDeletedDomainEvent = None) -> None:
+        await self.uc.invoke(RemoveBooksFromAuthorsCommand(book_ids=list(map(BookId, param.book_ids))))
@@ -0,0 +1,18 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+
+from core.metrics import timed_use_case
+from modules.author.infrastructure.persistence.uow import AuthorPersistenceUnitOfWork
+
+from .command import RemoveBooksFromAuthorsCommand
+
+
+class RemoveBooksFromAuthorsUseCase(BaseUseCase[AuthorPersistenceUnitOfWork]):
+    def __init__(self, uow: AuthorPersistenceUnitOfWork) -> None:
+        self._uow = uow
+
+    # Returns the number of rows deleted
+    @timed_use_case()
+    @async_transactional()
+    async def invoke(self, command: RemoveBooksFromAuthorsCommand) -> int:
+        return await self.uow.repository.remove_books(command.book_ids)
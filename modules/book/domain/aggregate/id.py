@@ -1,6 +1,7 @@
 from pydantic import PositiveInt
+from typing import List
 
-from core.snowflake import seq
+from core import snowflake
 
 
 class BookId(PositiveInt):
@@ -8,4 +9,8 @@ class BookId(PositiveInt):
 
     @staticmethod
     def next_id() -> 'BookId':
-        return BookId(seq.__next__())
+        return BookId(snowflake.allocator().next_id())
+
+    @staticmethod
+    def next_ids(n: int) -> List['BookId']:
+        return list(map(BookId, snowflake.allocator().next_ids(n)))
@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
 from typing import List
 
+from modules.author.domain.aggregate.id import AuthorId
 from modules.book.domain.value_objects import Title, Isbn, Page, KoreanMoney, Year, BookAuthor
 from modules.book.usecase.addAuthor.command import AddAuthorCommand
+from modules.book.usecase.addAuthors.command import AddAuthorsCommand
 from modules.book.usecase.newBook.command import NewBookCommand
 
 from .id import BookId
@@ -18,9 +20,24 @@ class Book:
     publication_year: Year
     authors: List[BookAuthor] = field(default_factory=list)
 
+    # The command is validated, its fields are passed as they are instead of through command.dict()
     @staticmethod
     def new_book(command: NewBookCommand) -> 'Book':
-        return Book(id=BookId.next_id(), **command.dict())
+        return Book(id=BookId.next_id(), title=command.title, isbn=command.isbn, pages=command.pages,
+                    price=command.price, publication_year=command.publication_year)
+
+    @staticmethod
+    def new_books(commands: List[NewBookCommand]) -> List['Book']:
+        return [Book(id=_id, title=command.title, isbn=command.isbn, pages=command.pages, price=command.price,
+                     publication_year=command.publication_year)
+                for _id, command in zip(BookId.next_ids(len(commands)), commands)]
 
     def add_author(self, command: AddAuthorCommand):
         self.authors.append(BookAuthor(book_id=self.id, author_id=command.author_id))
+
+    # Returns the authors that were not attached yet, duplicates in the command are ignored
+    def add_authors(self, command: AddAuthorsCommand) -> List[AuthorId]:
+        attached = {author.author_id for author in self.authors}
+        added = [author_id for author_id in dict.fromkeys(command.author_ids) if author_id not in attached]
+        self.authors.extend(BookAuthor(book_id=self.id, author_id=author_id) for author_id in added)
+        return added
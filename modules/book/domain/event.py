@@ -1,6 +1,21 @@
 from pydantic import BaseModel
+from typing import List
 
 
 class AuthorAddedToBookDomainEvent(BaseModel):
     book_id: int
     author_id: int
+
+
+class AuthorsAddedToBookDomainEvent(BaseModel):
+    book_id: int
+    author_ids: List[int]
+
+
+class BooksDeletedDomainEvent(BaseModel):
+    book_ids: List[int]
+
+
+class BooksChangedDomainEvent(BaseModel):
+    book_ids: List[int] = []
+    titles: List[str] = []
@@ -1,7 +1,6 @@
 from pydantic import PositiveInt
-from pydantic.dataclasses import dataclass
 
-from core.pydantic import ConStr
+from core.pydantic import ConStr, value_object
 from modules.author.domain.aggregate.id import AuthorId
 from modules.book.domain.aggregate.id import BookId
 
@@ -28,7 +27,7 @@ class Year(PositiveInt):
     gt = 1
 
 
-@dataclass
+@value_object
 class BookAuthor:
     book_id: BookId
     author_id: AuthorId
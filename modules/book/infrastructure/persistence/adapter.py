@@ -1,14 +1,19 @@
 from pymfdata.common.usecase import BaseUseCase
 from pymfdata.rdb.transaction import async_transactional
 
+from common.protocols.event import BaseEvent
 from common.protocols.persistence_adapter import PersistenceAdapter
+from core.fastapi.event.dispatcher import EventDispatcher
+from core.fastapi.event.handler import event_handler
 from modules.book.domain.aggregate.model import Book, BookId
+from modules.book.domain.event import BooksChangedDomainEvent, BooksDeletedDomainEvent
 
 from .uow import BookPersistenceUnitOfWork
 
 
 class BookPersistenceAdapter(BaseUseCase[BookPersistenceUnitOfWork], PersistenceAdapter[Book, BookId]):
-    def __init__(self, uow: BookPersistenceUnitOfWork) -> None:
+    def __init__(self, uow: BookPersistenceUnitOfWork, event: BaseEvent) -> None:
+        self._event = event
         self._uow = uow
 
     @async_transactional(read_only=True)
@@ -20,8 +25,13 @@ class BookPersistenceAdapter(BaseUseCase[BookPersistenceUnitOfWork], Persistence
         self.uow.repository.create(domain)
         return domain
 
+    # The events of DeleteBookUseCase, published after commit
+    @EventDispatcher()
     @async_transactional()
     async def delete_by_id(self, _id: BookId):
-        entity = await self.uow.repository.find_by_pk(_id)
-        if entity:
-            await self.uow.repository.delete(entity)
+        for book_id, title in await self.uow.repository.delete_many([_id]):
+            await self.uow.outbox.put(BooksDeletedDomainEvent.construct(book_ids=[book_id]))
+
+            changed = BooksChangedDomainEvent.construct(book_ids=[book_id], titles=[title])
+            await self.uow.outbox.put(changed)
+            await event_handler.store(event=self._event, param=changed)
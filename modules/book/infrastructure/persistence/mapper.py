@@ -1,12 +1,27 @@
 from dataclasses import asdict
+from datetime import datetime
 from pymfdata.rdb.mapper import mapper_registry
 from sqlalchemy.orm import backref, relationship
+from typing import NamedTuple, Tuple
 
 from common.protocols.model_mapper import ModelMapper
 from modules.book.domain.aggregate.model import Book, BookId, BookAuthor
 from persistence.book.entity import BookEntity, BookAuthorEntity
 
 
+# What the aggregate cache keeps of a Book
+class BookSnapshot(NamedTuple):
+    id: int
+    title: str
+    isbn: str
+    pages: int
+    price: int
+    publication_year: int
+    version: int
+    updated_at: datetime
+    author_ids: Tuple[int, ...]
+
+
 class BookMapper(ModelMapper[Book, BookEntity]):
     @staticmethod
     def map_to_domain_entity(model: BookEntity) -> Book:
@@ -24,14 +39,30 @@ class BookMapper(ModelMapper[Book, BookEntity]):
     def map_to_persistence_entity(model: Book) -> BookEntity:
         return BookEntity(**asdict(model))
 
+    @staticmethod
+    def map_to_snapshot(model: Book) -> BookSnapshot:
+        return BookSnapshot(model.id, model.title, model.isbn, model.pages, model.price, model.publication_year,
+                            model.version, model.updated_at, tuple(author.author_id for author in model.authors))
+
+    # version and updated_at are mapped columns, not fields of the domain dataclass
+    @staticmethod
+    def map_from_snapshot(snapshot: BookSnapshot) -> Book:
+        book = Book(id=BookId(snapshot.id), title=snapshot.title, isbn=snapshot.isbn, pages=snapshot.pages,
+                    price=snapshot.price, publication_year=snapshot.publication_year,
+                    authors=[BookAuthor(book_id=snapshot.id, author_id=_id) for _id in snapshot.author_ids])
+        book.version = snapshot.version
+        book.updated_at = snapshot.updated_at
+        return book
+
 
 def start_mapper():
     t = BookEntity.__table__
     rt = BookAuthorEntity.__table__
 
-    mapper_registry.map_imperatively(Book, t, properties={
-        'authors': relationship(BookAuthor, backref=backref("book"), lazy='joined')
+    # The version is set by the before_flush listener of version_aggregates (installed in app startup)
+    mapper_registry.map_imperatively(Book, t, version_id_col=t.c.version, version_id_generator=False, properties={
+        'authors': relationship(BookAuthor, backref=backref("book"), lazy='selectin')
     })
     mapper_registry.map_imperatively(BookAuthor, rt, properties={
-        'books': relationship(Book, backref=backref("author", cascade="all, delete-orphan"), lazy='joined')
+        'books': relationship(Book, backref=backref("author", cascade="all, delete-orphan"), lazy='selectin')
     })
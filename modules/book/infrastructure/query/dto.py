@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from datetime import datetime
 from sqlalchemy.ext.associationproxy import association_proxy
-from typing import FrozenSet
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Tuple
 
 
 @dataclass
@@ -9,4 +10,40 @@ class BookDTO:
     title: str
     isbn: str
     pages: int
+    version: int
+    updated_at: datetime
     authors: FrozenSet[int] = association_proxy("book_authors", "author_id")
+
+    # Reads book_authors directly, going through the association proxy costs a proxy object per call
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(id=self.id, title=self.title, isbn=self.isbn, pages=self.pages, version=self.version,
+                    updated_at=self.updated_at, authors=[author.author_id for author in self.book_authors])
+
+
+# Read model of the Core query mode, an immutable tuple without ORM instrumentation or identity map entry
+class BookRecord(NamedTuple):
+    id: int
+    title: str
+    isbn: str
+    pages: int
+    version: int
+    updated_at: datetime
+    authors: Tuple[int, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(id=self.id, title=self.title, isbn=self.isbn, pages=self.pages, version=self.version,
+                    updated_at=self.updated_at, authors=list(self.authors))
+
+
+# Read model of GET /books/{id}, a book_view row with the authors embedded as {id, first_name, last_name}
+class BookView(NamedTuple):
+    id: int
+    title: str
+    isbn: str
+    pages: int
+    version: int
+    updated_at: datetime
+    authors: List[Dict[str, Any]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
@@ -0,0 +1,49 @@
+from pymfdata.rdb.connection import AsyncEngine
+from typing import Optional
+
+from common.protocols.event import BaseEvent
+from core.cache import LRUCache
+from core.invalidation import CacheInvalidationChannel
+from modules.author.domain.event import AuthorsChangedDomainEvent
+from modules.book.domain.event import BooksChangedDomainEvent
+from modules.book.infrastructure.query.projection import BookViewProjection
+from modules.book.infrastructure.query.repository.cache import BookCachedRepository
+from modules.book.infrastructure.query.search import BookSearchIndex
+
+
+# Published after commit: this worker drops the entries right away, the others when the channel notifies them
+class BookCacheInvalidationEventHandler(BaseEvent):
+    def __init__(self, cache: LRUCache, channel: Optional[CacheInvalidationChannel] = None) -> None:
+        self.cache = cache
+        self.channel = channel
+
+    async def handle(self, param: BooksChangedDomainEvent = None) -> None:
+        keys = BookCachedRepository.keys(book_ids=param.book_ids, titles=param.titles)
+        self.cache.invalidate(*keys)
+        if self.channel is not None:
+            await self.channel.publish(keys)
+
+
+class BookSearchIndexEventHandler(BaseEvent):
+    def __init__(self, index: BookSearchIndex, engine: AsyncEngine) -> None:
+        self.index = index
+        self.engine = engine
+
+    async def handle(self, param: BooksChangedDomainEvent = None) -> None:
+        await self.index.refresh(self.engine, param.book_ids)
+
+
+class BookViewProjectionEventHandler(BaseEvent):
+    def __init__(self, projection: BookViewProjection) -> None:
+        self.projection = projection
+
+    async def handle(self, param: BooksChangedDomainEvent = None) -> None:
+        await self.projection.refresh(param.book_ids)
+
+
+class BookViewAuthorsEventHandler(BaseEvent):
+    def __init__(self, projection: BookViewProjection) -> None:
+        self.projection = projection
+
+    async def handle(self, param: AuthorsChangedDomainEvent = None) -> None:
+        await self.projection.refresh_authors(param.author_ids)
@@ -0,0 +1,97 @@
+from pymfdata.rdb.connection import AsyncEngine
+from sqlalchemy import delete, exists, insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from core.sqlalchemy import any_of
+from persistence.author.entity import AuthorEntity
+from persistence.book.entity import BookAuthorEntity, BookEntity, BookViewEntity
+
+_book = BookEntity.__table__
+_book_author = BookAuthorEntity.__table__
+_author = AuthorEntity.__table__
+_view = BookViewEntity.__table__
+
+
+class BookViewProjection:
+    """
+    Keeps book_view, one row per book with the names of its authors embedded.
+
+    The rows of the books an event names are read again from book, book_author and author and replaced, so an
+    event the outbox delivers twice or late still leaves the current state. The book rows are locked while they
+    are read (on PostgreSQL), a refresh then can not overwrite the one of a later write to the same book.
+    """
+
+    def __init__(self, engine: AsyncEngine, batch_size: int = 1000) -> None:
+        self._engine = engine
+        self.batch_size = batch_size
+
+    async def refresh(self, book_ids: Iterable[int]) -> None:
+        book_ids = list(book_ids)
+        if not book_ids:
+            return
+
+        async with self._engine.begin() as conn:
+            await self._refresh(conn, book_ids)
+
+    # Books listing the authors, their rows carry the names
+    async def refresh_authors(self, author_ids: Iterable[int]) -> None:
+        author_ids = list(author_ids)
+        if not author_ids:
+            return
+
+        async with self._engine.begin() as conn:
+            result = await conn.execute(select(_book_author.c.book_id).distinct()
+                                        .where(any_of(_book_author.c.author_id, author_ids, conn.dialect.name)))
+            book_ids = result.scalars().all()
+            for start in range(0, len(book_ids), self.batch_size):
+                await self._refresh(conn, book_ids[start:start + self.batch_size])
+
+    # Every book in id order, one transaction per batch, then the rows of deleted books. Returns the book count
+    async def rebuild(self, progress: Optional[Callable[[int], None]] = None) -> int:
+        return await self._sweep(missing=False, progress=progress)
+
+    # Only books without a row, e.g. all of them on the first start after book_view was added. app startup runs it
+    async def backfill(self) -> int:
+        return await self._sweep(missing=True)
+
+    async def _sweep(self, missing: bool, progress: Optional[Callable[[int], None]] = None) -> int:
+        after, count = 0, 0
+        while True:
+            async with self._engine.begin() as conn:
+                stmt = select(_book.c.id).where(_book.c.id > after).order_by(_book.c.id).limit(self.batch_size)
+                if missing:
+                    stmt = stmt.where(~exists().where(_view.c.id == _book.c.id))
+
+                book_ids = (await conn.execute(stmt)).scalars().all()
+                if not book_ids:
+                    break
+                await self._refresh(conn, book_ids)
+
+            after, count = book_ids[-1], count + len(book_ids)
+            if progress is not None:
+                progress(len(book_ids))
+
+        async with self._engine.begin() as conn:
+            await conn.execute(delete(_view).where(~exists().where(_book.c.id == _view.c.id)))
+        return count
+
+    async def _refresh(self, conn: AsyncConnection, book_ids: List[int]) -> None:
+        dialect = conn.dialect.name
+        books = (await conn.execute(select(_book.c.id, _book.c.title, _book.c.isbn, _book.c.pages, _book.c.version,
+                                           _book.c.updated_at)
+                                    .where(any_of(_book.c.id, book_ids, dialect)).with_for_update())).all()
+
+        authors: Dict[int, List[Dict[str, Any]]] = {}
+        result = await conn.execute(
+            select(_book_author.c.book_id, _book_author.c.author_id, _author.c.first_name, _author.c.last_name)
+            .select_from(_book_author.outerjoin(_author, _author.c.id == _book_author.c.author_id))
+            .where(any_of(_book_author.c.book_id, book_ids, dialect))
+            .order_by(_book_author.c.book_id, _book_author.c.author_id))
+        for book_id, author_id, first_name, last_name in result:
+            authors.setdefault(book_id, []).append(dict(id=author_id, first_name=first_name, last_name=last_name))
+
+        await conn.execute(delete(_view).where(any_of(_view.c.id, book_ids, dialect)))
+        if books:
+            await conn.execute(insert(_view), [dict(book._mapping, authors=authors.get(book.id, []))
+                                               for book in books])
@@ -0,0 +1,94 @@
+from typing import AsyncIterator, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from core.cache import LRUCache
+from core.etag import Version
+from modules.book.infrastructure.query.dto import BookDTO, BookRecord
+from modules.book.infrastructure.query.repository.protocol import BookQueryRepository
+from persistence.version import VersionRepository
+
+
+# Cached entries are immutable BookRecords, every caller can share them
+def _record(book) -> BookRecord:
+    value = book.to_dict()
+    return BookRecord(**dict(value, authors=tuple(value['authors'])))
+
+
+def _version(book: Optional[BookRecord]) -> Optional[Tuple[int, int]]:
+    return (book.id, book.version) if book is not None else None
+
+
+def _current(version: Version) -> Optional[Tuple[int, int]]:
+    return version[:2] if version is not None else None
+
+
+class BookCachedRepository(BookQueryRepository):
+    """
+    Read-through cache decorator, a hit does not touch the database.
+
+    BookCacheInvalidationEventHandler drops the entries of a changed book in this worker and, through the
+    CacheInvalidationChannel, in every other one. With versions (opt in, query_cache.validate_hits) every hit is
+    also checked against the version column with one select of id and version. With fill=False (a read from a
+    replica) the cache is only read.
+    """
+
+    def __init__(self, repository: BookQueryRepository, cache: LRUCache, versions: Optional[VersionRepository] = None,
+                 fill: bool = True) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._versions = versions
+        self._fill = fill
+
+    def _set(self, key: Hashable, value, generation: int) -> None:
+        if self._fill:
+            self._cache.set(key, value, generation)
+
+    @staticmethod
+    def keys(book_ids: Iterable[int] = (), titles: Iterable[str] = ()) -> List[Hashable]:
+        return [('id', _id) for _id in book_ids] + [('title', title) for title in titles]
+
+    async def fetch_by_title(self, title: str) -> List[BookRecord]:
+        key = ('title', title)
+        found, value = self._cache.get(key)
+        if found and (self._versions is None or [_version(book) for book in value] ==
+                      [_current(version) for version in await self._versions.fetch_by('title', title)]):
+            return value
+
+        generation = self._cache.generation
+        value = [_record(book) for book in await self._repository.fetch_by_title(title)]
+        self._set(key, value, generation)
+        return value
+
+    async def fetch_by_id(self, _id: int) -> Optional[BookRecord]:
+        return (await self.fetch_by_ids([_id]))[0]
+
+    # Hits are validated with one select (when enabled), the misses and stale entries are loaded together
+    async def fetch_by_ids(self, ids: Sequence[int]) -> List[Optional[BookRecord]]:
+        values: Dict[int, Optional[BookRecord]] = {}
+        for _id in dict.fromkeys(ids):
+            found, value = self._cache.get(('id', _id))
+            if found:
+                values[_id] = value
+
+        if values and self._versions is not None:
+            hits = list(values)
+            for _id, version in zip(hits, await self._versions.fetch_by_ids(hits)):
+                if _version(values[_id]) != _current(version):
+                    del values[_id]
+
+        misses = [_id for _id in dict.fromkeys(ids) if _id not in values]
+        if misses:
+            generation = self._cache.generation
+            for _id, dto in zip(misses, await self._repository.fetch_by_ids(misses)):
+                values[_id] = _record(dto) if dto else None
+                self._set(('id', _id), values[_id], generation)
+
+        return [values[_id] for _id in ids]
+
+    async def fetch_page(self, after: Optional[int], limit: int) -> List[BookDTO]:
+        return await self._repository.fetch_page(after, limit)
+
+    async def search(self, q: str, limit: int, offset: int) -> List[BookDTO]:
+        return await self._repository.search(q, limit, offset)
+
+    async def stream(self, after: Optional[int] = None) -> AsyncIterator[BookDTO]:
+        return await self._repository.stream(after)
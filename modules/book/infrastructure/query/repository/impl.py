@@ -1,22 +1,102 @@
+from functools import lru_cache
 from pymfdata.rdb.repository import AsyncSession, BaseAsyncRepository
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql import Select
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 
+from core.search import tokenize
+from core.sqlalchemy import LoadStrategy, any_of_param, load_option
 from modules.book.infrastructure.query.dto import BookDTO
 from modules.book.infrastructure.query.repository.protocol import BookQueryRepository
+from modules.book.infrastructure.query.search import BookSearchIndex, title_search
+
+STREAM_BATCH_SIZE = 1000
+
+# Criteria of the hot queries, values are bound at execution. Snowflake ids are positive, so after=0 is the first page
+_CRITERIA = {
+    'fetch_by_title': lambda stmt, dialect: stmt.where(BookDTO.title == bindparam('title')).order_by(BookDTO.id),
+    'fetch_by_id': lambda stmt, dialect: stmt.where(BookDTO.id == bindparam('id')),
+    'fetch_by_ids': lambda stmt, dialect: stmt.where(any_of_param(BookDTO.id, 'ids', dialect)),
+    'fetch_page': lambda stmt, dialect: stmt.where(BookDTO.id > bindparam('after')).order_by(BookDTO.id)
+    .limit(bindparam('limit'))
+}
+
+
+# Built on first use, the query mappers are only started with the app. Reusing the select skips building it and
+# computing its cache key on every call, and the SQL text stays the same for the asyncpg prepared statement cache
+@lru_cache(maxsize=None)
+def _cached_select(method: str, strategy: LoadStrategy, dialect: str) -> Select:
+    return _CRITERIA[method](select(BookDTO).options(load_option(strategy, BookDTO.book_authors)), dialect)
+
+
+@lru_cache(maxsize=None)
+def _stream_select() -> Select:
+    return select(BookDTO).options(selectinload(BookDTO.book_authors)).where(BookDTO.id > bindparam('after')) \
+        .order_by(BookDTO.id).execution_options(yield_per=STREAM_BATCH_SIZE)
 
 
 class BookAlchemyRepository(BaseAsyncRepository, BookQueryRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    # Loading strategy of BookDTO.book_authors per method, a single book is cheapest with a join
+    strategies: Dict[str, LoadStrategy] = {
+        'fetch_by_title': LoadStrategy.SELECTIN,
+        'fetch_by_id': LoadStrategy.JOINED,
+        'fetch_by_ids': LoadStrategy.SELECTIN,
+        'fetch_page': LoadStrategy.SELECTIN,
+        'search': LoadStrategy.SELECTIN
+    }
+
+    def __init__(self, session: AsyncSession, strategies: Optional[Dict[str, LoadStrategy]] = None,
+                 search_index: Optional[BookSearchIndex] = None) -> None:
         self._session = session
+        self._search_index = search_index
+        if strategies:
+            self.strategies = {**self.strategies, **strategies}
 
-    async def fetch_by_title(self, title: str) -> BookDTO:
-        stmt = select(BookDTO).where(BookDTO.title == title)
+    def _select(self, method: str):
+        return select(BookDTO).options(load_option(self.strategies[method], BookDTO.book_authors))
 
-        result = await self.session.execute(stmt)
+    def _statement(self, method: str) -> Select:
+        return _cached_select(method, self.strategies[method], self.session.bind.dialect.name)
+
+    async def fetch_by_title(self, title: str) -> BookDTO:
+        result = await self.session.execute(self._statement('fetch_by_title'), {'title': title})
         return result.unique().scalars().fetchall()
 
     async def fetch_by_id(self, _id: int) -> BookDTO:
-        stmt = select(BookDTO).where(BookDTO.id == _id)
+        result = await self.session.execute(self._statement('fetch_by_id'), {'id': _id})
+        return result.unique().scalars().one_or_none()
+
+    # One query for the whole batch, results follow the order of ids (None where a book is missing)
+    async def fetch_by_ids(self, ids: Sequence[int]) -> List[Optional[BookDTO]]:
+        result = await self.session.execute(self._statement('fetch_by_ids'), {'ids': list(ids)})
+        books = {book.id: book for book in result.unique().scalars()}
+        return [books.get(_id) for _id in ids]
+
+    # Keyset pagination on the snowflake id
+    async def fetch_page(self, after: Optional[int], limit: int) -> List[BookDTO]:
+        result = await self.session.execute(self._statement('fetch_page'), {'after': after or 0, 'limit': limit})
+        return result.unique().scalars().fetchall()
+
+    # Prefix match on every word of q, uses the ix_book_title_search GIN index on Postgres
+    async def search(self, q: str, limit: int, offset: int) -> List[BookDTO]:
+        tokens = tokenize(q)
+        if not tokens:
+            return []
+
+        if self._search_index is not None and self._search_index.enabled:
+            ids = self._search_index.search(q, limit, offset)
+            result = await self.session.execute(
+                _cached_select('fetch_by_ids', self.strategies['search'], self.session.bind.dialect.name), {'ids': ids})
+            books = {book.id: book for book in result.unique().scalars()}
+            return [books[_id] for _id in ids if _id in books]
+
+        condition, rank = title_search(BookDTO.title, tokens)
+        stmt = self._select('search').where(condition).order_by(rank.desc(), BookDTO.id).limit(limit).offset(offset)
 
         result = await self.session.execute(stmt)
-        return result.unique().scalars().one_or_none()
+        return result.unique().scalars().fetchall()
+
+    # Joined eager loading can not be combined with yield_per, authors are loaded per batch instead
+    async def stream(self, after: Optional[int] = None) -> AsyncIterator[BookDTO]:
+        return await self.session.stream_scalars(_stream_select(), {'after': after or 0})
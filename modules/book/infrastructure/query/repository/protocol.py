@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Protocol
+from typing import AsyncIterator, List, Optional, Protocol, Sequence
 
 from modules.book.infrastructure.query.dto import BookDTO
 
@@ -12,3 +12,19 @@ class BookQueryRepository(Protocol):
     @abstractmethod
     async def fetch_by_id(self, _id: int) -> BookDTO:
         ...
+
+    @abstractmethod
+    async def fetch_by_ids(self, ids: Sequence[int]) -> List[Optional[BookDTO]]:
+        ...
+
+    @abstractmethod
+    async def fetch_page(self, after: Optional[int], limit: int) -> List[BookDTO]:
+        ...
+
+    @abstractmethod
+    async def search(self, q: str, limit: int, offset: int) -> List[BookDTO]:
+        ...
+
+    @abstractmethod
+    async def stream(self, after: Optional[int] = None) -> AsyncIterator[BookDTO]:
+        ...
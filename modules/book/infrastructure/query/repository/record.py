@@ -0,0 +1,113 @@
+from functools import lru_cache
+from pymfdata.rdb.repository import AsyncSession, BaseAsyncRepository
+from sqlalchemy import bindparam, select
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import Select
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+
+from core.search import tokenize
+from core.sqlalchemy import any_of_param
+from modules.book.infrastructure.query.dto import BookRecord
+from modules.book.infrastructure.query.repository.protocol import BookQueryRepository
+from modules.book.infrastructure.query.search import BookSearchIndex, title_search
+from persistence.book.entity import BookAuthorEntity, BookEntity
+
+STREAM_BATCH_SIZE = 1000
+
+_book = BookEntity.__table__
+_book_author = BookAuthorEntity.__table__
+_columns = select(_book.c.id, _book.c.title, _book.c.isbn, _book.c.pages, _book.c.version, _book.c.updated_at)
+
+# Hot queries built once and reused with bind parameters, see BookAlchemyRepository
+FETCH_BY_TITLE = _columns.where(_book.c.title == bindparam('title')).order_by(_book.c.id)
+FETCH_PAGE = _columns.where(_book.c.id > bindparam('after')).order_by(_book.c.id).limit(bindparam('limit'))
+STREAM = _columns.where(_book.c.id > bindparam('after')).order_by(_book.c.id) \
+    .execution_options(yield_per=STREAM_BATCH_SIZE)
+
+
+@lru_cache(maxsize=None)
+def _fetch_by_ids(dialect: str) -> Select:
+    return _columns.where(any_of_param(_book.c.id, 'ids', dialect))
+
+
+@lru_cache(maxsize=None)
+def _fetch_authors(dialect: str) -> Select:
+    return select(_book_author.c.book_id, _book_author.c.author_id) \
+        .where(any_of_param(_book_author.c.book_id, 'ids', dialect))
+
+
+class BookRecordRepository(BaseAsyncRepository, BookQueryRepository):
+    """
+    Core query mode, plain column selects materialized into BookRecord tuples.
+
+    Nothing is added to the session identity map. Authors are read with one more select per batch
+    of books, the same shape as selectin loading.
+    """
+
+    book = _book
+    book_author = _book_author
+
+    def __init__(self, session: AsyncSession, search_index: Optional[BookSearchIndex] = None) -> None:
+        self._session = session
+        self._search_index = search_index
+
+    def _select(self):
+        return _columns
+
+    async def _records(self, rows: Sequence[Row]) -> List[BookRecord]:
+        if not rows:
+            return []
+
+        stmt = _fetch_authors(self.session.bind.dialect.name)
+
+        authors: Dict[int, List[int]] = {}
+        for book_id, author_id in await self.session.execute(stmt, {'ids': [row.id for row in rows]}):
+            authors.setdefault(book_id, []).append(author_id)
+
+        return [BookRecord(*row, tuple(authors.get(row.id, ()))) for row in rows]
+
+    async def fetch_by_title(self, title: str) -> List[BookRecord]:
+        result = await self.session.execute(FETCH_BY_TITLE, {'title': title})
+        return await self._records(result.all())
+
+    async def fetch_by_id(self, _id: int) -> Optional[BookRecord]:
+        return (await self.fetch_by_ids([_id]))[0]
+
+    async def fetch_by_ids(self, ids: Sequence[int]) -> List[Optional[BookRecord]]:
+        result = await self.session.execute(_fetch_by_ids(self.session.bind.dialect.name), {'ids': list(ids)})
+
+        books = {book.id: book for book in await self._records(result.all())}
+        return [books.get(_id) for _id in ids]
+
+    async def fetch_page(self, after: Optional[int], limit: int) -> List[BookRecord]:
+        result = await self.session.execute(FETCH_PAGE, {'after': after or 0, 'limit': limit})
+        return await self._records(result.all())
+
+    async def search(self, q: str, limit: int, offset: int) -> List[BookRecord]:
+        tokens = tokenize(q)
+        if not tokens:
+            return []
+
+        if self._search_index is not None and self._search_index.enabled:
+            ids = self._search_index.search(q, limit, offset)
+            return [book for book in await self.fetch_by_ids(ids) if book]
+
+        condition, rank = title_search(self.book.c.title, tokens)
+        stmt = self._select().where(condition).order_by(rank.desc(), self.book.c.id).limit(limit).offset(offset)
+
+        result = await self.session.execute(stmt)
+        return await self._records(result.all())
+
+    async def stream(self, after: Optional[int] = None) -> 'BookRecordStream':
+        return BookRecordStream(self, await self.session.stream(STREAM, {'after': after or 0}))
+
+
+# Same partitions() interface as the ORM stream result, each batch of rows gets its authors attached
+class BookRecordStream:
+    def __init__(self, repository: BookRecordRepository, result) -> None:
+        self._repository = repository
+        self._result = result
+
+    async def partitions(self) -> AsyncIterator[List[BookRecord]]:
+        async for rows in self._result.partitions():
+            yield await self._repository._records(rows)
@@ -0,0 +1,24 @@
+from pymfdata.rdb.repository import AsyncSession, BaseAsyncRepository
+from sqlalchemy import bindparam, select
+from typing import Optional
+
+from modules.book.infrastructure.query.dto import BookView
+from persistence.book.entity import BookViewEntity
+
+_view = BookViewEntity.__table__
+
+FETCH_BY_ID = select(_view.c.id, _view.c.title, _view.c.isbn, _view.c.pages, _view.c.version, _view.c.updated_at,
+                     _view.c.authors).where(_view.c.id == bindparam('id'))
+
+
+class BookViewRepository(BaseAsyncRepository):
+    """
+    Reads the book_view projection, one primary key lookup per book with the author names already in the row.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def fetch_by_id(self, _id: int) -> Optional[BookView]:
+        row = (await self.session.execute(FETCH_BY_ID, {'id': _id})).first()
+        return BookView(*row) if row is not None else None
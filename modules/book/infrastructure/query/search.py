@@ -0,0 +1,57 @@
+from pymfdata.rdb.connection import AsyncEngine
+from sqlalchemy import DDL, event, func, literal_column, select
+from typing import Iterable, List, Tuple
+
+from core.search import InvertedIndex
+from persistence.book.entity import BookEntity
+
+# Full text index for GET /books/search, created with the book table on Postgres only
+event.listen(BookEntity.__table__, 'after_create', DDL(
+    "CREATE INDEX IF NOT EXISTS ix_book_title_search ON book USING gin (to_tsvector('simple', title))"
+).execute_if(dialect='postgresql'))
+
+
+# Every token as a prefix, the condition is served by ix_book_title_search. Returns (condition, rank)
+def title_search(title, tokens: List[str]) -> Tuple:
+    document = func.to_tsvector(literal_column("'simple'"), title)
+    query = func.to_tsquery(literal_column("'simple'"), ' & '.join(token + ':*' for token in tokens))
+    return document.op('@@')(query), func.ts_rank(document, query)
+
+
+class BookSearchIndex:
+    """In-process fallback for databases without full text search (SQLite test runs)."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._index = InvertedIndex()
+
+    async def build(self, engine: AsyncEngine):
+        self.enabled = engine.dialect.name != 'postgresql'
+        if not self.enabled:
+            return
+
+        t = BookEntity.__table__
+        self._index.clear()
+        async with engine.connect() as conn:
+            result = await conn.stream(select(t.c.id, t.c.title))
+            async for _id, title in result:
+                self._index.add(_id, title)
+
+    # Re-reads the given books, rows that are gone are dropped from the index
+    async def refresh(self, engine: AsyncEngine, book_ids: Iterable[int]):
+        book_ids = list(book_ids)
+        if not self.enabled or not book_ids:
+            return
+
+        t = BookEntity.__table__
+        async with engine.connect() as conn:
+            rows = dict((await conn.execute(select(t.c.id, t.c.title).where(t.c.id.in_(book_ids)))).all())
+
+        for _id in book_ids:
+            if _id in rows:
+                self._index.add(_id, rows[_id])
+            else:
+                self._index.remove(_id)
+
+    def search(self, q: str, limit: int, offset: int) -> List[int]:
+        return self._index.search(q, limit, offset)
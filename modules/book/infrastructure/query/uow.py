@@ -1,14 +1,48 @@
 from pymfdata.rdb.connection import AsyncEngine
 from pymfdata.rdb.usecase import AsyncSQLAlchemyUnitOfWork
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Optional
 
+from core.cache import LRUCache
+from core.replica import ReplicaRouter
+from core.sqlalchemy import LoadStrategy
+from modules.book.infrastructure.query.repository.cache import BookCachedRepository
 from modules.book.infrastructure.query.repository.impl import BookAlchemyRepository, BookQueryRepository
+from modules.book.infrastructure.query.repository.record import BookRecordRepository
+from modules.book.infrastructure.query.repository.view import BookViewRepository
+from modules.book.infrastructure.query.search import BookSearchIndex
+from persistence.book.entity import BookEntity
+from persistence.version import VersionRepository
 
 
 class BookQueryUnitOfWork(AsyncSQLAlchemyUnitOfWork):
-    def __init__(self, engine: AsyncEngine) -> None:
+    def __init__(self, engine: AsyncEngine, router: Optional[ReplicaRouter] = None, cache: Optional[LRUCache] = None,
+                 strategies: Optional[Dict[str, LoadStrategy]] = None,
+                 search_index: Optional[BookSearchIndex] = None, records: bool = False,
+                 validate_hits: bool = False) -> None:
         super().__init__(engine)
+        self._validate_hits = validate_hits
+        self._records = records
+        self._router = router
+        self._cache = cache
+        self._strategies = strategies
+        self._search_index = search_index
 
+    # self._engine stays the primary, the read engine is picked again on every enter (a use case may enter twice)
     async def __aenter__(self):
-        await super().__aenter__()
+        engine = self._router.read_engine() if self._router is not None else self._engine
+        self._session = AsyncSession(engine)
 
-        self.repository: BookQueryRepository = BookAlchemyRepository(self.session)
+        # records: Core selects into BookRecord tuples, otherwise mapped BookDTO objects
+        if self._records:
+            self.repository: BookQueryRepository = BookRecordRepository(self.session, self._search_index)
+        else:
+            self.repository: BookQueryRepository = BookAlchemyRepository(self.session, self._strategies,
+                                                                            self._search_index)
+        self.versions = VersionRepository(self.session, BookEntity.__table__)
+        if self._cache is not None:
+            # A lagging replica could put the state before a write back, only primary reads fill the cache
+            self.repository = BookCachedRepository(self.repository, self._cache,
+                                                   self.versions if self._validate_hits else None,
+                                                   fill=engine is self._engine)
+        self.views = BookViewRepository(self.session)
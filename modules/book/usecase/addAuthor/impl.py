@@ -1,30 +1,41 @@
 from pymfdata.common.usecase import BaseUseCase
 from pymfdata.rdb.transaction import async_transactional
 
+from common.errors.exception import NotFoundException
+from common.protocols.event import BaseEvent
 from core.fastapi.event.dispatcher import EventDispatcher
 from core.fastapi.event.handler import event_handler
-from modules.author.usecase.addBookToAuthor.event_handler import AddBookToAuthorEventHandler
+from core.metrics import timed_use_case
+from core.sqlalchemy import retry_on_stale
 from modules.book.domain.aggregate.model import Book
-from modules.book.domain.event import AuthorAddedToBookDomainEvent
+from modules.book.domain.event import AuthorAddedToBookDomainEvent, BooksChangedDomainEvent
 from modules.book.infrastructure.persistence.uow import BookPersistenceUnitOfWork
 
 from .command import AddAuthorCommand
 
 
 class AddAuthorUseCase(BaseUseCase[BookPersistenceUnitOfWork]):
-    def __init__(self, uow: BookPersistenceUnitOfWork, event: AddBookToAuthorEventHandler) -> None:
+    def __init__(self, uow: BookPersistenceUnitOfWork, event: BaseEvent) -> None:
         self._event = event
         self._uow = uow
 
-    # Transaction order
-    @async_transactional()
+    # Events are published after commit, so the query cache can not be refilled with the old book
     @EventDispatcher()
+    @timed_use_case()
+    @retry_on_stale()
+    @async_transactional()
     async def invoke(self, command: AddAuthorCommand) -> Book:
         book: Book = await self.uow.repository.find_by_pk(command.book_id)
+        if book is None or not await self.uow.repository.find_author_ids([command.author_id]):
+            raise NotFoundException
+
         book.add_author(command)
 
-        # Publish Event
-        await event_handler.store(event=self._event,
-                                  param=AuthorAddedToBookDomainEvent(book_id=command.book_id,
-                                                                     author_id=command.author_id))
+        # Author side is updated by the outbox dispatcher (AddBookToAuthorEventHandler) after commit
+        await self.uow.outbox.put(AuthorAddedToBookDomainEvent.construct(book_id=command.book_id,
+                                                                         author_id=command.author_id))
+
+        changed = BooksChangedDomainEvent.construct(book_ids=[book.id], titles=[book.title])
+        await self.uow.outbox.put(changed)
+        await event_handler.store(event=self._event, param=changed)
         return book
@@ -0,0 +1,20 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import Body, Depends, Path
+from typing import List
+
+from container import Container
+from modules.author.domain.aggregate.id import AuthorId
+from modules.book.domain.aggregate.id import BookId
+from modules.book.usecase import router
+from modules.book.usecase.addAuthors.impl import AddAuthorsUseCase
+
+from .command import MAX_AUTHORS, AddAuthorsCommand
+
+
+@router.post(path="/{id}/authors", name="Add Authors for Book")
+@inject
+async def add_authors(id: BookId = Path(..., title="Book ID"),
+                      author_ids: List[AuthorId] = Body(..., embed=True, min_items=1, max_items=MAX_AUTHORS),
+                      uc: AddAuthorsUseCase = Depends(Provide[Container.add_authors_use_case])):
+    await uc.invoke(AddAuthorsCommand(book_id=id, author_ids=author_ids))
+    return "OK"
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+from modules.book.domain.aggregate.id import BookId
+from modules.author.domain.aggregate.id import AuthorId
+
+MAX_AUTHORS = 1000
+
+
+class AddAuthorsCommand(BaseModel):
+    book_id: BookId
+    author_ids: List[AuthorId] = Field(title="Author IDs", min_items=1, max_items=MAX_AUTHORS)
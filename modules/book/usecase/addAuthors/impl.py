@@ -0,0 +1,48 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+from typing import List
+
+from common.errors.exception import BadRequestException, NotFoundException
+from common.protocols.event import BaseEvent
+from core.fastapi.event.dispatcher import EventDispatcher
+from core.fastapi.event.handler import event_handler
+from core.metrics import timed_use_case
+from core.sqlalchemy import retry_on_stale
+from modules.author.domain.aggregate.id import AuthorId
+from modules.book.domain.event import AuthorsAddedToBookDomainEvent, BooksChangedDomainEvent
+from modules.book.infrastructure.persistence.uow import BookPersistenceUnitOfWork
+
+from .command import AddAuthorsCommand
+
+
+class AddAuthorsUseCase(BaseUseCase[BookPersistenceUnitOfWork]):
+    def __init__(self, uow: BookPersistenceUnitOfWork, event: BaseEvent) -> None:
+        self._event = event
+        self._uow = uow
+
+    @EventDispatcher()
+    @timed_use_case()
+    @retry_on_stale()
+    @async_transactional()
+    async def invoke(self, command: AddAuthorsCommand) -> List[AuthorId]:
+        book = await self.uow.repository.find_by_pk(command.book_id)
+        if book is None:
+            raise NotFoundException
+
+        # Unknown authors reject the whole request, nothing is attached
+        author_ids = list(dict.fromkeys(command.author_ids))
+        if len(await self.uow.repository.find_author_ids(author_ids)) != len(author_ids):
+            raise BadRequestException
+
+        # Returns the ids and not the book, pymfdata refreshes a returned aggregate after commit
+        added = book.add_authors(command)
+        if not added:
+            return added
+
+        # One outbox event for all authors, the author side is written with a single INSERT
+        await self.uow.outbox.put(AuthorsAddedToBookDomainEvent.construct(book_id=book.id, author_ids=added))
+
+        changed = BooksChangedDomainEvent.construct(book_ids=[book.id], titles=[book.title])
+        await self.uow.outbox.put(changed)
+        await event_handler.store(event=self._event, param=changed)
+        return added
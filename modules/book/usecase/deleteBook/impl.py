@@ -1,17 +1,30 @@
 from pymfdata.common.usecase import BaseUseCase
 from pymfdata.rdb.transaction import async_transactional
 
+from common.protocols.event import BaseEvent
+from core.fastapi.event.dispatcher import EventDispatcher
+from core.fastapi.event.handler import event_handler
+from core.metrics import timed_use_case
+from modules.book.domain.event import BooksChangedDomainEvent, BooksDeletedDomainEvent
 from modules.book.infrastructure.persistence.uow import BookPersistenceUnitOfWork
 
 from .command import DeleteBookCommand
 
 
 class DeleteBookUseCase(BaseUseCase[BookPersistenceUnitOfWork]):
-    def __init__(self, uow: BookPersistenceUnitOfWork) -> None:
+    def __init__(self, uow: BookPersistenceUnitOfWork, event: BaseEvent) -> None:
+        self._event = event
         self._uow = uow
 
+    # Events are published after commit
+    @EventDispatcher()
+    @timed_use_case()
     @async_transactional()
     async def invoke(self, command: DeleteBookCommand):
-        book = await self.uow.repository.find_by_pk(command.book_id)
-        if book:
-            await self.uow.repository.delete(book)
+        for book_id, title in await self.uow.repository.delete_many([command.book_id]):
+            # author_book rows are removed by the outbox dispatcher
+            await self.uow.outbox.put(BooksDeletedDomainEvent.construct(book_ids=[book_id]))
+
+            changed = BooksChangedDomainEvent.construct(book_ids=[book_id], titles=[title])
+            await self.uow.outbox.put(changed)
+            await event_handler.store(event=self._event, param=changed)
@@ -0,0 +1,17 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Query
+from typing import List
+
+from container import Container
+from modules.book.domain.aggregate.id import BookId
+from modules.book.usecase import router
+from modules.book.usecase.deleteBooks.impl import DeleteBooksUseCase
+
+from .command import MAX_BOOKS, DeleteBooksCommand
+
+
+@router.delete(path='', name="Delete Books")
+@inject
+async def delete_books(ids: List[BookId] = Query(..., min_items=1, max_items=MAX_BOOKS, title="Book IDs"),
+                       uc: DeleteBooksUseCase = Depends(Provide[Container.delete_books_use_case])):
+    return {'deleted': await uc.invoke(DeleteBooksCommand(book_ids=ids))}
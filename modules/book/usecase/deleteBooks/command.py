@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+from modules.book.domain.aggregate.model import BookId
+
+MAX_BOOKS = 1000
+
+
+class DeleteBooksCommand(BaseModel):
+    book_ids: List[BookId] = Field(title="Book IDs", min_items=1, max_items=MAX_BOOKS)
@@ -0,0 +1,36 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+from typing import List
+
+from common.protocols.event import BaseEvent
+from core.fastapi.event.dispatcher import EventDispatcher
+from core.fastapi.event.handler import event_handler
+from core.metrics import timed_use_case
+from modules.book.domain.aggregate.model import BookId
+from modules.book.domain.event import BooksChangedDomainEvent, BooksDeletedDomainEvent
+from modules.book.infrastructure.persistence.uow import BookPersistenceUnitOfWork
+
+from .command import DeleteBooksCommand
+
+
+class DeleteBooksUseCase(BaseUseCase[BookPersistenceUnitOfWork]):
+    def __init__(self, uow: BookPersistenceUnitOfWork, event: BaseEvent) -> None:
+        self._event = event
+        self._uow = uow
+
+    # Returns the ids that existed, events are published after commit
+    @EventDispatcher()
+    @timed_use_case()
+    @async_transactional()
+    async def invoke(self, command: DeleteBooksCommand) -> List[BookId]:
+        deleted = await self.uow.repository.delete_many(list(dict.fromkeys(command.book_ids)))
+        if not deleted:
+            return []
+
+        book_ids = [book_id for book_id, _ in deleted]
+        await self.uow.outbox.put(BooksDeletedDomainEvent.construct(book_ids=book_ids))
+
+        changed = BooksChangedDomainEvent.construct(book_ids=book_ids, titles=[t for _, t in deleted])
+        await self.uow.outbox.put(changed)
+        await event_handler.store(event=self._event, param=changed)
+        return book_ids
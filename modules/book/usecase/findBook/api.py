@@ -0,0 +1,20 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Path
+
+from common.errors.exception import NotFoundException
+from container import Container
+from core.fastapi.responses import ORJSONResponse
+from modules.book.domain.aggregate.id import BookId
+from modules.book.usecase import router
+from modules.book.usecase.findBook.impl import FindBookUseCase
+
+
+# Not conditional, a renamed author changes the body without bumping the book version
+@router.get(path="/{id}", name="Find book with its authors")
+@inject
+async def find_book(id: BookId = Path(..., title="Book ID"),
+                    uc: FindBookUseCase = Depends(Provide[Container.find_book_use_case])):
+    view = await uc.invoke(id)
+    if view is None:
+        raise NotFoundException
+    return ORJSONResponse(view.to_dict())
@@ -0,0 +1,17 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+from typing import Optional
+
+from core.metrics import timed_use_case
+from modules.book.infrastructure.query.dto import BookView
+from modules.book.infrastructure.query.uow import BookQueryUnitOfWork
+
+
+class FindBookUseCase(BaseUseCase[BookQueryUnitOfWork]):
+    def __init__(self, uow: BookQueryUnitOfWork) -> None:
+        self._uow = uow
+
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def invoke(self, _id: int) -> Optional[BookView]:
+        return await self.uow.views.fetch_by_id(_id)
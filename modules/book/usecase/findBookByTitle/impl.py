@@ -1,7 +1,9 @@
 from pymfdata.common.usecase import BaseUseCase
 from pymfdata.rdb.transaction import async_transactional
+from typing import Any, Dict, List
 
-from modules.book.infrastructure.query.dto import BookDTO
+from core.etag import EntityTag
+from core.metrics import timed_use_case
 from modules.book.infrastructure.query.uow import BookQueryUnitOfWork
 
 
@@ -9,6 +11,13 @@ class FindBookByTitleUseCase(BaseUseCase[BookQueryUnitOfWork]):
     def __init__(self, uow: BookQueryUnitOfWork) -> None:
         self._uow = uow
 
+    @timed_use_case()
     @async_transactional(read_only=True)
-    async def invoke(self, title: str) -> BookDTO:
-        return await self.uow.repository.fetch_by_title(title)
+    async def invoke(self, title: str) -> List[Dict[str, Any]]:
+        return [book.to_dict() for book in await self.uow.repository.fetch_by_title(title)]
+
+    # From the version columns, without loading the books
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def entity_tag(self, title: str) -> EntityTag:
+        return EntityTag.of(await self.uow.versions.fetch_by('title', title))
@@ -0,0 +1,29 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+from typing import Any, Dict, List, Optional
+
+from core.dataloader import DataLoader
+from core.etag import EntityTag
+from core.metrics import timed_use_case
+from modules.book.infrastructure.query.uow import BookQueryUnitOfWork
+
+MAX_IDS = 100
+
+
+class FindBooksByIdsUseCase(BaseUseCase[BookQueryUnitOfWork]):
+    def __init__(self, uow: BookQueryUnitOfWork) -> None:
+        self._uow = uow
+        # The container builds the use case per request, so lookups are only coalesced within a request
+        self.loader: DataLoader[int, Optional[Dict[str, Any]]] = DataLoader(self.invoke, max_batch_size=MAX_IDS)
+
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def invoke(self, ids: List[int]) -> List[Optional[Dict[str, Any]]]:
+        books = await self.uow.repository.fetch_by_ids(ids)
+        return [book.to_dict() if book else None for book in books]
+
+    # From the version columns, without loading the books
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def entity_tag(self, ids: List[int]) -> EntityTag:
+        return EntityTag.of(await self.uow.versions.fetch_by_ids(ids))
@@ -0,0 +1,37 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Query, Request
+from typing import List, Optional
+
+from container import Container
+from core.fastapi.caching import HttpCache
+from core.fastapi.responses import NDJSONStreamingResponse, ORJSONResponse
+from modules.book.usecase import router
+from modules.book.usecase.findBookByTitle.impl import FindBookByTitleUseCase
+from modules.book.usecase.findBooksByIds.impl import MAX_IDS, FindBooksByIdsUseCase
+from modules.book.usecase.listBooks.impl import ListBooksUseCase
+
+
+@router.get(path='', name="List books")
+@inject
+async def list_books(request: Request,
+                     title: Optional[str] = Query(None, title="Book Title"),
+                     ids: Optional[List[int]] = Query(None, max_items=MAX_IDS, title="Book IDs, in response order"),
+                     cursor: Optional[int] = Query(None, title="Last Book ID of the previous page"),
+                     limit: int = Query(50, ge=1, le=1000, title="Page size"),
+                     stream: bool = Query(False, title="Stream every book after the cursor as NDJSON"),
+                     uc: ListBooksUseCase = Depends(Provide[Container.list_books_use_case]),
+                     find_uc: FindBookByTitleUseCase = Depends(Provide[Container.find_book_by_title_use_case]),
+                     ids_uc: FindBooksByIdsUseCase = Depends(Provide[Container.find_books_by_ids_use_case]),
+                     http_cache: HttpCache = Depends(Provide[Container.http_cache])):
+    # Lookups clients poll, a 304 when the versions did not change (probed only for a conditional request)
+    if ids is not None:
+        return await http_cache.respond(request, lambda: ids_uc.entity_tag(ids),
+                                        lambda: ids_uc.loader.load_many(ids))
+
+    if title is not None:
+        return await http_cache.respond(request, lambda: find_uc.entity_tag(title), lambda: find_uc.invoke(title))
+
+    if stream:
+        return NDJSONStreamingResponse(uc.stream(cursor))
+
+    return ORJSONResponse(await uc.invoke(cursor, limit))
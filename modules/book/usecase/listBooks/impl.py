@@ -0,0 +1,27 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from core.metrics import timed_use_case
+from modules.book.infrastructure.query.uow import BookQueryUnitOfWork
+
+
+class ListBooksUseCase(BaseUseCase[BookQueryUnitOfWork]):
+    def __init__(self, uow: BookQueryUnitOfWork) -> None:
+        self._uow = uow
+
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def invoke(self, cursor: Optional[int], limit: int) -> Dict[str, Any]:
+        books = await self.uow.repository.fetch_page(cursor, limit)
+        return {
+            'items': [book.to_dict() for book in books],
+            'next_cursor': books[-1].id if len(books) == limit else None
+        }
+
+    # The session stays open while the response is streamed, one batch of rows at a time
+    async def stream(self, cursor: Optional[int]) -> AsyncIterator[List[Dict[str, Any]]]:
+        async with self.uow:
+            result = await self.uow.repository.stream(cursor)
+            async for books in result.partitions():
+                yield [book.to_dict() for book in books]
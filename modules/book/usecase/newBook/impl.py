@@ -1,17 +1,31 @@
 from pymfdata.common.usecase import BaseUseCase
 from pymfdata.rdb.transaction import async_transactional
 
+from common.protocols.event import BaseEvent
+from core.fastapi.event.dispatcher import EventDispatcher
+from core.fastapi.event.handler import event_handler
+from core.metrics import timed_use_case
 from modules.book.domain.aggregate.model import Book
+from modules.book.domain.event import BooksChangedDomainEvent
 from modules.book.usecase.newBook.command import NewBookCommand
 from modules.book.infrastructure.persistence.uow import BookPersistenceUnitOfWork
 
 
 class NewBookUseCase(BaseUseCase[BookPersistenceUnitOfWork]):
-    def __init__(self, uow: BookPersistenceUnitOfWork) -> None:
+    def __init__(self, uow: BookPersistenceUnitOfWork, event: BaseEvent) -> None:
+        self._event = event
         self._uow = uow
 
+    # Events are published after commit
+    @EventDispatcher()
+    @timed_use_case()
     @async_transactional()
     async def invoke(self, command: NewBookCommand) -> Book:
         book = Book.new_book(command)
         self.uow.repository.create(book)
+
+        # The outbox copy drives book_view, the published one the query cache and search index of this process
+        changed = BooksChangedDomainEvent.construct(book_ids=[book.id], titles=[book.title])
+        await self.uow.outbox.put(changed)
+        await event_handler.store(event=self._event, param=changed)
         return book
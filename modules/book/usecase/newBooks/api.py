@@ -0,0 +1,65 @@
+import orjson
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Request
+from pydantic import ValidationError
+from starlette import status
+from typing import Any, Dict, List
+
+from common.errors.exception import BadRequestException, UnsupportedMediaTypeException
+from container import Container
+from modules.book.usecase import router
+from modules.book.usecase.newBook.command import NewBookCommand
+from modules.book.usecase.newBooks.impl import NewBooksUseCase
+
+from .command import NewBooksCommand
+
+MAX_BATCH_SIZE = 10000
+
+
+async def _read_items(request: Request) -> List[Any]:
+    content_type = request.headers.get('content-type', '')
+    body = await request.body()
+
+    try:
+        if content_type.startswith('application/x-ndjson'):
+            items = [orjson.loads(line) for line in body.splitlines() if line.strip()]
+        elif content_type.startswith('application/json'):
+            items = orjson.loads(body)
+        else:
+            raise UnsupportedMediaTypeException
+    except orjson.JSONDecodeError:
+        raise BadRequestException
+
+    if not isinstance(items, list) or len(items) > MAX_BATCH_SIZE:
+        raise BadRequestException
+
+    return items
+
+
+# Accepts a JSON array or NDJSON (one book per line), each item is validated on its own
+@router.post(path=':batch', name="New Books", status_code=status.HTTP_201_CREATED)
+@inject
+async def new_books(request: Request, uc: NewBooksUseCase = Depends(Provide[Container.new_books_use_case])):
+    results: List[Dict[str, Any]] = []
+    commands: List[NewBookCommand] = []
+    for index, item in enumerate(await _read_items(request)):
+        try:
+            commands.append(NewBookCommand.parse_obj(item))
+            results.append({'index': index})
+        except ValidationError as ex:
+            results.append({'index': index, 'errors': ex.errors()})
+
+    books = iter(zip(commands, await uc.invoke(NewBooksCommand(books=commands)) if commands else []))
+    for result in results:
+        if 'errors' in result:
+            continue
+
+        command, book = next(books)
+        if book:
+            result['id'] = book.id
+        else:
+            result['errors'] = [{'loc': ['isbn'], 'msg': 'isbn already exists', 'type': 'value_error.conflict',
+                                 'ctx': {'isbn': command.isbn}}]
+
+    return results
@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+from modules.book.usecase.newBook.command import NewBookCommand
+
+
+class NewBooksCommand(BaseModel):
+    books: List[NewBookCommand] = Field(title="Books")
@@ -0,0 +1,40 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+from typing import List, Optional
+
+from common.protocols.event import BaseEvent
+from core.fastapi.event.dispatcher import EventDispatcher
+from core.fastapi.event.handler import event_handler
+from core.metrics import timed_use_case
+from modules.book.domain.aggregate.model import Book
+from modules.book.domain.event import BooksChangedDomainEvent
+from modules.book.infrastructure.persistence.uow import BookPersistenceUnitOfWork
+
+from .command import NewBooksCommand
+
+
+class NewBooksUseCase(BaseUseCase[BookPersistenceUnitOfWork]):
+    def __init__(self, uow: BookPersistenceUnitOfWork, event: BaseEvent) -> None:
+        self._event = event
+        self._uow = uow
+
+    # Returns one entry per command item, None if its isbn is already taken
+    @EventDispatcher()
+    @timed_use_case()
+    @async_transactional()
+    async def invoke(self, command: NewBooksCommand) -> List[Optional[Book]]:
+        # Snowflake IDs are reserved as one block for the whole batch
+        created = Book.new_books(command.books)
+
+        # The unique isbn decides in the INSERT itself, a concurrent batch with the same isbn can not fail this one
+        written = set(await self.uow.repository.create_many(created))
+        books: List[Optional[Book]] = [book if book.id in written else None for book in created]
+        inserted = [book for book in books if book]
+        if not inserted:
+            return books
+
+        changed = BooksChangedDomainEvent.construct(book_ids=[book.id for book in inserted],
+                                                    titles=list({book.title for book in inserted}))
+        await self.uow.outbox.put(changed)
+        await event_handler.store(event=self._event, param=changed)
+        return books
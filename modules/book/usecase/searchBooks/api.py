@@ -0,0 +1,16 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, Query
+
+from container import Container
+from core.fastapi.responses import ORJSONResponse
+from modules.book.usecase import router
+from modules.book.usecase.searchBooks.impl import SearchBooksUseCase
+
+
+@router.get(path='/search', name="Search books by title")
+@inject
+async def search_books(q: str = Query(..., min_length=1, max_length=100, title="Words (or word prefixes) of the title"),
+                       limit: int = Query(20, ge=1, le=100, title="Page size"),
+                       offset: int = Query(0, ge=0, le=10000, title="Number of results to skip"),
+                       uc: SearchBooksUseCase = Depends(Provide[Container.search_books_use_case])):
+    return ORJSONResponse(await uc.invoke(q, limit, offset))
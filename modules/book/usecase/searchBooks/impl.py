@@ -0,0 +1,20 @@
+from pymfdata.common.usecase import BaseUseCase
+from pymfdata.rdb.transaction import async_transactional
+from typing import Any, Dict
+
+from core.metrics import timed_use_case
+from modules.book.infrastructure.query.uow import BookQueryUnitOfWork
+
+
+class SearchBooksUseCase(BaseUseCase[BookQueryUnitOfWork]):
+    def __init__(self, uow: BookQueryUnitOfWork) -> None:
+        self._uow = uow
+
+    @timed_use_case()
+    @async_transactional(read_only=True)
+    async def invoke(self, q: str, limit: int, offset: int) -> Dict[str, Any]:
+        books = await self.uow.repository.search(q, limit, offset)
+        return {
+            'items': [book.to_dict() for book in books],
+            'next_offset': offset + limit if len(books) == limit else None
+        }
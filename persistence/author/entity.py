@@ -1,5 +1,6 @@
+from datetime import datetime
 from pymfdata.rdb.mapper import Base
-from sqlalchemy import BigInteger, Column, String, Integer, ForeignKey
+from sqlalchemy import BigInteger, Column, DateTime, String, Integer, ForeignKey, func
 from sqlalchemy.orm import relationship, composite
 from typing import List, Union
 
@@ -21,9 +22,14 @@ class AuthorEntity(Base):
     last_name: Union[str, Column] = Column(String(100), nullable=False)
     age: Union[int, Column] = Column(Integer, nullable=False)
     biography: Union[str, Column] = Column(String(3000), nullable=True)
+    # Optimistic concurrency, see the version_id_col of the domain mapper
+    version: Union[int, Column] = Column(Integer, nullable=False, default=1, server_default='1')
+    # Set by every UPDATE of the row, a change to the aggregate always makes one as it bumps the version
+    updated_at: Union[datetime, Column] = Column(DateTime, nullable=False, default=datetime.utcnow,
+                                                 onupdate=datetime.utcnow, server_default=func.now())
 
     # If viewonly set false, comment start_mapper for AuthorEntity, because two object conflict
-    r_book_ids = relationship(AuthorBookEntity, viewonly=True, lazy='joined')
+    r_book_ids = relationship(AuthorBookEntity, viewonly=True, lazy='selectin')
 
     # If use orm_mode for Pydantic BaseModel
     name = composite(Name, first_name, last_name)
@@ -1,8 +1,62 @@
+import functools
+
 from pymfdata.rdb.repository import AsyncRepository, AsyncSession
+from sqlalchemy import BigInteger, delete, literal, select, update
+from typing import Optional, Sequence
 
+from core.cache import AggregateCache
+from core.sqlalchemy import any_of, insert_or_ignore
 from modules.author.domain.aggregate.model import Author
+from modules.author.infrastructure.persistence.mapper import AuthorMapper
+from persistence.author.entity import AuthorBookEntity, AuthorEntity
+from persistence.cache import SessionAggregates
 
 
 class AuthorRepository(AsyncRepository[Author, int]):
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, cache: Optional[AggregateCache] = None) -> None:
         self._session = session
+        self._aggregates: Optional[SessionAggregates[Author]] = None
+        if cache is not None and cache.enabled:
+            self._aggregates = SessionAggregates(session, cache, Author, AuthorMapper.map_to_snapshot,
+                                                 AuthorMapper.map_from_snapshot)
+
+    # Rehydrated from the aggregate cache without a SELECT when it is enabled
+    async def find_by_pk(self, pk: int) -> Optional[Author]:
+        if self._aggregates is None:
+            return await super().find_by_pk(pk)
+
+        return await self._aggregates.get(pk, functools.partial(super().find_by_pk, pk))
+
+    # One INSERT .. SELECT for every author, unknown authors and existing links are skipped
+    async def add_book_to_authors(self, book_id: int, author_ids: Sequence[int]) -> int:
+        dialect = self.session.bind.dialect.name
+        authors = select(AuthorEntity.id, literal(book_id, BigInteger)) \
+            .where(any_of(AuthorEntity.id, author_ids, dialect))
+        stmt = insert_or_ignore(AuthorBookEntity.__table__, dialect) \
+            .from_select([AuthorBookEntity.author_id, AuthorBookEntity.book_id], authors)
+
+        result = await self.session.execute(stmt)
+        await self._increment_versions(author_ids)
+        return result.rowcount
+
+    async def remove_books(self, book_ids: Sequence[int]) -> int:
+        t = AuthorBookEntity.__table__
+        result = await self.session.execute(select(t.c.author_id).distinct()
+                                            .where(any_of(t.c.book_id, book_ids, self.session.bind.dialect.name)))
+        await self._increment_versions(result.scalars().all())
+
+        stmt = delete(t).where(any_of(t.c.book_id, book_ids, self.session.bind.dialect.name))
+        result = await self.session.execute(stmt)
+        return result.rowcount
+
+    # Set based writes skip the ORM flush, so the authors they touch get their version bumped here. A cached
+    # Author is then stale and its next flush fails the version check
+    async def _increment_versions(self, author_ids: Sequence[int]) -> None:
+        if not author_ids:
+            return
+
+        t = AuthorEntity.__table__
+        await self.session.execute(update(t).where(any_of(t.c.id, author_ids, self.session.bind.dialect.name))
+                                   .values(version=t.c.version + 1))
+        if self._aggregates is not None:
+            self._aggregates.evict(author_ids)
@@ -1,7 +1,9 @@
+from datetime import datetime
 from pymfdata.rdb.mapper import Base
-from sqlalchemy import Column, BigInteger, Integer, String, ForeignKey
+from sqlalchemy import Column, BigInteger, DateTime, Integer, Index, JSON, String, ForeignKey, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from typing import List, Union
+from typing import Any, Dict, List, Union
 
 
 class BookAuthorEntity(Base):
@@ -13,6 +15,8 @@ class BookAuthorEntity(Base):
 
 class BookEntity(Base):
     __tablename__ = 'book'
+    # Title lookups, on PostgreSQL the version columns are included so a conditional GET is an index only scan
+    __table_args__ = (Index('ix_book_title', 'title', postgresql_include=['id', 'version', 'updated_at']),)
 
     id: Union[int, Column] = Column(BigInteger, primary_key=True)
     title: Union[str, Column] = Column(String(100), nullable=False)
@@ -20,9 +24,14 @@ class BookEntity(Base):
     pages: Union[int, Column] = Column(Integer, nullable=False)
     price: Union[int, Column] = Column(BigInteger, nullable=False)
     publication_year: Union[int, Column] = Column(Integer, nullable=False)
+    # Optimistic concurrency, see the version_id_col of the domain mapper
+    version: Union[int, Column] = Column(Integer, nullable=False, default=1, server_default='1')
+    # Set by every UPDATE of the row, a change to the aggregate always makes one as it bumps the version
+    updated_at: Union[datetime, Column] = Column(DateTime, nullable=False, default=datetime.utcnow,
+                                                 onupdate=datetime.utcnow, server_default=func.now())
 
     # If viewonly set false, comment start_mapper for BookEntity, because two object conflict
-    r_authors = relationship(BookAuthorEntity, viewonly=True, lazy='joined')
+    r_authors = relationship(BookAuthorEntity, viewonly=True, lazy='selectin')
 
     @property
     def authors(self) -> List[BookAuthorEntity]:
@@ -31,3 +40,17 @@ class BookEntity(Base):
     @authors.setter
     def authors(self, authors: List[int]):
         self.r_authors = list(map(lambda _id: BookAuthorEntity(book_id=self.id, author_id=_id), authors))
+
+
+# Projection for GET /books/{id}, written by BookViewProjection from book, book_author and author
+class BookViewEntity(Base):
+    __tablename__ = 'book_view'
+
+    id: Union[int, Column] = Column(BigInteger, primary_key=True)
+    title: Union[str, Column] = Column(String(100), nullable=False)
+    isbn: Union[str, Column] = Column(String(10), nullable=False)
+    pages: Union[int, Column] = Column(Integer, nullable=False)
+    version: Union[int, Column] = Column(Integer, nullable=False)
+    updated_at: Union[datetime, Column] = Column(DateTime, nullable=False)
+    # [{"id": .., "first_name": .., "last_name": ..}], the names are null while the author does not exist
+    authors: Union[List[Dict[str, Any]], Column] = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=False)
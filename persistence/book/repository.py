@@ -1,9 +1,79 @@
-from sqlalchemy import inspect
+import functools
+
+from sqlalchemy import delete, inspect, select
 from pymfdata.rdb.repository import AsyncRepository, AsyncSession
+from typing import List, Optional, Sequence, Tuple
 
+from core.cache import AggregateCache
+from core.sqlalchemy import any_of, insert_or_ignore
 from modules.book.domain.aggregate.model import Book
+from modules.book.infrastructure.persistence.mapper import BookMapper
+from persistence.author.entity import AuthorEntity
+from persistence.book.entity import BookAuthorEntity, BookEntity
+from persistence.cache import SessionAggregates
 
 
 class BookRepository(AsyncRepository[Book, int]):
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, cache: Optional[AggregateCache] = None) -> None:
         self._session = session
+        self._aggregates: Optional[SessionAggregates[Book]] = None
+        if cache is not None and cache.enabled:
+            self._aggregates = SessionAggregates(session, cache, Book, BookMapper.map_to_snapshot,
+                                                 BookMapper.map_from_snapshot)
+
+    # Rehydrated from the aggregate cache without a SELECT when it is enabled
+    async def find_by_pk(self, pk: int) -> Optional[Book]:
+        if self._aggregates is None:
+            return await super().find_by_pk(pk)
+
+        return await self._aggregates.get(pk, functools.partial(super().find_by_pk, pk))
+
+    # The IDs that belong to an existing author, a book only links those
+    async def find_author_ids(self, ids: Sequence[int]) -> List[int]:
+        if not ids:
+            return []
+
+        t = AuthorEntity.__table__
+        result = await self.session.execute(select(t.c.id).where(any_of(t.c.id, ids, self.session.bind.dialect.name)))
+        return result.scalars().all()
+
+    # Single executemany INSERT .. ON CONFLICT DO NOTHING, bypasses the ORM unit of work flush. A book whose isbn
+    # is taken (also by a concurrent insert or an earlier book of the batch) is skipped, returns the IDs written
+    async def create_many(self, books: List[Book]) -> List[int]:
+        if not books:
+            return []
+
+        t, dialect = BookEntity.__table__, self.session.bind.dialect.name
+        await self.session.execute(insert_or_ignore(t, dialect), [
+            dict(id=book.id, title=book.title, isbn=book.isbn, pages=book.pages,
+                 price=book.price, publication_year=book.publication_year)
+            for book in books
+        ])
+
+        # The IDs were allocated for this batch, every one that exists now is a row it wrote
+        result = await self.session.execute(select(t.c.id).where(any_of(t.c.id, [book.id for book in books], dialect)))
+        return result.scalars().all()
+
+    # Deletes without loading the aggregates, returns (id, title) of every book that existed
+    async def delete_many(self, ids: Sequence[int]) -> List[Tuple[int, str]]:
+        if not ids:
+            return []
+
+        dialect = self.session.bind.dialect
+        t, rt = BookEntity.__table__, BookAuthorEntity.__table__
+        if self._aggregates is not None:
+            self._aggregates.evict(ids)
+
+        # book_author restricts the book delete, so the association rows go first
+        await self.session.execute(delete(rt).where(any_of(rt.c.book_id, ids, dialect.name)))
+
+        stmt = delete(t).where(any_of(t.c.id, ids, dialect.name))
+        if dialect.full_returning:
+            result = await self.session.execute(stmt.returning(t.c.id, t.c.title))
+            return result.fetchall()
+
+        # SQLAlchemy 1.4 has no RETURNING for SQLite
+        result = await self.session.execute(select(t.c.id, t.c.title).where(any_of(t.c.id, ids, dialect.name)))
+        deleted = result.fetchall()
+        await self.session.execute(stmt)
+        return deleted
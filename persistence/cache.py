@@ -0,0 +1,87 @@
+from pymfdata.rdb.repository import AsyncSession
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+from typing import Any, Awaitable, Callable, Generic, Hashable, Iterable, List, Optional, Set, Type, TypeVar
+
+from core.cache import AggregateCache
+
+_T = TypeVar("_T")
+
+
+class SessionAggregates(Generic[_T]):
+    """
+    An AggregateCache seen from one session.
+
+    A cached aggregate is rebuilt from its snapshot and attached as persistent without a SELECT. The version
+    column makes its flush fail with StaleDataError when the row changed since, the session rolls back and the
+    rehydrated snapshots are evicted (@retry_on_stale() then runs the command again on a fresh load). After commit
+    the aggregates that were loaded or flushed are snapshotted again, a rehydrated one that did not change already
+    is.
+    """
+
+    def __init__(self, session: AsyncSession, cache: AggregateCache, model: Type[_T],
+                 to_snapshot: Callable[[_T], Any], from_snapshot: Callable[[Any], _T]) -> None:
+        self._session = session.sync_session
+        self._cache = cache
+        self._model = model
+        self._to_snapshot = to_snapshot
+        self._from_snapshot = from_snapshot
+        self._rehydrated: List[Hashable] = []
+        self._flushed: Set[Hashable] = set()
+
+        event.listen(self._session, 'after_flush', self._after_flush)
+        event.listen(self._session, 'after_commit', self._after_commit)
+        event.listen(self._session, 'after_rollback', self._after_rollback)
+
+    async def get(self, pk: Hashable, load: Callable[[], Awaitable[Optional[_T]]]) -> Optional[_T]:
+        attached = self._session.identity_map.get(identity_key(self._model, pk))
+        if attached is not None:
+            return attached
+
+        found, snapshot = self._cache.get(pk)
+        if found:
+            return self._attach(pk, snapshot)
+
+        generation = self._cache.generation
+        aggregate = await load()
+        if aggregate is not None:
+            self._cache.put(pk, self._to_snapshot(aggregate), generation)
+        return aggregate
+
+    def evict(self, pks: Iterable[Hashable]) -> None:
+        self._cache.invalidate(*pks)
+
+    # The aggregate and everything it cascades to become detached with their current values as committed state
+    def _attach(self, pk: Hashable, snapshot: Any) -> _T:
+        aggregate = self._from_snapshot(snapshot)
+        state = inspect(aggregate)
+        related = [obj for obj, *_ in state.mapper.cascade_iterator('save-update', state) if obj is not aggregate]
+        for obj in [aggregate] + related:
+            make_transient_to_detached(obj)
+
+        self._session.add(aggregate)
+        self._rehydrated.append(pk)
+        return aggregate
+
+    # new, dirty and deleted still hold what this flush wrote
+    def _after_flush(self, session, flush_context) -> None:
+        self.evict(inspect(obj).identity[0] for obj in session.deleted if isinstance(obj, self._model))
+        self._flushed.update(inspect(obj).identity[0] for obj in session.dirty if isinstance(obj, self._model))
+
+    # Runs before the session expires its objects, so what was flushed is still loaded
+    def _after_commit(self, session) -> None:
+        unchanged = set(self._rehydrated) - self._flushed
+        for obj in list(session.identity_map.values()):
+            if isinstance(obj, self._model) and not inspect(obj).expired_attributes:
+                pk = inspect(obj).identity[0]
+                if pk not in unchanged:
+                    self._cache.put(pk, self._to_snapshot(obj), self._cache.generation)
+        self._rehydrated.clear()
+        self._flushed.clear()
+
+    def _after_rollback(self, session) -> None:
+        if self._rehydrated:
+            self.evict(self._rehydrated)
+            self._rehydrated.clear()
+        self._flushed.clear()
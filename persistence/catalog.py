@@ -0,0 +1,161 @@
+import asyncpg
+
+from datetime import datetime
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.sql import Select
+from typing import Awaitable, Callable, Dict, Sequence, Set, Tuple
+
+from persistence.author.entity import AuthorBookEntity, AuthorEntity
+from persistence.book.entity import BookAuthorEntity, BookEntity
+
+AUTHOR_COLUMNS = ('id', 'first_name', 'last_name', 'age', 'biography')
+BOOK_COLUMNS = ('id', 'title', 'isbn', 'pages', 'price', 'publication_year')
+LINK_COLUMNS = ('book_id', 'author_id')
+
+FORMATS = ('csv', 'ndjson')
+
+# Staging tables of an import, dropped when its transaction ends. ordinal numbers the rows in the order of the file
+_STAGE = 'CREATE TEMP TABLE IF NOT EXISTS {0}_stage (LIKE {0} INCLUDING DEFAULTS, ordinal bigserial) ON COMMIT DROP'
+
+# A changed row gets version + 1, so cached snapshots of it fail their version check. Unchanged rows are skipped.
+# Of the rows sharing a key the last one in the file wins. Returns the IDs of the inserted and changed rows
+_UPSERT = 'INSERT INTO {table} ({columns}) SELECT DISTINCT ON ({key}) {columns} FROM {table}_stage ' \
+          'ORDER BY {key}, ordinal DESC ' \
+          'ON CONFLICT (id) DO UPDATE SET {assignments}, version = {table}.version + 1, ' \
+          'updated_at = EXCLUDED.updated_at WHERE ({current}) IS DISTINCT FROM ({excluded}) RETURNING id'
+
+# Rows without an id (or with another one) take the id of the book that already has their ISBN, or else of the last
+# row with their ISBN in the file, the one the upsert keeps
+_MATCH_ISBN = 'WITH target AS (SELECT DISTINCT ON (s.isbn) s.isbn, COALESCE(b.id, s.id) AS id FROM book_stage s ' \
+              'LEFT JOIN book b ON b.isbn = s.isbn ORDER BY s.isbn, s.ordinal DESC), ' \
+              'moved AS (SELECT s.id AS staged, t.id AS existing FROM book_stage s JOIN target t ' \
+              'ON t.isbn = s.isbn AND t.id <> s.id) ' \
+              'UPDATE book_stage s SET id = moved.existing FROM moved WHERE s.id = moved.staged ' \
+              'RETURNING moved.staged, moved.existing'
+
+_LINK = 'INSERT INTO {table} ({columns}) SELECT DISTINCT {columns} FROM book_author_stage ' \
+        'ON CONFLICT DO NOTHING RETURNING {columns}'
+
+# A new link changes both aggregates
+_BUMP_VERSION = 'UPDATE {} SET version = version + 1, updated_at = $2 WHERE id = ANY($1::bigint[])'
+
+
+def _upsert(table: str, columns: Sequence[str], key: str) -> str:
+    values = [column for column in columns if column not in ('id', 'updated_at')]
+    return _UPSERT.format(table=table, columns=', '.join(columns), key=key,
+                          assignments=', '.join('{0} = EXCLUDED.{0}'.format(column) for column in values),
+                          current=', '.join('{}.{}'.format(table, column) for column in values),
+                          excluded=', '.join('EXCLUDED.{}'.format(column) for column in values))
+
+
+def _export_select(kind: str, fmt: str) -> Tuple[Select, Sequence[str]]:
+    author, book, book_author = AuthorEntity.__table__, BookEntity.__table__, BookAuthorEntity.__table__
+
+    if kind == 'author':
+        return select(*[author.c[name] for name in AUTHOR_COLUMNS]), ('id',)
+
+    if kind == 'book':
+        # NULL without authors, an empty csv field or a JSON null
+        authors = func.array_agg(aggregate_order_by(book_author.c.author_id, book_author.c.author_id)) \
+            .filter(book_author.c.author_id.isnot(None))
+        if fmt == 'csv':
+            authors = func.array_to_string(authors, ' ')
+
+        return select(*[book.c[name] for name in BOOK_COLUMNS], authors.label('authors')) \
+            .select_from(book.outerjoin(book_author)).group_by(book.c.id), ('id',)
+
+    if kind == 'book_author':
+        return select(*[book_author.c[name] for name in LINK_COLUMNS]), LINK_COLUMNS
+
+    raise ValueError('Unknown catalog table {}'.format(kind))
+
+
+def export_query(kind: str, fmt: str) -> str:
+    stmt, order = _export_select(kind, fmt)
+    if fmt == 'ndjson':
+        rows = stmt.subquery('r')
+        stmt = select(func.row_to_json(literal_column(rows.name))).select_from(rows) \
+            .order_by(*[rows.c[name] for name in order])
+    else:
+        stmt = stmt.order_by(*[stmt.selected_columns[name] for name in order])
+
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={'literal_binds': True}))
+
+
+class CatalogCopy:
+    """
+    Bulk loads and dumps the catalog tables with COPY on one asyncpg connection.
+
+    The caller owns the transaction. Rows come in already validated with their IDs allocated. They are copied
+    into a temporary staging table and merged from there, so a sync can run again over rows that exist: an
+    author or book is updated by id (a book by its ISBN first), links that exist are skipped. Links are
+    (book_id, author_id) pairs written to book_author and author_book together, so the two sides never disagree
+    the way they can while an AuthorAddedToBookDomainEvent waits in the outbox.
+
+    ``book_ids`` and ``author_ids`` collect the rows the merges inserted or changed, a new link changes its book.
+    """
+
+    def __init__(self, connection: asyncpg.Connection) -> None:
+        self._connection = connection
+        self.book_ids: Set[int] = set()
+        self.author_ids: Set[int] = set()
+
+    async def _stage(self, table: str, records: Sequence[tuple], columns: Sequence[str]) -> None:
+        await self._connection.execute(_STAGE.format(table))
+        await self._connection.execute('TRUNCATE {}_stage'.format(table))
+        await self._connection.copy_records_to_table('{}_stage'.format(table), records=records, columns=columns)
+
+    async def copy_authors(self, rows: Sequence[tuple]) -> None:
+        now = datetime.utcnow()
+        columns = AUTHOR_COLUMNS + ('updated_at',)
+        await self._stage(AuthorEntity.__tablename__, [row + (now,) for row in rows], columns)
+        changed = await self._connection.fetch(_upsert(AuthorEntity.__tablename__, columns, 'id'))
+        self.author_ids.update(row['id'] for row in changed)
+
+    # Returns the IDs the rows took from books of the same ISBN, {id of the row: id of the book}
+    async def copy_books(self, rows: Sequence[tuple]) -> Dict[int, int]:
+        now = datetime.utcnow()
+        columns = BOOK_COLUMNS + ('updated_at',)
+        await self._stage(BookEntity.__tablename__, [row + (now,) for row in rows], columns)
+
+        moved = dict(await self._connection.fetch(_MATCH_ISBN))
+        changed = await self._connection.fetch(_upsert(BookEntity.__tablename__, columns, 'isbn'))
+        self.book_ids.update(row['id'] for row in changed)
+        return moved
+
+    async def copy_links(self, links: Sequence[Tuple[int, int]]) -> None:
+        if not links:
+            return
+
+        await self._stage(BookAuthorEntity.__tablename__, links, LINK_COLUMNS)
+        added = await self._connection.fetch(_LINK.format(table=BookAuthorEntity.__tablename__,
+                                                          columns='book_id, author_id'))
+        mirrored = await self._connection.fetch(_LINK.format(table=AuthorBookEntity.__tablename__,
+                                                             columns='author_id, book_id'))
+
+        now = datetime.utcnow()
+        if added:
+            book_ids = {row['book_id'] for row in added}
+            await self._connection.execute(_BUMP_VERSION.format(BookEntity.__tablename__), list(book_ids), now)
+            self.book_ids.update(book_ids)
+        if mirrored:
+            await self._connection.execute(_BUMP_VERSION.format(AuthorEntity.__tablename__),
+                                           list({row['author_id'] for row in mirrored}), now)
+
+    # Streams the table to output chunk by chunk, returns the number of rows
+    async def export(self, kind: str, fmt: str, output: Callable[[bytes], Awaitable[None]]) -> int:
+        if fmt == 'csv':
+            status = await self._connection.copy_from_query(export_query(kind, fmt), output=output,
+                                                            format='csv', header=True)
+        else:
+            # One JSON document per line in COPY text format. JSON has no raw tabs or newlines, so the only escape
+            # in it is the doubled backslash. The server sends whole rows, a chunk never splits one
+            async def unescape(data: bytes) -> None:
+                await output(data.replace(b'\\\\', b'\\'))
+
+            status = await self._connection.copy_from_query(export_query(kind, fmt), output=unescape,
+                                                            format='text')
+
+        return int(status.split()[-1])
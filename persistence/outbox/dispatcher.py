@@ -0,0 +1,96 @@
+import asyncio
+import inspect
+
+from datetime import timedelta
+from loguru import logger
+from pydantic import BaseModel
+from pymfdata.rdb.connection import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, Dict, Optional, Tuple, Type
+
+from common.protocols.event import BaseEvent
+from persistence.outbox.repository import OutboxRepository
+
+
+class OutboxDispatcher:
+    """
+    Polls the outbox and runs the registered handler for every stored event.
+
+    ``handlers`` maps an event class name to a factory of its handler, so that every delivery gets a
+    fresh handler (and unit of work). A failed delivery is retried with exponential backoff.
+
+    A batch is claimed in a transaction of its own that moves the events ``lease`` seconds into the future, so
+    no row lock is held while the handlers run. Events of a dispatcher that died are delivered again once their
+    lease ran out, as are the ones of a batch that took longer; handlers must be idempotent either way.
+    """
+
+    def __init__(self, engine: AsyncEngine, handlers: Dict[str, Callable[[], BaseEvent]],
+                 batch_size: int = 100, poll_interval: float = 0.5, max_attempts: int = 5,
+                 lease: float = 60.0) -> None:
+        self._engine = engine
+        self._handlers: Dict[str, Tuple[Type[BaseModel], Callable[[], BaseEvent]]] = {}
+        for event_type, factory in handlers.items():
+            self.register(event_type, factory)
+
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.lease = lease
+
+        self._stopped = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, event_type: str, factory: Callable[[], BaseEvent]):
+        handler = factory()
+        param = inspect.signature(handler.handle).parameters['param'].annotation
+        if getattr(param, '__name__', None) != event_type:
+            raise TypeError("{} does not handle {}".format(type(handler).__name__, event_type))
+
+        self._handlers[event_type] = (param, factory)
+
+    async def dispatch(self) -> int:
+        async with AsyncSession(self._engine, expire_on_commit=False) as session:
+            repository = OutboxRepository(session)
+            events = await repository.claim(self.batch_size, timedelta(seconds=self.lease))
+            await session.commit()
+
+            done, retries = [], []
+            for event in events:
+                try:
+                    param, factory = self._handlers[event.event_type]
+                    # The payload was written from a validated event, replaying it skips validation
+                    await factory().handle(param.construct(**event.payload))
+                    done.append(event.id)
+                except Exception as ex:
+                    logger.warning("outbox event {} ({}) failed: {!r}".format(event.id, event.event_type, ex))
+                    retries.append((event, repr(ex)))
+
+            for event, error in retries:
+                await repository.retry(event, error=error, failed=event.attempts + 1 >= self.max_attempts,
+                                       delay=timedelta(seconds=min(2 ** event.attempts, 60)))
+            await repository.complete(done)
+            await session.commit()
+
+        return len(events)
+
+    async def run(self):
+        while not self._stopped.is_set():
+            try:
+                if await self.dispatch() == self.batch_size:
+                    continue
+            except Exception as ex:
+                logger.exception(ex)
+
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        self._stopped.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        self._stopped.set()
+        if self._task:
+            await self._task
@@ -0,0 +1,22 @@
+from datetime import datetime
+from pymfdata.rdb.mapper import Base
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, JSON, String, Text
+from typing import Optional, Union
+
+
+class OutboxEntity(Base):
+    __tablename__ = 'outbox'
+
+    id: Union[int, Column] = Column(BigInteger, primary_key=True)
+    event_type: Union[str, Column] = Column(String(100), nullable=False)
+    payload: Union[dict, Column] = Column(JSON, nullable=False)
+    attempts: Union[int, Column] = Column(Integer, nullable=False, default=0)
+    available_at: Union[datetime, Column] = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # Set once every retry failed, the row is kept for inspection
+    failed_at: Union[Optional[datetime], Column] = Column(DateTime, nullable=True)
+    error: Union[Optional[str], Column] = Column(Text, nullable=True)
+
+    __table_args__ = (
+        Index('ix_outbox_pending', 'available_at', postgresql_where=failed_at.is_(None)),
+    )
@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta
+from pydantic import BaseModel
+from pymfdata.rdb.repository import AsyncSession, BaseAsyncRepository
+from sqlalchemy import delete, insert, select, update
+from typing import List
+
+from core import snowflake
+from persistence.outbox.entity import OutboxEntity
+
+
+class OutboxRepository(BaseAsyncRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    # Written with the aggregate change, so the event is stored only if the transaction commits
+    async def put(self, event: BaseModel):
+        await self.session.execute(insert(OutboxEntity.__table__).values(
+            id=snowflake.allocator().next_id(), event_type=type(event).__name__, payload=event.dict(),
+            attempts=0, available_at=datetime.utcnow()
+        ))
+
+    # Other dispatchers skip the locked rows, and once committed the leased ones until the lease runs out
+    async def claim(self, limit: int, lease: timedelta) -> List[OutboxEntity]:
+        now = datetime.utcnow()
+        stmt = select(OutboxEntity) \
+            .where(OutboxEntity.failed_at.is_(None), OutboxEntity.available_at <= now) \
+            .order_by(OutboxEntity.id).limit(limit) \
+            .with_for_update(skip_locked=True)
+
+        events = (await self.session.execute(stmt)).scalars().all()
+        if events:
+            await self.session.execute(update(OutboxEntity).where(OutboxEntity.id.in_([e.id for e in events]))
+                                       .values(available_at=now + lease))
+        return events
+
+    async def complete(self, ids: List[int]):
+        if ids:
+            await self.session.execute(delete(OutboxEntity).where(OutboxEntity.id.in_(ids)))
+
+    async def retry(self, entity: OutboxEntity, error: str, delay: timedelta, failed: bool):
+        now = datetime.utcnow()
+        await self.session.execute(update(OutboxEntity).where(OutboxEntity.id == entity.id).values(
+            attempts=entity.attempts + 1, available_at=now + delay, error=error, failed_at=now if failed else None
+        ))
@@ -0,0 +1,40 @@
+from functools import lru_cache
+from pymfdata.rdb.repository import AsyncSession, BaseAsyncRepository
+from sqlalchemy import Table, bindparam, select
+from sqlalchemy.sql import Select
+from typing import Any, List, Sequence
+
+from core.etag import Version
+from core.sqlalchemy import any_of_param
+
+
+@lru_cache(maxsize=None)
+def _fetch_by_ids(table: Table, dialect: str) -> Select:
+    return select(table.c.id, table.c.version, table.c.updated_at).where(any_of_param(table.c.id, 'ids', dialect))
+
+
+@lru_cache(maxsize=None)
+def _fetch_by(table: Table, column: str) -> Select:
+    return select(table.c.id, table.c.version, table.c.updated_at) \
+        .where(table.c[column] == bindparam('value')).order_by(table.c.id)
+
+
+class VersionRepository(BaseAsyncRepository):
+    """
+    id, version and updated_at of aggregates, read from their table without loading the aggregates or DTOs.
+    """
+
+    def __init__(self, session: AsyncSession, table: Table) -> None:
+        self._session = session
+        self._table = table
+
+    # In the order of ids, None where a row is missing
+    async def fetch_by_ids(self, ids: Sequence[int]) -> List[Version]:
+        stmt = _fetch_by_ids(self._table, self.session.bind.dialect.name)
+        versions = {row.id: tuple(row) for row in await self.session.execute(stmt, {'ids': list(ids)})}
+        return [versions.get(_id) for _id in ids]
+
+    # Ordered by id, like the query repositories return the rows
+    async def fetch_by(self, column: str, value: Any) -> List[Version]:
+        result = await self.session.execute(_fetch_by(self._table, column), {'value': value})
+        return [tuple(row) for row in result]